@@ -1,10 +1,30 @@
+import importlib
+
 from .engine import AudioEngine
-from .effects.gain import GainEffect
-from .effects.distortion import DistortionEffect
-from .effects.echo import EchoEffect
+
+# restul exporturilor sunt importate la prima accesare (trag numpy dupa ele)
+_LAZY_EXPORTS = {
+	"ProcessEngine": ".process_engine",
+	"SessionBatchEngine": ".batch.session_engine",
+	"GainEffect": ".effects.gain",
+	"DistortionEffect": ".effects.distortion",
+	"EchoEffect": ".effects.echo",
+}
+
+
+def __getattr__(name):
+	module = _LAZY_EXPORTS.get(name)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(importlib.import_module(module, __name__), name)
+	globals()[name] = value
+	return value
+
 
 __all__ = [
 	"AudioEngine",
+	"ProcessEngine",
+	"SessionBatchEngine",
 	"GainEffect",
 	"DistortionEffect",
 	"EchoEffect",
@@ -0,0 +1,196 @@
+import threading
+import numpy as np
+
+
+class Analyzer:
+    """
+    Baza pentru analizoare abonate la AnalysisBus
+    __call__ e apelat pe thread-ul bus-ului, value() din GUI (ex. cu after())
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __call__(self, block: np.ndarray):
+        raise NotImplementedError()
+
+    def value(self):
+        raise NotImplementedError()
+
+    def reset(self):
+        pass
+
+
+class PeakAnalyzer(Analyzer):
+    """Varf absolut per canal, acumulat de la ultima citire"""
+
+    def __init__(self):
+        super().__init__()
+        self._peak = None
+
+    def __call__(self, block: np.ndarray):
+        if block.size == 0:
+            return
+        if block.ndim == 1:
+            block = block[:, None]
+        peak = np.max(np.abs(block), axis=0)
+        with self._lock:
+            if self._peak is None or self._peak.shape != peak.shape:
+                self._peak = peak
+            else:
+                np.maximum(self._peak, peak, out=self._peak)
+
+    def value(self, reset: bool = True) -> np.ndarray:
+        with self._lock:
+            peak = self._peak
+            if reset:
+                self._peak = None
+        if peak is None:
+            return np.zeros(0, dtype=np.float32)
+        return peak
+
+    def reset(self):
+        with self._lock:
+            self._peak = None
+
+
+class RmsAnalyzer(Analyzer):
+    """RMS per canal, mediat exponential cu constanta de timp window_ms"""
+
+    def __init__(self, samplerate: int = 44100, window_ms: float = 300.0):
+        super().__init__()
+        self.samplerate = samplerate
+        self.window_ms = float(window_ms)
+        self._mean_square = None
+
+    def __call__(self, block: np.ndarray):
+        if block.size == 0:
+            return
+        if block.ndim == 1:
+            block = block[:, None]
+        ms = np.mean(np.square(block, dtype=np.float32), axis=0)
+        # coeficient de netezire pentru un bloc de lungimea data
+        tau = max(1.0, self.window_ms * self.samplerate / 1000.0)
+        alpha = float(np.exp(-block.shape[0] / tau))
+        with self._lock:
+            if self._mean_square is None or self._mean_square.shape != ms.shape:
+                self._mean_square = ms
+            else:
+                self._mean_square = alpha * self._mean_square + (1.0 - alpha) * ms
+
+    def value(self) -> np.ndarray:
+        with self._lock:
+            ms = self._mean_square
+        if ms is None:
+            return np.zeros(0, dtype=np.float32)
+        return np.sqrt(ms)
+
+    def reset(self):
+        with self._lock:
+            self._mean_square = None
+
+
+class SpectrumAnalyzer(Analyzer):
+    """
+    Spectru (dB) al ultimelor fft_size sample-uri, mixat mono si
+    decimat in `bands` benzi logaritmice
+    decimate: calculeaza FFT doar la fiecare al n-lea bloc
+
+    """
+
+    def __init__(
+        self,
+        samplerate: int = 44100,
+        fft_size: int = 2048,
+        bands: int = 32,
+        decimate: int = 1,
+        min_freq: float = 30.0,
+    ):
+        super().__init__()
+        if fft_size <= 0 or bands <= 0 or decimate <= 0:
+            raise ValueError()
+        self.samplerate = samplerate
+        self.fft_size = int(fft_size)
+        self.bands = int(bands)
+        self.decimate = int(decimate)
+        self.min_freq = float(min_freq)
+
+        self._history = np.zeros(self.fft_size, dtype=np.float32)
+        self._window = np.hanning(self.fft_size).astype(np.float32)
+        self._edges_cache = {}
+        self._counter = 0
+        self._spectrum = np.full(self.bands, -120.0, dtype=np.float32)
+
+    def _band_edges(self, samplerate: int) -> np.ndarray:
+        # indecsii bin-urilor la care incep benzile, calculati o data per samplerate
+        edges = self._edges_cache.get(samplerate)
+        if edges is None:
+            bins = self.fft_size // 2 + 1
+            freqs = np.geomspace(self.min_freq, samplerate / 2.0, self.bands + 1)[:-1]
+            edges = np.clip((freqs * self.fft_size / samplerate).astype(np.int64), 1, bins - 1)
+            edges = np.maximum.accumulate(edges)
+            self._edges_cache[samplerate] = edges
+        return edges
+
+    def __call__(self, block: np.ndarray):
+        if block.size == 0:
+            return
+        mono = block if block.ndim == 1 else block.mean(axis=1)
+        n = min(mono.shape[0], self.fft_size)
+        self._history = np.roll(self._history, -n)
+        self._history[-n:] = mono[-n:]
+
+        self._counter += 1
+        if self._counter % self.decimate:
+            return
+
+        mag = np.abs(np.fft.rfft(self._history * self._window))
+        bands = np.maximum.reduceat(mag, self._band_edges(self.samplerate))
+        db = 20.0 * np.log10(bands * (2.0 / self._window.sum()) + 1e-9)
+        with self._lock:
+            self._spectrum = db.astype(np.float32)
+
+    def value(self) -> np.ndarray:
+        with self._lock:
+            return self._spectrum.copy()
+
+    def reset(self):
+        with self._lock:
+            self._history[:] = 0.0
+            self._spectrum[:] = -120.0
+
+
+class ClipCounter(Analyzer):
+    """Numara sample-urile cu |x| >= threshold, per canal"""
+
+    def __init__(self, threshold: float = 1.0):
+        super().__init__()
+        self.threshold = float(threshold)
+        self._counts = None
+
+    def __call__(self, block: np.ndarray):
+        if block.size == 0:
+            return
+        if block.ndim == 1:
+            block = block[:, None]
+        counts = np.count_nonzero(np.abs(block) >= self.threshold, axis=0)
+        with self._lock:
+            if self._counts is None or self._counts.shape != counts.shape:
+                self._counts = counts
+            else:
+                self._counts += counts
+
+    def value(self) -> int:
+        with self._lock:
+            return 0 if self._counts is None else int(self._counts.sum())
+
+    def per_channel(self) -> np.ndarray:
+        with self._lock:
+            if self._counts is None:
+                return np.zeros(0, dtype=np.int64)
+            return self._counts.copy()
+
+    def reset(self):
+        with self._lock:
+            self._counts = None
@@ -0,0 +1,113 @@
+import collections
+import threading
+
+
+class AnalysisBus:
+    """
+    Bus publish/subscribe pentru blocurile procesate de engine
+    Engine-ul doar pune o copie a blocului intr-o coada limitata (drop-oldest),
+    abonatii sunt apelati pe un thread separat
+    Un abonat lent nu incetineste bucla audio, blocurile pierdute sunt numarate
+
+    """
+
+    def __init__(self, max_blocks: int = 32):
+        """
+            max_blocks: Numar maxim de blocuri tinute in coada
+        """
+        if max_blocks <= 0:
+            raise ValueError("max_blocks must be > 0")
+
+        self._queue = collections.deque(maxlen=max_blocks)
+        self._subscribers = []
+
+        self._lock = threading.Lock()
+        self._data_available = threading.Condition(self._lock)
+        self._thread = None
+        self._running = False
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def subscribe(self, callback):
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    def publish(self, block):
+        """
+        Apelat din bucla audio. Nu blocheaza niciodata:
+        daca coada e plina cel mai vechi bloc e aruncat
+        """
+        if not self._subscribers:
+            return
+
+        block = block.copy()
+        with self._lock:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(block)
+            self.published += 1
+            self._data_available.notify()
+
+        if not self._running:
+            self.start()
+
+    def start(self):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="AnalysisBus", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0):
+        with self._lock:
+            self._running = False
+            self._queue.clear()
+            self._data_available.notify_all()
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "published": self.published,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "pending": len(self._queue),
+            }
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while self._running and not self._queue:
+                    self._data_available.wait()
+                if not self._running:
+                    return
+                block = self._queue.popleft()
+                subscribers = list(self._subscribers)
+
+            for callback in subscribers:
+                try:
+                    callback(block)
+                except Exception:
+                    with self._lock:
+                        self.errors += 1
+
+            with self._lock:
+                self.delivered += 1
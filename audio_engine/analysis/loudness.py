@@ -0,0 +1,164 @@
+import numpy as np
+
+from .analyzers import Analyzer
+from ..effects.eq import SosFilter
+
+
+# ITU-R BS.1770: ferestre de 400 ms cu overlap 75%, calculate din pasi de 100 ms
+HOP_SECONDS = 0.1
+GATE_HOPS = 4
+SHORT_TERM_HOPS = 30
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+
+
+def k_weighting(samplerate: int) -> np.ndarray:
+    """
+    Filtrul K (BS.1770) ca 2 sectiuni sos: shelf de +4 dB peste ~1.7 kHz si
+    high-pass la ~38 Hz; la 48 kHz coeficientii sunt exact cei din standard
+    Parametrii analogici si forma shelf-ului sunt cei care reproduc standardul
+    (formula RBJ din eq.py nu il reproduce)
+    """
+    # shelf
+    k = np.tan(np.pi * 1681.974450955533 / samplerate)
+    q = 0.7071752369554196
+    vh = 10.0 ** (3.999843853973347 / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = [(vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0,
+             1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+
+    # high-pass (numaratorul nenormalizat, ca in standard)
+    k = np.tan(np.pi * 38.13547087602444 / samplerate)
+    q = 0.5003270373238773
+    a0 = 1.0 + k / q + k * k
+    highpass = [1.0, -2.0, 1.0, 1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+
+    return np.array([shelf, highpass])
+
+
+def channel_weights(channels: int) -> np.ndarray:
+    """
+    Ponderile canalelor (ordinea L, R, C, LFE, Ls, Rs): surround 1.41, LFE exclus
+    """
+    weights = np.ones(channels)
+    if channels == 5:
+        weights[3:] = 1.41
+    elif channels == 6:
+        weights[3] = 0.0
+        weights[4:] = 1.41
+    return weights
+
+
+def _lufs(power):
+    with np.errstate(divide="ignore"):
+        return -0.691 + 10.0 * np.log10(power)
+
+
+class LoudnessMeter(Analyzer):
+    """
+    Loudness integrat (LUFS, BS.1770 / EBU R128), momentary (400 ms) si short-term (3 s)
+
+    Fiecare bloc e filtrat K (SosFilter, fara bucla per sample) si redus la energia
+    ponderata pe pasi de 100 ms; gating-ul absolut (-70 LUFS) si relativ (-10 LU)
+    e calculat vectorial doar la citire, deci costul per bloc e doar filtrul
+    Pentru o masuratoare exacta (fara blocurile aruncate de un bus aglomerat):
+    engine.start(on_chunk=meter)
+    """
+
+    def __init__(self, samplerate: int = 48000, weights=None):
+        """
+            samplerate: Rata blocurilor masurate
+            weights: Ponderile canalelor (implicit channel_weights(canale))
+        """
+        super().__init__()
+        self.samplerate = samplerate
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+        self._filter = SosFilter(k_weighting(samplerate))
+        self._hop = max(1, int(round(HOP_SECONDS * samplerate)))
+        self._hops = np.zeros(1024)
+        self._count = 0
+        self._partial = 0.0
+        self._partial_frames = 0
+
+    def __call__(self, block: np.ndarray):
+        if block.size == 0:
+            return
+        if block.ndim == 1:
+            block = block[:, None]
+        channels = block.shape[1]
+        weights = self.weights if self.weights is not None else channel_weights(channels)
+        if weights.shape[0] != channels:
+            raise ValueError(f"Expected {weights.shape[0]} channels, got {channels}")
+
+        y = self._filter.process(block.T)
+        power = weights @ (y * y)
+
+        with self._lock:
+            # intai se completeaza pasul inceput in blocul anterior
+            need = self._hop - self._partial_frames
+            head = power[:need]
+            self._partial += head.sum()
+            self._partial_frames += head.shape[0]
+            if self._partial_frames < self._hop:
+                return
+            sums = [np.array([self._partial])]
+
+            rest = power[need:]
+            full = rest.shape[0] - rest.shape[0] % self._hop
+            sums.append(rest[:full].reshape(-1, self._hop).sum(axis=1))
+            tail = rest[full:]
+            self._partial = tail.sum()
+            self._partial_frames = tail.shape[0]
+            self._append(np.concatenate(sums) / self._hop)
+
+    def _append(self, values):
+        end = self._count + values.shape[0]
+        if end > self._hops.shape[0]:
+            grown = np.zeros(max(end, 2 * self._hops.shape[0]))
+            grown[:self._count] = self._hops[:self._count]
+            self._hops = grown
+        self._hops[self._count:end] = values
+        self._count = end
+
+    def _window(self, hops: int) -> float:
+        with self._lock:
+            if self._count < hops:
+                return float("-inf")
+            return float(_lufs(self._hops[self._count - hops:self._count].mean()))
+
+    def momentary(self) -> float:
+        return self._window(GATE_HOPS)
+
+    def short_term(self) -> float:
+        return self._window(SHORT_TERM_HOPS)
+
+    def integrated(self) -> float:
+        with self._lock:
+            hops = self._hops[:self._count].copy()
+        if hops.shape[0] < GATE_HOPS:
+            return float("-inf")
+
+        # energia ferestrelor de 400 ms (pas 100 ms) din sume cumulative
+        cumulative = np.concatenate(([0.0], np.cumsum(hops)))
+        blocks = (cumulative[GATE_HOPS:] - cumulative[:-GATE_HOPS]) / GATE_HOPS
+        blocks = blocks[_lufs(blocks) > ABSOLUTE_GATE]
+        if blocks.size == 0:
+            return float("-inf")
+        threshold = _lufs(blocks.mean()) + RELATIVE_GATE
+        blocks = blocks[_lufs(blocks) > threshold]
+        return float(_lufs(blocks.mean()))
+
+    def value(self) -> float:
+        return self.integrated()
+
+    def duration(self) -> float:
+        with self._lock:
+            return self._count * self._hop / self.samplerate
+
+    def reset(self):
+        with self._lock:
+            self._filter.reset()
+            self._count = 0
+            self._partial = 0.0
+            self._partial_frames = 0
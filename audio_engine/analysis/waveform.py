@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import numpy as np
+
+
+PEAKS_VERSION = 1
+SIDECAR_SUFFIX = ".peaks.npz"
+
+# frame-uri per valoare min/max pe nivelul cel mai fin
+BASE_FRAMES = 256
+# valori din nivelul anterior grupate in una
+LEVEL_FACTOR = 4
+# nivelurile se opresc sub atatea valori
+MIN_LEVEL_SIZE = 64
+# frame-uri citite odata din fisier (multiplu de BASE_FRAMES)
+READ_FRAMES = 1 << 20
+
+
+def sidecar_path(path: str, cache_dir: str | None = None) -> str:
+    """
+    Fisierul cache al piramidei: langa fisierul audio sau, cu cache_dir,
+    intr-un director comun (numele include un hash al caii absolute)
+    """
+    if cache_dir is None:
+        return path + SIDECAR_SUFFIX
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(path)}.{digest}{SIDECAR_SUFFIX}")
+
+
+def _file_key(path: str) -> dict:
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def _reduce(values: np.ndarray, factor: int, op) -> np.ndarray:
+    # ultimul grup incomplet e completat cu ultima valoare (nu schimba min/max)
+    count = -(-values.shape[0] // factor)
+    pad = count * factor - values.shape[0]
+    if pad:
+        values = np.concatenate((values, np.repeat(values[-1:], pad, axis=0)))
+    return op(values.reshape(count, factor, values.shape[1]), axis=1)
+
+
+class WaveformPeaks:
+    """
+    Piramida min/max a unui fisier audio, pentru desenarea formei de unda la orice zoom
+
+    Nivelul 0 tine min/max pe grupuri de `base` frame-uri, fiecare nivel urmator
+    grupeaza cate `factor` valori din cel anterior (float16, per canal)
+    view() alege nivelul cu cel putin o valoare per pixel, deci redesenarea nu mai
+    citeste fisierul audio, indiferent de durata lui
+    """
+
+    def __init__(self, mins: list, maxs: list, samplerate: int, frames: int,
+                 base: int = BASE_FRAMES, factor: int = LEVEL_FACTOR):
+        self.mins = mins
+        self.maxs = maxs
+        self.samplerate = samplerate
+        self.frames = frames
+        self.base = base
+        self.factor = factor
+
+    @property
+    def channels(self) -> int:
+        return self.mins[0].shape[1]
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate
+
+    @classmethod
+    def from_file(cls, path: str, base: int = BASE_FRAMES, factor: int = LEVEL_FACTOR,
+                  read_frames: int = READ_FRAMES, progress=None, should_stop=None):
+        """
+        Calculeaza piramida citind fisierul in blocuri de read_frames (memorie constanta
+        pentru citire, in afara piramidei)
+            progress: apelat cu fractiunea citita (0..1) dupa fiecare bloc
+            should_stop: returneaza True pentru a abandona (rezultat None)
+        """
+        import soundfile as sf
+
+        read_frames = max(base, read_frames // base * base)
+        with sf.SoundFile(path) as f:
+            samplerate, channels, total = f.samplerate, f.channels, f.frames
+            count = max(1, -(-total // base))
+            mins = np.zeros((count, channels), dtype=np.float16)
+            maxs = np.zeros((count, channels), dtype=np.float16)
+            # PCM 16 e citit nativ: conversia la float din libsndfile costa mai mult decat min/max
+            if f.subtype == "PCM_16":
+                block = np.empty((read_frames, channels), dtype=np.int16)
+                scale = np.float32(1.0 / 32768.0)
+            else:
+                block = np.empty((read_frames, channels), dtype=np.float32)
+                scale = np.float32(1.0)
+
+            index = 0
+            frames = 0
+            while True:
+                if should_stop is not None and should_stop():
+                    return None
+                data = f.read(out=block)
+                n = data.shape[0]
+                if n == 0:
+                    break
+                # doar ultimul bloc poate avea un grup incomplet
+                full = n // base
+                partial = 1 if n % base else 0
+                if index + full + partial > mins.shape[0]:
+                    raise ValueError(f"{path}: more frames than reported ({total})")
+                # reducerea pe ultima axa (contigua) e de ~10x mai rapida decat pe cea din mijloc
+                groups = np.ascontiguousarray(data[:full * base].T).reshape(channels, full, base)
+                mins[index:index + full] = groups.min(axis=2).T * scale
+                maxs[index:index + full] = groups.max(axis=2).T * scale
+                if partial:
+                    mins[index + full] = data[full * base:].min(axis=0) * scale
+                    maxs[index + full] = data[full * base:].max(axis=0) * scale
+                index += full + partial
+                frames += n
+                if progress is not None:
+                    progress(frames / total if total else 1.0)
+
+        levels_min = [mins[:max(index, 1)]]
+        levels_max = [maxs[:max(index, 1)]]
+        while levels_min[-1].shape[0] > MIN_LEVEL_SIZE:
+            levels_min.append(_reduce(levels_min[-1], factor, np.min))
+            levels_max.append(_reduce(levels_max[-1], factor, np.max))
+        return cls(levels_min, levels_max, samplerate, frames, base, factor)
+
+    def view(self, start: int, end: int, width: int):
+        """
+        (mins, maxs) pe `width` coloane pentru frame-urile [start, end), float32 (width, channels)
+        """
+        start = min(max(0, int(start)), self.frames)
+        end = min(max(start + 1, int(end)), max(self.frames, start + 1))
+        width = max(1, int(width))
+
+        # nivelul cel mai grosier care are inca cel putin o valoare per coloana
+        level = 0
+        per_column = (end - start) / width
+        while level + 1 < len(self.mins) and self.base * self.factor ** (level + 1) <= per_column:
+            level += 1
+        size = self.base * self.factor ** level
+        mins, maxs = self.mins[level], self.maxs[level]
+
+        first = min(start // size, mins.shape[0] - 1)
+        last = min(max(first + 1, -(-end // size)), mins.shape[0])
+        # zoom peste rezolutia nivelului 0: coloane vecine repeta aceeasi valoare
+        edges = first + np.arange(width) * (last - first) // width
+        return (np.minimum.reduceat(mins[:last], edges, axis=0).astype(np.float32),
+                np.maximum.reduceat(maxs[:last], edges, axis=0).astype(np.float32))
+
+    def save(self, sidecar: str, path: str):
+        """
+        Salveaza atomic piramida (npz necomprimat), cu cheia fisierului audio sursa
+        """
+        meta = dict(_file_key(path), version=PEAKS_VERSION, samplerate=self.samplerate,
+                    frames=self.frames, base=self.base, factor=self.factor)
+        arrays = {"meta": np.array(json.dumps(meta))}
+        for idx, (mins, maxs) in enumerate(zip(self.mins, self.maxs)):
+            arrays[f"min{idx}"] = mins
+            arrays[f"max{idx}"] = maxs
+
+        tmp_path = f"{sidecar}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, sidecar)
+
+    @classmethod
+    def load(cls, sidecar: str, path: str):
+        """
+        Piramida din sidecar, sau None daca lipseste ori fisierul audio s-a schimbat
+        (cale, dimensiune sau mtime diferite)
+        """
+        try:
+            with np.load(sidecar, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                key = _file_key(path)
+                if meta.get("version") != PEAKS_VERSION or any(meta.get(k) != v for k, v in key.items()):
+                    return None
+                levels = sum(1 for name in data.files if name.startswith("min"))
+                mins = [data[f"min{idx}"] for idx in range(levels)]
+                maxs = [data[f"max{idx}"] for idx in range(levels)]
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(mins, maxs, meta["samplerate"], meta["frames"], meta["base"], meta["factor"])
+
+
+def waveform_peaks(path: str, cache_dir: str | None = None, progress=None, should_stop=None):
+    """
+    Piramida unui fisier audio: din sidecar daca e valid, altfel calculata si salvata
+    Daca sidecar-ul nu poate fi scris (director read-only) piramida e doar returnata
+    """
+    sidecar = sidecar_path(path, cache_dir)
+    peaks = WaveformPeaks.load(sidecar, path)
+    if peaks is not None:
+        return peaks
+
+    peaks = WaveformPeaks.from_file(path, progress=progress, should_stop=should_stop)
+    if peaks is not None:
+        try:
+            if cache_dir is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+            peaks.save(sidecar, path)
+        except OSError:
+            pass
+    return peaks
@@ -0,0 +1,217 @@
+import numpy as np
+
+from ..effects.gain import GainEffect
+from ..effects.echo import EchoEffect
+from ..effects.distortion import DistortionEffect
+from ..effects.tremolo import TremoloEffect
+
+
+class BatchedEffect:
+    """
+    Efect aplicat o singura data pe toate sesiunile
+    buffer: (sessions, frames, channels), parametrii sunt vectori (sessions,)
+
+    Parametrii unei sesiuni noi trec prin constructorul efectului normal,
+    deci au aceleasi valori default si aceeasi validare
+    """
+
+    effect_cls = None
+
+    def __init__(self, channels: int):
+        self.channels = channels
+        self._params = {name: np.empty(0, dtype=np.float64) for name in self.effect_cls().params()}
+
+    def __len__(self):
+        return len(next(iter(self._params.values()), ()))
+
+    def add_session(self, **params):
+        values = self.effect_cls(**params).params()
+        for name, value in values.items():
+            self._params[name] = np.append(self._params[name], float(value))
+
+    def remove_session(self, index: int):
+        for name in self._params:
+            self._params[name] = np.delete(self._params[name], index)
+
+    def set_param(self, index: int, name: str, value):
+        if name not in self._params:
+            raise KeyError(f"Unknown parameter: {name}")
+        current = {key: vec[index] for key, vec in self._params.items()}
+        current[name] = value
+        for key, val in self.effect_cls(**current).params().items():
+            self._params[key][index] = float(val)
+
+    def params(self, index: int) -> dict:
+        return {name: float(vec[index]) for name, vec in self._params.items()}
+
+    def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class BatchedGain(BatchedEffect):
+    effect_cls = GainEffect
+
+    def apply(self, buffer, samplerate):
+        lin = (10.0 ** (self._params["gain_db"] / 20.0)).astype(np.float32)
+        return buffer * lin[:, None, None]
+
+
+class BatchedDistortion(BatchedEffect):
+    effect_cls = DistortionEffect
+
+    def apply(self, buffer, samplerate):
+        intensity = np.maximum(0.0, self._params["intensity"])
+        mix = np.clip(self._params["mix"], 0.0, 1.0).astype(np.float32)[:, None, None]
+        pre_gain = ((intensity + 1.0) ** 2).astype(np.float32)
+        comp = np.maximum(0.25, 1.0 / pre_gain).astype(np.float32)
+
+        x = np.nan_to_num(buffer)
+        driven = np.tanh(np.clip(x * pre_gain[:, None, None], -8.0, 8.0))
+        wet = driven * comp[:, None, None]
+        out = x * (1.0 - mix) + wet * mix
+        return out
+
+
+class BatchedTremolo(BatchedEffect):
+    effect_cls = TremoloEffect
+
+    def __init__(self, channels: int):
+        super().__init__(channels)
+        self._phase = np.empty(0, dtype=np.float64)
+
+    def add_session(self, **params):
+        super().add_session(**params)
+        self._phase = np.append(self._phase, 0.0)
+
+    def remove_session(self, index: int):
+        super().remove_session(index)
+        self._phase = np.delete(self._phase, index)
+
+    def apply(self, buffer, samplerate):
+        frames = buffer.shape[1]
+        depth = self._params["depth"][:, None]
+        inc = 2 * np.pi * self._params["rate_hz"] / samplerate
+
+        phase = self._phase[:, None] + inc[:, None] * np.arange(frames)
+        osc = (1.0 - depth) + depth * (0.5 * (1.0 + np.sin(phase)))
+        self._phase = (self._phase + inc * frames) % (2 * np.pi)
+        return buffer * osc.astype(np.float32)[:, :, None]
+
+
+class BatchedEcho(BatchedEffect):
+    """
+    Ecou pe toate sesiunile fara bucla per sample
+    w[n] = x[n] + feedback * w[n - d], out[n] = x[n] + w[n - d]
+
+    Blocul e procesat in bucati de cel mult min(d) frame-uri: in interiorul unei
+    bucati toate valorile w[n - d] sunt deja in istoric, deci fiecare bucata e
+    doar un gather + doua operatii vectoriale pe toate sesiunile
+    """
+
+    effect_cls = EchoEffect
+
+    def __init__(self, channels: int):
+        super().__init__(channels)
+        self._history = np.zeros((0, 1, channels), dtype=np.float32)
+        self._time = 0
+
+    def add_session(self, **params):
+        super().add_session(**params)
+        row = np.zeros((1,) + self._history.shape[1:], dtype=np.float32)
+        self._history = np.concatenate((self._history, row), axis=0)
+
+    def remove_session(self, index: int):
+        super().remove_session(index)
+        self._history = np.delete(self._history, index, axis=0)
+
+    def _resize(self, length: int):
+        # pastreaza ultimele sample-uri la pozitiile lor pe timeline-ul comun
+        old = self._history
+        old_len = old.shape[1]
+        new = np.zeros((old.shape[0], length, self.channels), dtype=np.float32)
+        keep = min(old_len, length)
+        times = np.arange(self._time - keep, self._time)
+        new[:, times % length] = old[:, times % old_len]
+        self._history = new
+
+    def apply(self, buffer, samplerate):
+        sessions, frames, _ = buffer.shape
+        if sessions == 0:
+            return buffer
+
+        delays = np.maximum(1, (self._params["delay_ms"] * samplerate / 1000.0).astype(np.int64))
+        feedback = self._params["feedback"].astype(np.float32)[:, None, None]
+
+        length = int(delays.max())
+        if self._history.shape[1] != length:
+            self._resize(length)
+
+        history = self._history
+        rows = np.arange(sessions)[:, None]
+        step = int(delays.min())
+        out = np.empty_like(buffer, dtype=np.float32)
+
+        for start in range(0, frames, step):
+            end = min(frames, start + step)
+            offsets = np.arange(end - start)
+            read_idx = (self._time - delays[:, None] + offsets) % length
+            write_idx = (self._time + offsets) % length
+
+            x = buffer[:, start:end]
+            delayed = history[rows, read_idx]
+            out[:, start:end] = x + delayed
+            history[:, write_idx] = x + delayed * feedback
+            self._time += end - start
+
+        return out
+
+
+class PerSessionEffect(BatchedEffect):
+    """
+    Fallback pentru efectele fara implementare vectorizata (ex. reverb):
+    o instanta normala per sesiune, aplicata pe rand
+    """
+
+    def __init__(self, effect_cls, channels: int):
+        self.effect_cls = effect_cls
+        self.channels = channels
+        self._instances = []
+
+    def __len__(self):
+        return len(self._instances)
+
+    def add_session(self, **params):
+        self._instances.append(self.effect_cls(**params))
+
+    def remove_session(self, index: int):
+        self._instances.pop(index)
+
+    def set_param(self, index: int, name: str, value):
+        instance = self._instances[index]
+        if name not in instance.params():
+            raise KeyError(f"Unknown parameter: {name}")
+        setattr(instance, name, value)
+
+    def params(self, index: int) -> dict:
+        return self._instances[index].params()
+
+    def apply(self, buffer, samplerate):
+        out = np.empty_like(buffer, dtype=np.float32)
+        for idx, instance in enumerate(self._instances):
+            out[idx] = instance.apply(buffer[idx], samplerate)
+        return out
+
+
+BATCHED_EFFECTS = {
+    GainEffect: BatchedGain,
+    DistortionEffect: BatchedDistortion,
+    TremoloEffect: BatchedTremolo,
+    EchoEffect: BatchedEcho,
+}
+
+
+def make_batched(effect_cls, channels: int) -> BatchedEffect:
+    batched_cls = BATCHED_EFFECTS.get(effect_cls)
+    if batched_cls is None:
+        return PerSessionEffect(effect_cls, channels)
+    return batched_cls(channels)
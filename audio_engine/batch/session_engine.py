@@ -0,0 +1,109 @@
+import itertools
+import numpy as np
+
+from ..effects.effect import Effect
+from ..effects.registry import EffectRegistry
+from .effects import make_batched
+
+
+class SessionBatchEngine:
+    """
+    Proceseaza N sesiuni cu acelasi tip de lant intr-un singur pas per bloc
+    Blocurile sesiunilor sunt stivuite pe o axa in plus: (sessions, frames, channels),
+    fiecare efect ruleaza o data pe tot batch-ul cu parametri si stare per sesiune
+
+    Sesiunile pot intra/iesi intre blocuri (add_session / remove_session)
+
+    example:
+        batch = SessionBatchEngine(["gain", "echo"], samplerate=48000)
+        sid = batch.add_session({0: {"gain_db": -6.0}, 1: {"delay_ms": 250.0}})
+        out = batch.process_sessions({sid: block})[sid]
+    """
+
+    def __init__(self, chain, samplerate: int = 48000, channels: int = 1, blocksize: int = 1024, registry=None):
+        if samplerate <= 0 or channels <= 0 or blocksize <= 0:
+            raise ValueError()
+
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+
+        self._registry = registry if registry is not None else EffectRegistry()
+
+        self._effects = [make_batched(self._resolve(item), channels) for item in chain]
+        self._ids = []
+        self._next_id = itertools.count()
+
+    def _resolve(self, item):
+        if isinstance(item, str):
+            cls = self._registry.get(item.lower())
+            if not cls:
+                raise KeyError(f"Unknown effect: {item}")
+            return cls
+        if isinstance(item, type) and issubclass(item, Effect):
+            return item
+        raise TypeError()
+
+    #SESSIONS
+    # params: {index_efect: {parametru: valoare}}
+    def add_session(self, params: dict | None = None) -> int:
+        params = params or {}
+        session_id = next(self._next_id)
+        for idx, eff in enumerate(self._effects):
+            eff.add_session(**params.get(idx, {}))
+        self._ids.append(session_id)
+        return session_id
+
+    def remove_session(self, session_id: int):
+        index = self._index(session_id)
+        for eff in self._effects:
+            eff.remove_session(index)
+        self._ids.pop(index)
+
+    def set_param(self, session_id: int, effect_index: int, name: str, value):
+        self._effects[effect_index].set_param(self._index(session_id), name, value)
+
+    def get_params(self, session_id: int) -> list:
+        index = self._index(session_id)
+        return [eff.params(index) for eff in self._effects]
+
+    def sessions(self) -> list:
+        return list(self._ids)
+
+    def _index(self, session_id: int) -> int:
+        try:
+            return self._ids.index(session_id)
+        except ValueError:
+            raise KeyError(f"Unknown session: {session_id}") from None
+
+    #PROCESSING
+    # buffer: (sessions, frames, channels), sesiunile in ordinea din sessions()
+    def process(self, buffer: np.ndarray) -> np.ndarray:
+        if buffer.ndim == 2:
+            buffer = buffer[:, :, None]
+        if buffer.shape[0] != len(self._ids):
+            raise ValueError(f"Expected {len(self._ids)} sessions, got {buffer.shape[0]}")
+        if buffer.shape[2] != self.channels:
+            raise ValueError(f"Channel mismatch: got {buffer.shape[2]}, expected {self.channels}")
+
+        x = buffer.astype(np.float32, copy=False)
+        if x.size == 0:
+            return x
+        for eff in self._effects:
+            x = eff.apply(x, self.samplerate)
+        # efectele nu mai taie semnalul individual; o singura limitare la iesire
+        return np.clip(x, -1.0, 1.0)
+
+    # blocks: {session_id: (frames, channels)}; sesiunile lipsa primesc liniste
+    # ca sa le avanseze starea la fel ca pe celelalte
+    def process_sessions(self, blocks: dict) -> dict:
+        frames = max((np.shape(b)[0] for b in blocks.values()), default=self.blocksize)
+        stacked = np.zeros((len(self._ids), frames, self.channels), dtype=np.float32)
+        for session_id, block in blocks.items():
+            block = np.asarray(block, dtype=np.float32)
+            if block.ndim == 1:
+                block = block[:, None]
+            stacked[self._index(session_id), :block.shape[0]] = block
+
+        out = self.process(stacked)
+        return {session_id: out[idx] for idx, session_id in enumerate(self._ids)}
@@ -0,0 +1,44 @@
+import numpy
+from .consumer import Consumer
+
+
+class ArrayConsumer(Consumer):
+	"""
+	Consumator in memorie
+	Cu `out` dat scrie direct in array-ul caller-ului (ce nu incape e ignorat),
+	altfel aduna blocurile si le concateneaza in result()
+	"""
+
+	def __init__(self, channels: int, out: numpy.ndarray | None = None):
+		if out is not None and (out.ndim != 2 or out.shape[1] != channels):
+			raise ValueError(f"out must have shape (frames, {channels})")
+		self.channels = channels
+		self._out = out
+		self._pos = 0
+		self._blocks = []
+
+	def write(self, buffer: numpy.ndarray):
+		if buffer.size == 0:
+			return
+
+		if buffer.ndim == 1:
+			buffer = buffer[:, None]
+
+		if self._out is None:
+			self._blocks.append(buffer.copy())
+			return
+
+		n = min(buffer.shape[0], self._out.shape[0] - self._pos)
+		if n > 0:
+			self._out[self._pos:self._pos + n] = buffer[:n]
+			self._pos += n
+
+	def result(self) -> numpy.ndarray:
+		if self._out is not None:
+			return self._out[:self._pos]
+		if not self._blocks:
+			return numpy.empty((0, self.channels), dtype=numpy.float32)
+		return numpy.concatenate(self._blocks, axis=0)
+
+	def close(self):
+		pass
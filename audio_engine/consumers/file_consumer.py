@@ -4,8 +4,18 @@ from .consumer import Consumer
 
 
 class FileConsumer(Consumer):
-	def __init__(self, filename: str, samplerate: int, channels: int):
-		self.sound_file = soundfile.SoundFile(filename, mode='w', samplerate=samplerate, channels=channels, subtype='PCM_16')
+	# resume_frames: continua un fisier existent de la acest frame (resume dupa checkpoint),
+	# tot ce e dupa el e taiat
+	def __init__(self, filename: str, samplerate: int, channels: int, resume_frames: int | None = None):
+		if resume_frames is None:
+			self.sound_file = soundfile.SoundFile(filename, mode='w', samplerate=samplerate, channels=channels, subtype='PCM_16')
+		else:
+			self.sound_file = soundfile.SoundFile(filename, mode='r+')
+			if self.sound_file.frames < resume_frames:
+				self.sound_file.close()
+				raise ValueError(f"Output file has {self.sound_file.frames} frames, checkpoint expects {resume_frames}")
+			self.sound_file.seek(resume_frames)
+			self.sound_file.truncate(resume_frames)
 
 	def write(self, buffer: numpy.ndarray):
 		if buffer.size == 0:
@@ -16,5 +26,8 @@ class FileConsumer(Consumer):
 		
 		self.sound_file.write(buffer)
 
+	def flush(self):
+		self.sound_file.flush()
+
 	def close(self):
 		self.sound_file.close()
@@ -4,10 +4,18 @@ from .consumer import Consumer
 
 
 class LiveConsumer(Consumer):
-	def __init__(self, samplerate: int = 44100, channels: int = 1, blocksize: int = 1024, device=None):
+	# pool (StreamPool): stream-ul e luat din / returnat in pool in loc sa fie deschis / inchis
+	def __init__(self, samplerate: int = 44100, channels: int = 1, blocksize: int = 1024, device=None, pool=None):
 		self.samplerate = samplerate
 		self.channels = channels
 		self._blocksize = blocksize
+		# blocuri dupa care device-ul a ramas fara date (xrun)
+		self.underflows = 0
+		self._pool = pool
+		if pool is not None:
+			self._stream = pool.output_stream(samplerate=self.samplerate, channels=self.channels,
+											  blocksize=self._blocksize, device=device)
+			return
 		self._stream = sd.OutputStream(samplerate=self.samplerate,
 										channels=self.channels,
 										blocksize=self._blocksize,
@@ -21,9 +29,26 @@ class LiveConsumer(Consumer):
 		if buffer.ndim == 1:
 			buffer = buffer[:, None]
 		
-		self._stream.write(buffer)
+		if self._stream.write(buffer):
+			self.underflows += 1
+	
+	def stats(self) -> dict:
+		return {"underflows": self.underflows}
+
+	# pauza: ce e deja in buffer-ul device-ului e redat, apoi stream-ul tace (ramane deschis)
+	def pause(self):
+		try:
+			self._stream.stop()
+		except Exception:
+			pass
+	
+	def resume(self):
+		self._stream.start()
 
 	def close(self):
+		if self._pool is not None:
+			self._pool.release(self._stream)
+			return
 		try:
 			self._stream.stop()
 			self._stream.close()
@@ -0,0 +1,95 @@
+import socket
+import numpy
+from .consumer import Consumer
+from ..utils.net_frame import MAX_UDP_PAYLOAD, FLAG_EOS, pack_header, encode_frames
+
+
+class NetworkConsumer(Consumer):
+	"""
+	Trimite audio prin TCP sau UDP catre un NetworkSource
+	Grupeaza `batch_blocks` blocuri intr-un singur pachet (un header, un send)
+	"""
+
+	def __init__(
+		self,
+		host: str = "127.0.0.1",
+		port: int = 0,
+		protocol: str = "tcp",
+		samplerate: int = 44100,
+		channels: int = 1,
+		batch_blocks: int = 4,
+	):
+		protocol = protocol.lower()
+		if protocol not in ("tcp", "udp"):
+			raise ValueError(f"Unknown protocol: {protocol}")
+		if batch_blocks <= 0:
+			raise ValueError("batch_blocks must be > 0")
+
+		self.samplerate = samplerate
+		self.channels = channels
+		self.protocol = protocol
+		self._batch_blocks = batch_blocks
+		self._address = (host, port)
+
+		self._pending = []
+		self._pending_frames = 0
+		self._max_frames = MAX_UDP_PAYLOAD // (4 * channels) if protocol == "udp" else None
+		self._seq = 0
+		self.sent = 0
+
+		if protocol == "tcp":
+			self._sock = socket.create_connection(self._address)
+			self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		else:
+			self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+			self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+
+	def write(self, buffer: numpy.ndarray):
+		if buffer.size == 0:
+			return
+
+		if buffer.ndim == 1:
+			buffer = buffer[:, None]
+
+		# un datagram UDP are dimensiune limitata
+		if self._max_frames is not None:
+			while buffer.shape[0] > self._max_frames:
+				self._append(buffer[:self._max_frames])
+				buffer = buffer[self._max_frames:]
+		self._append(buffer)
+
+	def flush(self):
+		if not self._pending:
+			return
+		payload = encode_frames(self._pending)
+		header = pack_header(self.channels, len(self._pending), self.samplerate, self._pending_frames, self._seq)
+		self._send(header + payload)
+		self._seq += 1
+		self.sent += 1
+		self._pending = []
+		self._pending_frames = 0
+
+	def close(self):
+		try:
+			self.flush()
+			self._send(pack_header(self.channels, 0, self.samplerate, 0, self._seq, flags=FLAG_EOS))
+		except OSError:
+			pass
+		finally:
+			self._sock.close()
+
+	#INTERNAL
+	def _append(self, block: numpy.ndarray):
+		if self._max_frames is not None and self._pending_frames + block.shape[0] > self._max_frames:
+			self.flush()
+		# copie: blocul poate fi refolosit de engine dupa write()
+		self._pending.append(numpy.array(block, dtype=numpy.float32))
+		self._pending_frames += block.shape[0]
+		if len(self._pending) >= self._batch_blocks:
+			self.flush()
+
+	def _send(self, packet: bytes):
+		if self.protocol == "tcp":
+			self._sock.sendall(packet)
+		else:
+			self._sock.sendto(packet, self._address)
@@ -1,9 +1,12 @@
 import numpy as np
-from .effect import Effect
+from .effect import Effect, frame_values
 
 
 class DistortionEffect(Effect):
 
+    supports_planar = True
+    sample_params = ("mix",)
+
     def __init__(
         self,
         intensity: float = 5.0,
@@ -15,7 +18,7 @@ class DistortionEffect(Effect):
     def _check_params(self) -> None:
         # valideaza parametrii la runtime
         self.intensity = float(max(0.0, self.intensity))
-        self.mix = float(np.clip(self.mix, 0.0, 1.0))
+        self.mix = np.clip(self.mix, 0.0, 1.0) if np.ndim(self.mix) else float(np.clip(self.mix, 0.0, 1.0))
 
     def _db_to_lin(self, db: float) -> float:
         return float(10.0 ** (db / 20.0))
@@ -24,11 +27,20 @@ class DistortionEffect(Effect):
         if buffer.size == 0:
             return buffer
 
-        self._check_params()
-
         x = buffer.astype(np.float32, copy=False)
         if x.ndim == 1:
             x = x[:, None]
+        return self._process(x, planar=False)
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        return self._process(buffer.astype(np.float32, copy=False), planar=True)
+
+    # element cu element: layout-ul conteaza doar pentru mix-ul automatizat (per frame)
+    def _process(self, x: np.ndarray, planar: bool) -> np.ndarray:
+        self._check_params()
+
         x = np.nan_to_num(x, copy=False)
 
         dry = x
@@ -45,8 +57,15 @@ class DistortionEffect(Effect):
         wet = driven * comp
 
         # blend dry/wet
-        out = dry * (1.0 - self.mix) + wet * self.mix
-        return np.clip(out, -1.0, 1.0)
+        mix = frame_values(self.mix, planar)
+        out = dry * (1.0 - mix) + wet * mix
+        return out
+
+    def memory_frames(self, samplerate: int) -> int:
+        return 0
+
+    def is_idle(self, threshold: float) -> bool:
+        return True
 
     def params(self) -> dict:
         return {
@@ -1,8 +1,16 @@
 import numpy as np
-from .effect import Effect
+from .effect import Effect, TAIL_THRESHOLD
 
 
 class EchoEffect(Effect):
+    """
+    Ecou cu feedback, procesat pe bucati de cel mult `delay` frame-uri:
+    in interiorul unei bucati linia de delay nu citeste nimic din ce scrie,
+    deci fiecare bucata e o singura operatie numpy (fara bucla per sample)
+    Linia de delay e stocata planar (channels, delay)
+    """
+
+    supports_planar = True
 
     def __init__(self, delay_ms: float = 400.0, feedback: float = 0.35):
         self.delay_ms = float(delay_ms)
@@ -19,22 +27,76 @@ class EchoEffect(Effect):
         if x.ndim == 1:
             x = x[:, None]
 
+        out = np.empty_like(x, dtype=np.float32) # creaza o variabila ca buffer ( x ) dar goala cu valori neinitializate practic random ( garbage din memorie) pt ca e mai rapid
+        self._process(x.T, out.T, samplerate)
+        return out
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        x = buffer.astype(np.float32, copy=False)
+        out = np.empty_like(x, dtype=np.float32)
+        self._process(x, out, samplerate)
+        return out
+
+    # x, out: (channels, frames), eventual view-uri transpuse
+    def _process(self, x: np.ndarray, out: np.ndarray, samplerate: int) -> None:
         # conversie delay ms in cate samples avem nevoie
         delay_samples = max(1, int(self.delay_ms * samplerate / 1000.0))
         # aloca buffer
-        if self._buffer is None or self._buffer.shape != (delay_samples, x.shape[1]):
-            self._buffer = np.zeros((delay_samples, x.shape[1]), dtype=np.float32)
+        if self._buffer is None or self._buffer.shape != (x.shape[0], delay_samples):
+            self._buffer = np.zeros((x.shape[0], delay_samples), dtype=np.float32)
             self._pos = 0
 
-        out = np.empty_like(x, dtype=np.float32) # creaza o variabila ca buffer ( x ) dar goala cu valori neinitializate practic random ( garbage din memorie) pt ca e mai rapid
-        # amestecam semnalul original cu cel intarziat
-        for i in range(x.shape[0]):
-            delayed = self._buffer[self._pos]
-            out[i] = x[i] + delayed
-            self._buffer[self._pos] = x[i] + delayed * self.feedback
-            self._pos = (self._pos + 1) % delay_samples
-
-        return np.clip(out, -1.0, 1.0)
+        # amestecam semnalul original cu cel intarziat, pana la capatul buffer-ului circular
+        frames = x.shape[1]
+        i = 0
+        while i < frames:
+            n = min(frames - i, delay_samples - self._pos)
+            delayed = self._buffer[:, self._pos:self._pos + n]
+            segment = x[:, i:i + n]
+            out[:, i:i + n] = segment + delayed
+            self._buffer[:, self._pos:self._pos + n] = segment + delayed * self.feedback
+            self._pos = (self._pos + n) % delay_samples
+            i += n
 
     def params(self) -> dict:
         return {"delay_ms": self.delay_ms, "feedback": self.feedback}
+
+    def memory_frames(self, samplerate: int) -> int:
+        return self.tail_frames(samplerate)
+
+    def is_idle(self, threshold: float) -> bool:
+        if self._buffer is None:
+            return True
+        if self._buffer.max() >= threshold or self._buffer.min() <= -threshold:
+            return False
+        self._buffer[:] = 0.0
+        return True
+
+    def reset(self) -> None:
+        if self._buffer is not None:
+            self._buffer[:] = 0.0
+        self._pos = 0
+
+    def get_state(self) -> dict:
+        if self._buffer is None:
+            return {}
+        # in checkpoint linia de delay ramane (delay, channels)
+        return {"buffer": self._buffer.T.copy(), "pos": np.array(self._pos)}
+
+    def set_state(self, state: dict) -> None:
+        if "buffer" not in state:
+            self._buffer = None
+            self._pos = 0
+            return
+        self._buffer = np.ascontiguousarray(np.array(state["buffer"], dtype=np.float32).T)
+        self._pos = int(state["pos"])
+
+    def tail_frames(self, samplerate: int) -> int:
+        delay_samples = max(1, int(self.delay_ms * samplerate / 1000.0))
+        # cate repetitii pana cand feedback^k scade sub prag
+        repeats = 1
+        if self.feedback > 0.0:
+            repeats += int(np.ceil(np.log(TAIL_THRESHOLD) / np.log(self.feedback)))
+        return delay_samples * repeats
@@ -7,13 +7,79 @@ Clasa abstracta pentru efecte
 
 """
 
+# nivelul sub care coada unui efect e considerata stinsa (-80 dB)
+TAIL_THRESHOLD = 1e-4
+
+
+# valoarea unui parametru automatizat, gata de inmultit cu un buffer: float daca e
+# constanta, altfel array per frame - (frames, 1) interleaved sau (frames,) planar
+def frame_values(value, planar: bool = False):
+	if numpy.ndim(value) == 0:
+		return float(value)
+	value = numpy.asarray(value, dtype=numpy.float32)
+	return value if planar else value[:, None]
+
+
 class Effect(ABC):
 
+	# True daca efectul lucreaza direct pe buffere planare (channels, frames) in
+	# apply_planar; in modul planar engine-ul transpune doar la trecerea intre
+	# un efect planar si unul care accepta doar (frames, channels)
+	supports_planar = False
+
+	# parametrii care accepta la automatizare un array cu cate o valoare per frame
+	# (de lungimea blocului); ceilalti primesc o valoare per bloc
+	sample_params = ()
+
 	@abstractmethod
 	def apply(self, buffer: numpy.ndarray, samplerate: int) -> numpy.ndarray:
 		raise NotImplementedError()
 
+	# acelasi efect pe un buffer (channels, frames); implicit prin apply()
+	def apply_planar(self, buffer: numpy.ndarray, samplerate: int) -> numpy.ndarray:
+		return numpy.ascontiguousarray(self.apply(buffer.T, samplerate).T)
+
 	@abstractmethod
 	def params(self) -> dict:
 		raise NotImplementedError()
 
+	# cate frame-uri mai produce efectul dupa ce input-ul devine liniste
+	# (ecou, reverb); 0 pentru efecte fara memorie
+	def tail_frames(self, samplerate: int) -> int:
+		return 0
+
+	# cu cate frame-uri e intarziata iesirea fata de intrare (lookahead, STFT);
+	# engine-ul o compenseaza la input-urile offline, iar tail_frames trebuie sa o includa
+	def latency_frames(self, samplerate: int) -> int:
+		return 0
+
+	# cat de departe in trecut influenteaza input-ul iesirea (frame-uri), adica
+	# cat pre-roll trebuie ca starea sa convearga pana sub TAIL_THRESHOLD
+	# None = memorie nedeclarata/infinita (render-ul pe segmente ramane serial)
+	def memory_frames(self, samplerate: int) -> int | None:
+		return None
+
+	# True daca, pe input de liniste, efectul ar produce tot liniste (starea interna
+	# e sub `threshold`), deci poate fi sarit; efectele cu stare isi golesc aici
+	# resturile de semnal (inclusiv valorile aproape denormale)
+	# False implicit: un efect necunoscut nu e niciodata sarit
+	def is_idle(self, threshold: float) -> bool:
+		return False
+
+	# apelat in locul lui apply() cand efectul e sarit pe un bloc de liniste,
+	# pentru efectele care au un timp intern (ex. faza unui LFO)
+	def advance(self, frames: int, samplerate: int) -> None:
+		pass
+
+	# aduce efectul la starea initiala (buffer-ele sunt golite, nu realocate)
+	def reset(self) -> None:
+		pass
+
+	# starea interna ca dict nume -> array (copii), pentru checkpoint/resume
+	# efectele fara stare returneaza {}
+	def get_state(self) -> dict:
+		return {}
+
+	def set_state(self, state: dict) -> None:
+		pass
+
@@ -0,0 +1,277 @@
+import numpy as np
+from .effect import Effect, TAIL_THRESHOLD
+
+
+BAND_TYPES = ("peak", "lowshelf", "highshelf", "lowpass", "highpass")
+
+# frame-uri per bloc in evaluarea matriceala a recursiei
+SOS_BLOCK = 64
+
+
+def biquad_coefficients(kind: str, freq: float, gain_db: float, q: float, samplerate: int) -> np.ndarray:
+    """
+    Coeficientii unei sectiuni biquad (formulele RBJ "Audio EQ Cookbook")
+    returneaza [b0, b1, b2, 1, a1, a2] normalizat la a0 (formatul sos)
+    """
+    amp = 10.0 ** (gain_db / 40.0)
+    w0 = 2.0 * np.pi * freq / samplerate
+    cos_w = np.cos(w0)
+    alpha = np.sin(w0) / (2.0 * q)
+    root = 2.0 * np.sqrt(amp) * alpha
+
+    if kind == "peak":
+        b = [1.0 + alpha * amp, -2.0 * cos_w, 1.0 - alpha * amp]
+        a = [1.0 + alpha / amp, -2.0 * cos_w, 1.0 - alpha / amp]
+    elif kind == "lowshelf":
+        b = [amp * ((amp + 1) - (amp - 1) * cos_w + root),
+             2.0 * amp * ((amp - 1) - (amp + 1) * cos_w),
+             amp * ((amp + 1) - (amp - 1) * cos_w - root)]
+        a = [(amp + 1) + (amp - 1) * cos_w + root,
+             -2.0 * ((amp - 1) + (amp + 1) * cos_w),
+             (amp + 1) + (amp - 1) * cos_w - root]
+    elif kind == "highshelf":
+        b = [amp * ((amp + 1) + (amp - 1) * cos_w + root),
+             -2.0 * amp * ((amp - 1) + (amp + 1) * cos_w),
+             amp * ((amp + 1) + (amp - 1) * cos_w - root)]
+        a = [(amp + 1) - (amp - 1) * cos_w + root,
+             2.0 * ((amp - 1) - (amp + 1) * cos_w),
+             (amp + 1) - (amp - 1) * cos_w - root]
+    elif kind == "lowpass":
+        b = [(1.0 - cos_w) / 2.0, 1.0 - cos_w, (1.0 - cos_w) / 2.0]
+        a = [1.0 + alpha, -2.0 * cos_w, 1.0 - alpha]
+    elif kind == "highpass":
+        b = [(1.0 + cos_w) / 2.0, -(1.0 + cos_w), (1.0 + cos_w) / 2.0]
+        a = [1.0 + alpha, -2.0 * cos_w, 1.0 - alpha]
+    else:
+        raise ValueError(f"Unknown band type: {kind} (expected one of {', '.join(BAND_TYPES)})")
+
+    return np.array([b[0], b[1], b[2], a[0], a[1], a[2]]) / a[0]
+
+
+def sos_state_space(sos: np.ndarray):
+    """
+    Cascada de sectiuni (transposed direct form II) ca un singur sistem
+    s' = A s + B x, y = C s + D x, cu 2 stari per sectiune
+    """
+    A = np.zeros((0, 0))
+    B = np.zeros(0)
+    C = np.zeros(0)
+    D = 1.0
+    for b0, b1, b2, _, a1, a2 in np.asarray(sos, dtype=np.float64):
+        a_sec = np.array([[-a1, 1.0], [-a2, 0.0]])
+        b_sec = np.array([b1 - a1 * b0, b2 - a2 * b0])
+        c_sec = np.array([1.0, 0.0])
+        # in serie: intrarea sectiunii e iesirea cascadei de pana acum
+        size = A.shape[0]
+        A = np.block([[A, np.zeros((size, 2))], [np.outer(b_sec, C), a_sec]])
+        B = np.concatenate((B, b_sec * D))
+        C = np.concatenate((b0 * C, c_sec))
+        D = b0 * D
+    return A, B, C, D
+
+
+class SosFilter:
+    """
+    Cascada de biquad-uri cu stare per canal intre blocuri, fara bucla per sample
+
+    Pe blocuri de `block` frame-uri recursia e exacta si pur matriceala:
+        y = H x + O s      (H: raspunsul la impuls, Toeplitz; O: raspunsul la stare)
+        s' = A^block s + K x
+    toate blocurile unui buffer sunt calculate odata, doar starea e propagata in bucla
+    Calculele sunt in float64 (polii de joasa frecventa sunt aproape de cercul unitate)
+    """
+
+    def __init__(self, sos, block: int = SOS_BLOCK):
+        self.sos = np.asarray(sos, dtype=np.float64).reshape(-1, 6)
+        self.block = block
+        self.state = None
+
+        A, B, C, D = sos_state_space(self.sos)
+        self.order = A.shape[0]
+
+        # O[k] = C A^k, P[k] = A^k B, powers[k] = A^k pentru k = 0..block
+        powers = np.empty((block + 1, self.order, self.order))
+        powers[0] = np.eye(self.order)
+        for k in range(1, block + 1):
+            powers[k] = powers[k - 1] @ A
+        observe = np.einsum("j,kjl->kl", C, powers[:block])
+        impulse_states = powers[:block] @ B
+
+        h = np.concatenate(([D], impulse_states[:block - 1] @ C))
+        lags = np.arange(block)[:, None] - np.arange(block)[None, :]
+        toeplitz = np.where(lags >= 0, h[np.maximum(lags, 0)], 0.0)
+
+        self._powers = powers
+        self._h_t = toeplitz.T.copy()
+        self._o_t = observe.T.copy()
+        # starea la finalul blocului pentru un impuls la pozitia k: A^(block-1-k) B
+        self._k_t = impulse_states[::-1].copy()
+        self._step_t = powers[block].T.copy()
+
+    def _check_state(self, channels: int):
+        if self.state is None or self.state.shape[0] != channels:
+            self.state = np.zeros((channels, self.order))
+
+    # x: (channels, frames); returneaza float64 (channels, frames)
+    def process(self, x: np.ndarray) -> np.ndarray:
+        channels, frames = x.shape
+        self._check_state(channels)
+        x = x.astype(np.float64)
+        out = np.empty((channels, frames))
+        block = self.block
+
+        full = frames - frames % block
+        if full:
+            count = full // block
+            blocks = x[:, :full].reshape(channels, count, block)
+            y = blocks @ self._h_t
+            inputs = blocks @ self._k_t
+
+            starts = np.empty((channels, count, self.order))
+            state = self.state
+            for idx in range(count):
+                starts[:, idx] = state
+                state = state @ self._step_t + inputs[:, idx]
+            self.state = state
+
+            y += starts @ self._o_t
+            out[:, :full] = y.reshape(channels, full)
+
+        rest = frames - full
+        if rest:
+            tail = x[:, full:]
+            out[:, full:] = tail @ self._h_t[:rest, :rest] + self.state @ self._o_t[:, :rest]
+            self.state = self.state @ self._powers[rest].T + tail @ self._k_t[block - rest:]
+        return out
+
+    # cate frame-uri pana cand cel mai lent pol scade sub TAIL_THRESHOLD
+    def decay_frames(self, limit: int) -> int:
+        if self.order == 0:
+            return 0
+        radius = float(np.abs(np.linalg.eigvals(self._powers[1])).max())
+        if radius >= 1.0:
+            return limit
+        if radius == 0.0:
+            return self.order
+        return int(min(limit, np.ceil(np.log(TAIL_THRESHOLD) / np.log(radius)) + self.order))
+
+    def reset(self):
+        if self.state is not None:
+            self.state[:] = 0.0
+
+
+class EqEffect(Effect):
+    """
+    EQ parametric: cascada de biquad-uri, cate una per banda
+    bands: lista de dict-uri {"type", "freq", "gain_db", "q"}, type din BAND_TYPES
+    Coeficientii sunt recalculati doar cand benzile (sau samplerate-ul) se schimba;
+    benzile peak / shelf cu 0 dB nu modifica semnalul si sunt sarite
+    """
+
+    supports_planar = True
+
+    def __init__(self, bands: list | None = None):
+        if bands is None:
+            bands = [
+                {"type": "lowshelf", "freq": 100.0, "gain_db": 0.0, "q": 0.707},
+                {"type": "peak", "freq": 1000.0, "gain_db": 0.0, "q": 1.0},
+                {"type": "highshelf", "freq": 8000.0, "gain_db": 0.0, "q": 0.707},
+            ]
+        self.bands = [dict(band) for band in bands]
+
+        self._key = None
+        self._snapshot = None
+        self._filter = None
+        # stare din set_state(), pusa in filtru cand e construit (e nevoie de samplerate)
+        self._restored = None
+
+    # benzile validate, ca tuple (type, freq, gain_db, q)
+    def _band_key(self, samplerate: int) -> tuple:
+        key = []
+        for band in self.bands:
+            kind = str(band.get("type", "peak")).lower()
+            if kind not in BAND_TYPES:
+                raise ValueError(f"Unknown band type: {kind} (expected one of {', '.join(BAND_TYPES)})")
+            freq = float(min(max(float(band.get("freq", 1000.0)), 10.0), 0.49 * samplerate))
+            gain_db = float(band.get("gain_db", 0.0))
+            q = float(max(0.05, band.get("q", 0.707)))
+            key.append((kind, freq, gain_db, q))
+        return (samplerate, tuple(key))
+
+    def _get_filter(self, samplerate: int) -> SosFilter:
+        # drumul obisnuit: benzile nu s-au schimbat de la ultimul bloc
+        if self._filter is not None and self._snapshot == (samplerate, self.bands):
+            return self._filter
+
+        key = self._band_key(samplerate)
+        self._snapshot = (samplerate, [dict(band) for band in self.bands])
+        if key != self._key:
+            sos = [
+                biquad_coefficients(kind, freq, gain_db, q, samplerate)
+                for kind, freq, gain_db, q in key[1]
+                if kind in ("lowpass", "highpass") or gain_db != 0.0
+            ]
+            previous = self._filter
+            self._filter = SosFilter(np.array(sos).reshape(-1, 6))
+            # aceleasi sectiuni active: starea ramane (fara click la schimbarea unui gain)
+            if self._restored is not None:
+                self._filter.state = self._restored
+            elif previous is not None and previous.order == self._filter.order:
+                self._filter.state = previous.state
+            self._restored = None
+            self._key = key
+        return self._filter
+
+    def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+
+        x = buffer.astype(np.float32, copy=False)
+        if x.ndim == 1:
+            x = x[:, None]
+        return np.ascontiguousarray(self._process(x.T, samplerate).T)
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        return self._process(buffer.astype(np.float32, copy=False), samplerate)
+
+    # x: (channels, frames)
+    def _process(self, x: np.ndarray, samplerate: int) -> np.ndarray:
+        sos_filter = self._get_filter(samplerate)
+        if sos_filter.order == 0:
+            return x
+        return sos_filter.process(x).astype(np.float32)
+
+    def tail_frames(self, samplerate: int) -> int:
+        return self._get_filter(samplerate).decay_frames(limit=10 * samplerate)
+
+    def memory_frames(self, samplerate: int) -> int:
+        return self.tail_frames(samplerate)
+
+    def is_idle(self, threshold: float) -> bool:
+        if self._filter is None or self._filter.state is None:
+            return self._restored is None
+        state = self._filter.state
+        if state.size and (state.max() >= threshold or state.min() <= -threshold):
+            return False
+        state[:] = 0.0
+        return True
+
+    def reset(self) -> None:
+        if self._filter is not None:
+            self._filter.reset()
+
+    def get_state(self) -> dict:
+        if self._filter is None or self._filter.state is None:
+            return {} if self._restored is None else {"state": self._restored.copy()}
+        return {"state": self._filter.state.copy()}
+
+    def set_state(self, state: dict) -> None:
+        self._key = None
+        self._snapshot = None
+        self._filter = None
+        self._restored = np.array(state["state"], dtype=np.float64) if "state" in state else None
+
+    def params(self) -> dict:
+        return {"bands": [dict(band) for band in self.bands]}
@@ -1,21 +1,37 @@
-from .effect import Effect
+from .effect import Effect, frame_values
 import numpy as np
 
 
 class GainEffect(Effect):
 
+    supports_planar = True
+    sample_params = ("gain_db",)
+
     def __init__(self, gain_db: float = 0.0):
         self.gain_db = float(gain_db)
 
-    # conversie db in factor linear
-    def _lin(self) -> float:
-        return float(10.0 ** (self.gain_db / 20.0))
+    # conversie db in factor linear (gain_db poate fi un array per frame la automatizare)
+    def _lin(self, planar: bool = False):
+        return frame_values(10.0 ** (np.asarray(self.gain_db, dtype=np.float64) / 20.0), planar)
 
     def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
         if buffer.size == 0:
             return buffer
         x = buffer.astype(np.float32, copy=False)
+        if np.ndim(self.gain_db) and x.ndim == 1:
+            x = x[:, None]
         return x * self._lin()
 
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        return buffer.astype(np.float32, copy=False) * self._lin(planar=True)
+
+    def memory_frames(self, samplerate: int) -> int:
+        return 0
+
+    def is_idle(self, threshold: float) -> bool:
+        return True
+
     def params(self) -> dict:
         return {"gain_db": self.gain_db}
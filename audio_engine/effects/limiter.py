@@ -0,0 +1,189 @@
+import numpy as np
+from .effect import Effect, TAIL_THRESHOLD
+
+
+def _sliding_min(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    out[i] = min(x[i:i + window]) in O(n) (van Herk / Gil-Werman):
+    minime prefix si sufix pe blocuri de `window`, combinate doua cate doua
+    """
+    count = x.shape[0] - window + 1
+    pad = (-x.shape[0]) % window
+    blocks = np.concatenate((x, np.full(pad, np.inf))).reshape(-1, window)
+    prefix = np.minimum.accumulate(blocks, axis=1).ravel()
+    suffix = np.minimum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.minimum(suffix[:count], prefix[window - 1:window - 1 + count])
+
+
+class LimiterEffect(Effect):
+    """
+    Limiter cu lookahead, vectorizat pe tot blocul (fara bucla per sample)
+    Etapa de iesire a engine-ului: inlocuieste np.clip-ul de la finalul fiecarui efect
+
+    Pentru fiecare frame (canale legate) castigul necesar e ceiling / peak;
+    minimul lui pe fereastra de lookahead, cu release exponential si apoi
+    mediat pe aceeasi fereastra, nu depaseste niciodata castigul necesar al
+    frame-ului intarziat, deci iesirea ramane sub ceiling fara clipping
+    Latenta: lookahead (window - 1 frame-uri)
+    """
+
+    supports_planar = True
+
+    def __init__(self, ceiling_db: float = -0.1, lookahead_ms: float = 1.5, release_ms: float = 50.0):
+        self.ceiling_db = float(ceiling_db)
+        self.lookahead_ms = float(lookahead_ms)
+        self.release_ms = float(release_ms)
+
+        self._window = None
+        self._delay = None
+        self._gain_history = None
+        self._smooth_history = None
+        self._reduction = 0.0
+
+    def _check_params(self) -> None:
+        self.ceiling_db = float(min(0.0, self.ceiling_db))
+        self.lookahead_ms = float(max(0.0, self.lookahead_ms))
+        self.release_ms = float(max(0.1, self.release_ms))
+
+    def _window_frames(self, samplerate: int) -> int:
+        return max(1, int(round(self.lookahead_ms * samplerate / 1000.0)) + 1)
+
+    def _allocate(self, window: int, channels: int):
+        self._window = window
+        self._delay = np.zeros((channels, window - 1), dtype=np.float32)
+        self._gain_history = np.ones(window - 1)
+        self._smooth_history = np.ones(window - 1)
+        self._reduction = 0.0
+
+    def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+
+        x = buffer.astype(np.float32, copy=False)
+        if x.ndim == 1:
+            x = x[:, None]
+
+        out = np.empty_like(x, dtype=np.float32)
+        self._process(x.T, out.T, samplerate)
+        return out
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        x = buffer.astype(np.float32, copy=False)
+        out = np.empty_like(x, dtype=np.float32)
+        self._process(x, out, samplerate)
+        return out
+
+    # x, out: (channels, frames), eventual view-uri transpuse
+    def _process(self, x: np.ndarray, out: np.ndarray, samplerate: int) -> None:
+        self._check_params()
+
+        window = self._window_frames(samplerate)
+        if self._delay is None or self._window != window or self._delay.shape[0] != x.shape[0]:
+            self._allocate(window, x.shape[0])
+
+        frames = x.shape[1]
+        ceiling = 10.0 ** (self.ceiling_db / 20.0)
+
+        # castigul necesar per frame (NaN ignorat); max pe canale cu cate o
+        # operatie per canal, mult mai rapid decat reducerea pe axa scurta
+        magnitude = np.abs(x)
+        peak = magnitude[0].copy()
+        for ch in range(1, magnitude.shape[0]):
+            np.fmax(peak, magnitude[ch], out=peak)
+        required = ceiling / np.fmax(peak, ceiling)
+
+        delayed = np.concatenate((self._delay, x), axis=1)
+        self._delay = delayed[:, frames:].copy()
+
+        # cazul obisnuit: nimic peste ceiling si nicio reducere in curs,
+        # limiter-ul e doar linia de delay
+        if (self._reduction == 0.0 and required.min() == 1.0
+                and self._gain_history.min() == 1.0 and self._smooth_history.min() == 1.0):
+            out[...] = delayed[:, :frames]
+            return
+
+        # minim pe fereastra de lookahead (istoric din blocul anterior)
+        gains = np.concatenate((self._gain_history, required))
+        held = _sliding_min(gains, window)
+        self._gain_history = gains[frames:]
+
+        # release: reducerea (1 - castig) scade exponential, atacul e instant
+        # r[n] = max(u[n], r[n-1] * c), calculat in domeniul log cu maximum.accumulate
+        decay = -1.0 / (self.release_ms * samplerate / 1000.0)
+        n = np.arange(frames)
+        with np.errstate(divide="ignore"):
+            log_u = np.log(1.0 - held)
+            log_prev = np.log(self._reduction) if self._reduction > 0.0 else -np.inf
+        log_r = np.maximum.accumulate(log_u - n * decay) + n * decay
+        log_r = np.maximum(log_r, log_prev + (n + 1) * decay)
+        smooth = 1.0 - np.exp(log_r)
+        self._reduction = float(1.0 - smooth[-1])
+
+        # medie pe fereastra (ramane sub minimul tinut, deci sub castigul necesar)
+        smooth = np.concatenate((self._smooth_history, smooth))
+        csum = np.concatenate(([0.0], np.cumsum(smooth)))
+        gain = (csum[window:] - csum[:-window]) / window
+        self._smooth_history = smooth[frames:]
+        np.multiply(delayed[:, :frames], gain.astype(np.float32), out=out)
+
+    def tail_frames(self, samplerate: int) -> int:
+        self._check_params()
+        return self._window_frames(samplerate) - 1
+
+    def latency_frames(self, samplerate: int) -> int:
+        return self.tail_frames(samplerate)
+
+    def memory_frames(self, samplerate: int) -> int:
+        # lookahead (delay + cele doua ferestre) plus release-ul pana sub TAIL_THRESHOLD
+        self._check_params()
+        release = self.release_ms * samplerate / 1000.0
+        return 3 * (self._window_frames(samplerate) - 1) + int(np.ceil(release * np.log(1.0 / TAIL_THRESHOLD)))
+
+    # inactiv cand linia de delay e linistita; castigul continua in advance()
+    def is_idle(self, threshold: float) -> bool:
+        if self._delay is None:
+            return True
+        if self._delay.max() >= threshold or self._delay.min() <= -threshold:
+            return False
+        self._delay[:] = 0.0
+        return True
+
+    # pe liniste limiter-ul e ieftin: ruleaza normal, ca release-ul sa ramana exact
+    def advance(self, frames: int, samplerate: int) -> None:
+        if self._delay is not None and self._reduction > 0.0:
+            self.apply_planar(np.zeros((self._delay.shape[0], frames), dtype=np.float32), samplerate)
+
+    def reset(self) -> None:
+        if self._delay is not None:
+            self._allocate(self._window, self._delay.shape[0])
+
+    def get_state(self) -> dict:
+        if self._delay is None:
+            return {}
+        return {
+            # in checkpoint linia de delay ramane (delay, channels)
+            "delay": self._delay.T.copy(),
+            "gain_history": self._gain_history.copy(),
+            "smooth_history": self._smooth_history.copy(),
+            "reduction": np.array(self._reduction),
+        }
+
+    def set_state(self, state: dict) -> None:
+        if "delay" not in state:
+            self._window = None
+            self._delay = None
+            return
+        self._delay = np.ascontiguousarray(np.array(state["delay"], dtype=np.float32).T)
+        self._window = self._delay.shape[1] + 1
+        self._gain_history = np.array(state["gain_history"], dtype=np.float64)
+        self._smooth_history = np.array(state["smooth_history"], dtype=np.float64)
+        self._reduction = float(state["reduction"])
+
+    def params(self) -> dict:
+        return {
+            "ceiling_db": self.ceiling_db,
+            "lookahead_ms": self.lookahead_ms,
+            "release_ms": self.release_ms,
+        }
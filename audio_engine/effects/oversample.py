@@ -0,0 +1,222 @@
+import functools
+import numpy as np
+from .effect import Effect
+
+
+# factorii suportati si numarul de coeficienti nenuli pe etaj: primul etaj
+# (cel mai aproape de samplerate-ul nativ) are nevoie de tranzitia cea mai
+# stransa, etajele urmatoare lucreaza cu semnal deja limitat in banda
+FACTORS = (2, 4, 8)
+FIRST_STAGE_TAPS = 24
+STAGE_TAPS = 12
+KAISER_BETA = 8.0
+
+
+@functools.lru_cache(maxsize=None)
+def halfband_taps(taps: int, beta: float = KAISER_BETA) -> np.ndarray:
+    """
+    Filtru half-band (trece-jos la fs/4) cu fereastra Kaiser, lungime 2*taps - 1
+    Coeficientii de pe pozitiile pare fata de centru sunt 0 (in afara de centru = 0.5),
+    deci doar ramura polifazica impara e un FIR adevarat, cealalta e un simplu delay
+    Returneaza cei `taps` coeficienti nenuli, inversati (gata de convolutie), read-only
+    """
+    length = 2 * taps - 1
+    center = taps - 1
+    n = np.arange(length) - center
+    h = 0.5 * np.sinc(n / 2.0) * np.kaiser(length, beta)
+    branch = h[0::2]
+    # castig 1 la DC: ramura FIR + centrul (0.5)
+    branch = branch * (0.5 / branch.sum())
+    out = np.ascontiguousarray(branch[::-1], dtype=np.float32)
+    out.flags.writeable = False
+    return out
+
+
+def _fir(x: np.ndarray, taps: np.ndarray, frames: int) -> np.ndarray:
+    # y[n] = sum_i taps[i] * x[n + i], cate o operatie vectoriala per coeficient
+    out = x[:frames] * taps[0]
+    for i in range(1, taps.shape[0]):
+        out += x[i:i + frames] * taps[i]
+    return out
+
+
+class _HalfbandStage:
+    """
+    Un etaj x2 (sus si jos) cu istoricul pastrat intre blocuri
+    up:   y[2n] = 2 * (h_impar * x)[n],  y[2n+1] = x[n - d]
+    down: y[n] = (h_impar * x_par)[n] + 0.5 * x[2n - c]
+    """
+
+    def __init__(self, taps: int):
+        self.taps = halfband_taps(taps)
+        self.up_history = None
+        self.down_history = None
+
+    def _check(self, channels: int):
+        m = self.taps.shape[0]
+        if self.up_history is None or self.up_history.shape[1] != channels:
+            self.up_history = np.zeros((m - 1, channels), dtype=np.float32)
+            self.down_history = np.zeros((2 * m - 2, channels), dtype=np.float32)
+
+    def up(self, x: np.ndarray) -> np.ndarray:
+        self._check(x.shape[1])
+        m = self.taps.shape[0]
+        frames = x.shape[0]
+        full = np.concatenate((self.up_history, x), axis=0)
+
+        out = np.empty((2 * frames, x.shape[1]), dtype=np.float32)
+        out[0::2] = _fir(full, self.taps, frames) * 2.0
+        out[1::2] = full[m // 2:m // 2 + frames]
+        self.up_history = full[frames:].copy()
+        return out
+
+    def down(self, x: np.ndarray) -> np.ndarray:
+        self._check(x.shape[1])
+        m = self.taps.shape[0]
+        frames = x.shape[0] // 2
+        full = np.concatenate((self.down_history, x), axis=0)
+
+        out = _fir(full[0::2], self.taps, frames)
+        out += 0.5 * full[m - 1:m - 1 + 2 * frames:2]
+        self.down_history = full[2 * frames:].copy()
+        return out
+
+    def states(self):
+        return [s for s in (self.up_history, self.down_history) if s is not None]
+
+    # intarzierea etajului (sus + jos), in sample-uri la rata lui de intrare
+    def latency(self) -> int:
+        return self.taps.shape[0] - 1
+
+
+class OversampledEffect(Effect):
+    """
+    Ruleaza un efect la factor x samplerate-ul engine-ului (2, 4 sau 8)
+    Semnalul e urcat si coborat prin etaje half-band x2 cu stare pastrata
+    intre blocuri, deci doar efectul impachetat plateste rata mai mare
+    Util pentru efecte neliniare (distortion), care altfel produc aliasing
+
+    Parametrii efectului interior sunt accesibili direct pe wrapper
+
+    example:
+        engine.add_effect("distortion", oversample=4)
+        engine.add_effect(OversampledEffect(DistortionEffect(intensity=8.0), factor=4))
+    """
+
+    def __init__(self, effect: Effect, factor: int = 4):
+        if not isinstance(effect, Effect):
+            raise TypeError()
+        object.__setattr__(self, "effect", effect)
+        self.factor = factor
+
+    @property
+    def factor(self) -> int:
+        return self._factor
+
+    @factor.setter
+    def factor(self, value: int):
+        value = int(value)
+        if value not in FACTORS:
+            raise ValueError(f"Unsupported oversampling factor: {value}")
+        self._factor = value
+        count = FACTORS.index(value) + 1
+        self._stages = [_HalfbandStage(FIRST_STAGE_TAPS if idx == 0 else STAGE_TAPS) for idx in range(count)]
+
+    # parametrii efectului interior sunt setati pe efect (ex. din GUI)
+    def __getattr__(self, name):
+        effect = self.__dict__.get("effect")
+        if effect is None:
+            raise AttributeError(name)
+        return getattr(effect, name)
+
+    def __setattr__(self, name, value):
+        effect = self.__dict__.get("effect")
+        if effect is not None and name in effect.params():
+            setattr(effect, name, value)
+        else:
+            object.__setattr__(self, name, value)
+
+    def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+
+        x = buffer.astype(np.float32, copy=False)
+        if x.ndim == 1:
+            x = x[:, None]
+
+        for stage in self._stages:
+            x = stage.up(x)
+
+        x = self.effect.apply(x, samplerate * self.factor)
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[:, None]
+
+        for stage in reversed(self._stages):
+            x = stage.down(x)
+        return x
+
+    # intarzierea adaugata de filtre, in frame-uri la samplerate-ul engine-ului
+    def latency(self) -> float:
+        return sum(stage.latency() / 2 ** idx for idx, stage in enumerate(self._stages))
+
+    # filtrele plus latenta efectului interior, rotunjite la frame-uri intregi
+    # (compensate de engine la randarile offline, ca la limiter)
+    def latency_frames(self, samplerate: int) -> int:
+        inner = self.effect.latency_frames(samplerate * self.factor) / self.factor
+        return int(round(self.latency() + inner))
+
+    # cat istoric tin filtrele (sus + jos), in frame-uri la samplerate-ul engine-ului
+    def _filter_frames(self) -> int:
+        return int(np.ceil(sum(2 * stage.taps.shape[0] / 2 ** idx for idx, stage in enumerate(self._stages))))
+
+    def tail_frames(self, samplerate: int) -> int:
+        inner = self.effect.tail_frames(samplerate * self.factor)
+        return int(np.ceil(inner / self.factor)) + self._filter_frames()
+
+    def memory_frames(self, samplerate: int) -> int | None:
+        inner = self.effect.memory_frames(samplerate * self.factor)
+        if inner is None:
+            return None
+        return int(np.ceil(inner / self.factor)) + self._filter_frames()
+
+    def is_idle(self, threshold: float) -> bool:
+        states = [state for stage in self._stages for state in stage.states()]
+        for state in states:
+            if state.max() >= threshold or state.min() <= -threshold:
+                return False
+        if not self.effect.is_idle(threshold):
+            return False
+        for state in states:
+            state[:] = 0.0
+        return True
+
+    def advance(self, frames: int, samplerate: int) -> None:
+        self.effect.advance(frames * self.factor, samplerate * self.factor)
+
+    def reset(self) -> None:
+        for stage in self._stages:
+            for state in stage.states():
+                state[:] = 0.0
+        self.effect.reset()
+
+    def get_state(self) -> dict:
+        state = {f"effect_{key}": value for key, value in self.effect.get_state().items()}
+        for idx, stage in enumerate(self._stages):
+            if stage.up_history is not None:
+                state[f"stage{idx}_up"] = stage.up_history.copy()
+                state[f"stage{idx}_down"] = stage.down_history.copy()
+        return state
+
+    def set_state(self, state: dict) -> None:
+        self.effect.set_state({key[len("effect_"):]: value for key, value in state.items() if key.startswith("effect_")})
+        for idx, stage in enumerate(self._stages):
+            if f"stage{idx}_up" in state:
+                stage.up_history = np.array(state[f"stage{idx}_up"], dtype=np.float32)
+                stage.down_history = np.array(state[f"stage{idx}_down"], dtype=np.float32)
+            else:
+                stage.up_history = None
+                stage.down_history = None
+
+    def params(self) -> dict:
+        return {**self.effect.params(), "factor": self.factor}
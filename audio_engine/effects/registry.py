@@ -0,0 +1,103 @@
+import importlib
+from collections.abc import Mapping
+
+
+# grupul de entry points prin care pachetele externe pot adauga efecte:
+# [project.entry-points."audio_engine.effects"]
+# flanger = "my_package.flanger:FlangerEffect"
+ENTRY_POINT_GROUP = "audio_engine.effects"
+
+BUILTIN_EFFECTS = {
+    "gain": "audio_engine.effects.gain:GainEffect",
+    "echo": "audio_engine.effects.echo:EchoEffect",
+    "distortion": "audio_engine.effects.distortion:DistortionEffect",
+    "reverb": "audio_engine.effects.reverb:ReverbEffect",
+    "tremolo": "audio_engine.effects.tremolo:TremoloEffect",
+    "limiter": "audio_engine.effects.limiter:LimiterEffect",
+    "eq": "audio_engine.effects.eq:EqEffect",
+    "spectral_gate": "audio_engine.effects.spectral_gate:SpectralGateEffect",
+}
+
+
+class EffectRegistry(Mapping):
+    """
+    Registru lazy de efecte: nume -> clasa
+    Intrarile sunt tinute ca "modul:Clasa" (sau clasa direct) si modulul e
+    importat doar la prima cerere a efectului respectiv
+    Entry point-urile sunt cautate doar cand un nume nu e gasit sau cand
+    se listeaza toate efectele
+
+    """
+
+    def __init__(self, entries: dict | None = None, entry_points: bool = True):
+        self._entries = dict(BUILTIN_EFFECTS if entries is None else entries)
+        self._loaded = {}
+        self._discovered = not entry_points
+
+    def register(self, name: str, target):
+        """
+            name: Numele efectului (case insensitive)
+            target: Clasa efectului sau "modul:Clasa"
+        """
+        name = name.lower()
+        self._entries[name] = target
+        self._loaded.pop(name, None)
+
+    def copy(self) -> "EffectRegistry":
+        other = EffectRegistry(self._entries, entry_points=False)
+        other._loaded = dict(self._loaded)
+        other._discovered = self._discovered
+        return other
+
+    def __getitem__(self, name: str):
+        name = name.lower()
+        cls = self._loaded.get(name)
+        if cls is not None:
+            return cls
+
+        if name not in self._entries:
+            self._discover()
+        target = self._entries[name]
+        cls = self._load(target)
+        self._loaded[name] = cls
+        return cls
+
+    def __contains__(self, name) -> bool:
+        if not isinstance(name, str):
+            return False
+        if name.lower() not in self._entries:
+            self._discover()
+        return name.lower() in self._entries
+
+    def __iter__(self):
+        self._discover()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._entries)
+
+    #INTERNAL
+    def _load(self, target):
+        if isinstance(target, str):
+            module_name, _, attr = target.partition(":")
+            return getattr(importlib.import_module(module_name), attr)
+        if hasattr(target, "load"):
+            # importlib.metadata.EntryPoint
+            return target.load()
+        return target
+
+    def _discover(self):
+        if self._discovered:
+            return
+        self._discovered = True
+
+        from importlib.metadata import entry_points
+
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except Exception:
+            return
+        for ep in found:
+            # efectele built-in si cele inregistrate manual au prioritate
+            self._entries.setdefault(ep.name.lower(), ep)
@@ -1,5 +1,75 @@
+import functools
 import numpy as np
-from .effect import Effect
+from .effect import Effect, TAIL_THRESHOLD
+
+
+# frame-uri per bloc in filtrul one-pole vectorizat
+ONE_POLE_BLOCK = 64
+
+
+@functools.lru_cache(maxsize=32)
+def _one_pole_kernel(a: float, b: float, block: int):
+    """
+    Raspunsul unui bloc la y[n] = a * y[n-1] + b * x[n]:
+    kernel[j, k] = b * a^(j-k) pentru k <= j (din stare zero), powers[j] = a^(j+1) (din stare)
+    """
+    lags = np.arange(block)[:, None] - np.arange(block)[None, :]
+    kernel = np.where(lags >= 0, b * a ** np.maximum(lags, 0), 0.0)
+    powers = a ** np.arange(1, block + 1)
+    return kernel.T.astype(np.float32), powers.astype(np.float32)
+
+
+@functools.lru_cache(maxsize=32)
+def _carry_kernel(a: float, block: int, count: int):
+    """
+    Starea la finalul blocului i: s[i] = a^block * s[i-1] + z[i] (z = finalul din stare zero)
+    transfer[j, i] = a^(block * (i-j)) pentru j <= i, decay[i] = a^(block * (i+1))
+    """
+    lags = np.arange(count)[None, :] - np.arange(count)[:, None]
+    step = a ** block
+    transfer = np.where(lags >= 0, step ** np.maximum(lags, 0), 0.0)
+    decay = step ** np.arange(1, count + 1)
+    return transfer.astype(np.float32), decay.astype(np.float32)
+
+
+def _one_pole(x: np.ndarray, a: float, b: float, state: np.ndarray, block: int = ONE_POLE_BLOCK):
+    """
+    y[n] = a * y[n-1] + b * x[n] pe ultima axa (timpul), pentru toate randurile odata
+    Fiecare bloc e un produs matriceal din stare zero; starea de la inceputul
+    fiecarui bloc se obtine tot matriceal, din finalurile blocurilor anterioare
+    returneaza (y, starea noua)
+    """
+    rows, frames = x.shape
+    count = -(-frames // block)
+    padded = np.zeros((rows, count * block), dtype=np.float32)
+    padded[:, :frames] = x
+    kernel_t, powers = _one_pole_kernel(float(a), float(b), block)
+    transfer, decay = _carry_kernel(float(a), block, count)
+
+    y = padded.reshape(rows, count, block) @ kernel_t
+    ends = y[:, :, -1] @ transfer + state[:, None] * decay
+    starts = np.concatenate((state[:, None], ends[:, :-1]), axis=1)
+    y += starts[:, :, None] * powers
+    y = y.reshape(rows, -1)[:, :frames]
+    return y, y[:, -1].copy()
+
+
+# citire / scriere de `n` frame-uri dintr-un buffer circular (channels, delay), peste capat
+def _ring_read(buf: np.ndarray, pos: int, n: int) -> np.ndarray:
+    if pos + n <= buf.shape[1]:
+        return buf[:, pos:pos + n]
+    return np.concatenate((buf[:, pos:], buf[:, :pos + n - buf.shape[1]]), axis=1)
+
+
+def _ring_write(buf: np.ndarray, pos: int, data: np.ndarray) -> int:
+    first = min(data.shape[1], buf.shape[1] - pos)
+    buf[:, pos:pos + first] = data[:, :first]
+    buf[:, :data.shape[1] - first] = data[:, first:]
+    return (pos + data.shape[1]) % buf.shape[1]
+
+
+def _planar(buffer) -> np.ndarray:
+    return np.ascontiguousarray(np.array(buffer, dtype=np.float32).T)
 
 
 class ReverbEffect(Effect):
@@ -13,8 +83,14 @@ class ReverbEffect(Effect):
 
     efect creat cu mult ajutor de la AI
     ca e cam complicat :))
+
+    procesat pe bucati de cel mult cel mai scurt delay, fara bucla per sample;
+    liniile de delay sunt stocate planar (channels, delay)
     """
 
+    supports_planar = True
+    sample_params = ("mix",)
+
     def __init__(
         self,
         room_size: float = 0.5,
@@ -31,18 +107,32 @@ class ReverbEffect(Effect):
     def _check_params(self) -> None:
         self.room_size = float(np.clip(self.room_size, 0.0, 1.0))
         self.damping = float(np.clip(self.damping, 0.0, 1.0))
-        self.mix = float(np.clip(self.mix, 0.0, 1.0))
+        self.mix = np.clip(self.mix, 0.0, 1.0) if np.ndim(self.mix) else float(np.clip(self.mix, 0.0, 1.0))
 
     def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
         if buffer.size == 0:
             return buffer
 
-        self._check_params()
-
         x = buffer.astype(np.float32, copy=False)
         if x.ndim == 1:
             x = x[:, None]
 
+        out = np.empty_like(x, dtype=np.float32)
+        self._process(x.T, out.T, samplerate)
+        return out
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        x = buffer.astype(np.float32, copy=False)
+        out = np.empty_like(x, dtype=np.float32)
+        self._process(x, out, samplerate)
+        return out
+
+    # x, out: (channels, frames), eventual view-uri transpuse
+    def _process(self, x: np.ndarray, out: np.ndarray, samplerate: int) -> None:
+        self._check_params()
+
         # delay times (samples 44.1kHz, scaled pt samplerate si room_size)
         scale = samplerate / 44100.0
         room_scale = 0.5 + self.room_size * 2.5  # 0.5x la 3x
@@ -50,72 +140,146 @@ class ReverbEffect(Effect):
                        int(1277 * scale * room_scale), int(1356 * scale * room_scale)]
         allpass_delays = [int(556 * scale), int(441 * scale)]
 
-        # init buffers
+        # init buffers (planar: channels x delay)
         if self._combs is None:
             self._combs = []
             for delay in comb_delays:
                 self._combs.append({
-                    'buffer': np.zeros((delay, x.shape[1]), dtype=np.float32),
+                    'buffer': np.zeros((x.shape[0], delay), dtype=np.float32),
                     'pos': 0,
-                    'damp': np.zeros(x.shape[1], dtype=np.float32)
+                    'damp': np.zeros(x.shape[0], dtype=np.float32)
                 })
             
             self._allpasses = []
             for delay in allpass_delays:
                 self._allpasses.append({
-                    'buffer': np.zeros((delay, x.shape[1]), dtype=np.float32),
+                    'buffer': np.zeros((x.shape[0], delay), dtype=np.float32),
                     'pos': 0
                 })
 
         # feedback mai puternic la room_size mare
         fb = 0.5 + self.room_size * 0.4 
+        wet_gain = 1.0 + self.room_size * 0.5  # boost la room_size mare
 
-        out = np.empty_like(x, dtype=np.float32)
+        # bucati de cel mult cel mai scurt delay: nicio linie nu citeste ce scrie in aceeasi bucata
+        lines = self._combs + self._allpasses
+        chunk = min(line['buffer'].shape[1] for line in lines)
+        channels = x.shape[0]
+        damp_state = np.concatenate([comb['damp'] for comb in self._combs])
+
+        frames = x.shape[1]
+        i = 0
+        while i < frames:
+            n = min(chunk, frames - i)
+            segment = x[:, i:i + n]
+
+            # parallel comb filters cu damping (citeste delayed)
+            delayed = np.stack([_ring_read(comb['buffer'], comb['pos'], n) for comb in self._combs])
+
+            # damping lowpass, toate comb-urile odata
+            damp, damp_state = _one_pole(delayed.reshape(-1, n), 1.0 - self.damping, self.damping, damp_state)
+            damp = damp.reshape(delayed.shape)
+
+            # suma
+            comb_sum = delayed.sum(axis=0)
+
+            # scrie cu feedback damped
+            for idx, comb in enumerate(self._combs):
+                comb['pos'] = _ring_write(comb['buffer'], comb['pos'], segment + damp[idx] * fb)
 
-        for i in range(x.shape[0]):
-            # parallel comb filters cu damping
-            comb_sum = np.zeros(x.shape[1], dtype=np.float32)
-            
-            for comb in self._combs:
-                buf = comb['buffer']
-                pos = comb['pos']
-                damp_state = comb['damp']
-                
-                # citeste delayed
-                delayed = buf[pos]
-                
-                # damping lowpass
-                damp_state[:] = damp_state * (1.0 - self.damping) + delayed * self.damping
-                
-                # adauga la suma
-                comb_sum += delayed
-                
-                # scrie cu feedback damped
-                buf[pos] = x[i] + damp_state * fb
-                comb['pos'] = (pos + 1) % len(buf)
-            
             # normalizeaza (4 combs)
             allpass_in = comb_sum * 0.25
-            
+
             # series allpass pt diffusion
             for allpass in self._allpasses:
-                buf = allpass['buffer']
-                pos = allpass['pos']
-                
-                delayed = buf[pos]
-                
-                
+                delayed = _ring_read(allpass['buffer'], allpass['pos'], n)
+
                 allpass_out = -allpass_in + delayed
-                buf[pos] = allpass_in + delayed * 0.5
-                
+                allpass['pos'] = _ring_write(allpass['buffer'], allpass['pos'], allpass_in + delayed * 0.5)
+
                 allpass_in = allpass_out
-                allpass['pos'] = (pos + 1) % len(buf)
-            
-            wet_gain = 1.0 + self.room_size * 0.5  # boost la room_size mare
+
             wet = allpass_in * wet_gain
-            out[i] = x[i] * (1.0 - self.mix) + wet * self.mix
+            # mix automatizat: cate o valoare per frame
+            mix = self.mix if np.ndim(self.mix) == 0 else self.mix[i:i + n].astype(np.float32)
+            out[:, i:i + n] = segment * (1.0 - mix) + wet * mix
+            i += n
+
+        for idx, comb in enumerate(self._combs):
+            comb['damp'] = damp_state[idx * channels:(idx + 1) * channels].copy()
+
+    def memory_frames(self, samplerate: int) -> int:
+        return self.tail_frames(samplerate)
+
+    def is_idle(self, threshold: float) -> bool:
+        if self._combs is None:
+            return True
+        states = [comb['buffer'] for comb in self._combs]
+        states += [comb['damp'] for comb in self._combs]
+        states += [allpass['buffer'] for allpass in self._allpasses]
+        for state in states:
+            if state.max() >= threshold or state.min() <= -threshold:
+                return False
+        # buclele de feedback lasa valori aproape denormale, care incetinesc
+        # calculul; sub prag sunt puse direct pe zero
+        self.reset()
+        return True
+
+    def reset(self) -> None:
+        for comb in self._combs or []:
+            comb['buffer'][:] = 0.0
+            comb['damp'][:] = 0.0
+            comb['pos'] = 0
+        for allpass in self._allpasses or []:
+            allpass['buffer'][:] = 0.0
+            allpass['pos'] = 0
+
+    def get_state(self) -> dict:
+        if self._combs is None:
+            return {}
+        state = {}
+        for idx, comb in enumerate(self._combs):
+            # in checkpoint liniile de delay raman (delay, channels)
+            state[f"comb{idx}_buffer"] = comb['buffer'].T.copy()
+            state[f"comb{idx}_pos"] = np.array(comb['pos'])
+            state[f"comb{idx}_damp"] = comb['damp'].copy()
+        for idx, allpass in enumerate(self._allpasses):
+            state[f"allpass{idx}_buffer"] = allpass['buffer'].T.copy()
+            state[f"allpass{idx}_pos"] = np.array(allpass['pos'])
+        return state
 
-        return np.clip(out, -1.0, 1.0)
+    def set_state(self, state: dict) -> None:
+        if "comb0_buffer" not in state:
+            self._combs = None
+            self._allpasses = None
+            return
+        self._combs = []
+        idx = 0
+        while f"comb{idx}_buffer" in state:
+            self._combs.append({
+                'buffer': _planar(state[f"comb{idx}_buffer"]),
+                'pos': int(state[f"comb{idx}_pos"]),
+                'damp': np.array(state[f"comb{idx}_damp"], dtype=np.float32),
+            })
+            idx += 1
+        self._allpasses = []
+        idx = 0
+        while f"allpass{idx}_buffer" in state:
+            self._allpasses.append({
+                'buffer': _planar(state[f"allpass{idx}_buffer"]),
+                'pos': int(state[f"allpass{idx}_pos"]),
+            })
+            idx += 1
+
+    def tail_frames(self, samplerate: int) -> int:
+        self._check_params()
+        scale = samplerate / 44100.0
+        room_scale = 0.5 + self.room_size * 2.5
+        fb = 0.5 + self.room_size * 0.4
+        # cel mai lung comb domina coada, allpass-urile (feedback 0.5) adauga putin
+        comb_loops = int(np.ceil(np.log(TAIL_THRESHOLD) / np.log(fb)))
+        allpass_loops = int(np.ceil(np.log(TAIL_THRESHOLD) / np.log(0.5)))
+        return int(1356 * scale * room_scale) * comb_loops + int(556 * scale) * allpass_loops
 
     def params(self) -> dict:
         return {
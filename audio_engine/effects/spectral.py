@@ -0,0 +1,185 @@
+import functools
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .effect import Effect
+
+
+OVERLAPS = (2, 4, 8)
+
+
+@functools.lru_cache(maxsize=16)
+def stft_windows(fft_size: int, overlap: int):
+    """
+    Ferestre de analiza / sinteza (sqrt-Hann periodica), calculate o singura data
+    Sinteza e scalata ca suma produselor suprapuse sa fie exact 1 (reconstructie perfecta)
+    """
+    hann = 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(fft_size) / fft_size)
+    analysis = np.sqrt(hann)
+    synthesis = analysis / (overlap / 2.0)
+    return analysis.astype(np.float32), synthesis.astype(np.float32)
+
+
+class SpectralEffect(Effect):
+    """
+    Baza pentru efecte in domeniul frecventei (STFT cu overlap-add)
+
+    Blocurile engine-ului (orice blocksize) sunt adunate in hop-uri de fft_size / overlap
+    frame-uri; toate cadrele complete dintr-un bloc sunt transformate odata
+    (rfft / irfft pe array 2-D), iar subclasa modifica doar spectrul in process_spectrum()
+    Iesirea are mereu cate frame-uri are si intrarea, intarziata cu fft_size - 1 (latency_frames)
+    """
+
+    supports_planar = True
+
+    def __init__(self, fft_size: int = 1024, overlap: int = 4):
+        self.fft_size = int(fft_size)
+        self.overlap = int(overlap)
+
+        self._layout = None
+        self._history = None
+        self._pending = None
+        self._carry = None
+        self._queue = None
+
+    # modifica spectrul: (channels, cadre, bins) complex -> acelasi shape
+    def process_spectrum(self, spectrum: np.ndarray, samplerate: int) -> np.ndarray:
+        return spectrum
+
+    # apelat cand `count` cadre de liniste sunt sarite (starea din subclasa, ex. release)
+    def advance_spectrum(self, count: int, samplerate: int) -> None:
+        pass
+
+    @property
+    def hop(self) -> int:
+        return self.fft_size // self.overlap
+
+    def _check_params(self) -> None:
+        # fft_size putere a lui 2 (cel putin 64), overlap din OVERLAPS
+        self.fft_size = int(2 ** round(np.log2(max(64, int(self.fft_size)))))
+        self.overlap = int(min(OVERLAPS, key=lambda value: abs(value - int(self.overlap))))
+
+    def _allocate(self, channels: int):
+        hop = self.hop
+        self._layout = (self.fft_size, self.overlap, channels)
+        self._history = np.zeros((channels, self.fft_size - hop), dtype=np.float32)
+        self._pending = np.zeros((channels, 0), dtype=np.float32)
+        self._carry = np.zeros((channels, self.fft_size - hop), dtype=np.float32)
+        # hop - 1 frame-uri de avans: la orice blocksize coada nu ramane goala
+        self._queue = np.zeros((channels, hop - 1), dtype=np.float32)
+
+    def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+
+        x = buffer.astype(np.float32, copy=False)
+        if x.ndim == 1:
+            x = x[:, None]
+        return np.ascontiguousarray(self._process(x.T, samplerate).T)
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        return self._process(buffer.astype(np.float32, copy=False), samplerate)
+
+    # x: (channels, frames); returneaza (channels, frames)
+    def _process(self, x: np.ndarray, samplerate: int) -> np.ndarray:
+        self._check_params()
+        channels, frames = x.shape
+        if self._layout != (self.fft_size, self.overlap, channels):
+            self._allocate(channels)
+
+        fft_size, overlap, hop = self.fft_size, self.overlap, self.hop
+        stream = np.concatenate((self._history, self._pending, x), axis=1)
+        count = (self._pending.shape[1] + frames) // hop
+
+        if count:
+            analysis, synthesis = stft_windows(fft_size, overlap)
+            # toate cadrele complete odata: (channels, count, fft_size)
+            windows = sliding_window_view(stream, fft_size, axis=1)[:, ::hop][:, :count]
+            spectrum = np.fft.rfft(windows * analysis, axis=-1)
+            spectrum = self.process_spectrum(spectrum, samplerate)
+            frames_out = np.fft.irfft(spectrum, n=fft_size, axis=-1).astype(np.float32) * synthesis
+
+            # overlap-add: segmentul r al cadrului f ajunge in hop-ul f + r
+            ola = np.zeros((channels, count + overlap - 1, hop), dtype=np.float32)
+            ola[:, :overlap - 1] += self._carry.reshape(channels, overlap - 1, hop)
+            segments = frames_out.reshape(channels, count, overlap, hop)
+            for r in range(overlap):
+                ola[:, r:r + count] += segments[:, :, r]
+            ola = ola.reshape(channels, -1)
+
+            self._queue = np.concatenate((self._queue, ola[:, :count * hop]), axis=1)
+            self._carry = ola[:, count * hop:].copy()
+
+        consumed = count * hop
+        self._history = stream[:, consumed:consumed + fft_size - hop].copy()
+        self._pending = stream[:, consumed + fft_size - hop:].copy()
+
+        out = self._queue[:, :frames]
+        self._queue = self._queue[:, frames:]
+        return out
+
+    def latency_frames(self, samplerate: int) -> int:
+        self._check_params()
+        return self.fft_size - 1
+
+    def tail_frames(self, samplerate: int) -> int:
+        return self.latency_frames(samplerate)
+
+    # memoria e finita, dar iesirea depinde si de pozitia grilei de hop-uri,
+    # deci render-ul pe segmente nu ar fi aliniat cu cel serial
+    def memory_frames(self, samplerate: int) -> int | None:
+        return None
+
+    def _states(self):
+        return [self._history, self._pending, self._carry, self._queue]
+
+    def is_idle(self, threshold: float) -> bool:
+        if self._layout is None:
+            return True
+        for state in self._states():
+            if state.size and (state.max() >= threshold or state.min() <= -threshold):
+                return False
+        for state in self._states():
+            state[:] = 0.0
+        return True
+
+    # pe liniste (stare zero) doar avanseaza grila de hop-uri si coada de iesire
+    def advance(self, frames: int, samplerate: int) -> None:
+        if self._layout is None:
+            return
+        channels = self._layout[2]
+        total = self._pending.shape[1] + frames
+        count = total // self.hop
+        self._pending = np.zeros((channels, total % self.hop), dtype=np.float32)
+        self._queue = np.zeros((channels, self._queue.shape[1] + count * self.hop - frames), dtype=np.float32)
+        if count:
+            self.advance_spectrum(count, samplerate)
+
+    def reset(self) -> None:
+        if self._layout is not None:
+            self._allocate(self._layout[2])
+
+    def get_state(self) -> dict:
+        if self._layout is None:
+            return {}
+        return {
+            "history": self._history.copy(),
+            "pending": self._pending.copy(),
+            "carry": self._carry.copy(),
+            "queue": self._queue.copy(),
+        }
+
+    def set_state(self, state: dict) -> None:
+        if "history" not in state:
+            self._layout = None
+            return
+        self._history = np.array(state["history"], dtype=np.float32)
+        self._pending = np.array(state["pending"], dtype=np.float32)
+        self._carry = np.array(state["carry"], dtype=np.float32)
+        self._queue = np.array(state["queue"], dtype=np.float32)
+        self._check_params()
+        self._layout = (self.fft_size, self.overlap, self._history.shape[0])
+
+    def params(self) -> dict:
+        return {"fft_size": self.fft_size, "overlap": self.overlap}
@@ -0,0 +1,87 @@
+import numpy as np
+from .spectral import SpectralEffect, stft_windows
+
+
+class SpectralGateEffect(SpectralEffect):
+    """
+    Noise gate pe fiecare bin de frecventa: binurile sub threshold_db sunt atenuate
+    cu reduction_db; deschiderea e instanta, inchiderea urmeaza release_ms
+    (fara release ar aparea "musical noise" - binuri care clipesc)
+    """
+
+    def __init__(
+        self,
+        threshold_db: float = -60.0,
+        reduction_db: float = -30.0,
+        release_ms: float = 100.0,
+        fft_size: int = 1024,
+        overlap: int = 4,
+    ):
+        super().__init__(fft_size, overlap)
+        self.threshold_db = float(threshold_db)
+        self.reduction_db = float(reduction_db)
+        self.release_ms = float(release_ms)
+
+        self._gains = None
+
+    def _check_params(self) -> None:
+        super()._check_params()
+        self.reduction_db = float(min(0.0, self.reduction_db))
+        self.release_ms = float(max(0.0, self.release_ms))
+
+    def _floor(self) -> float:
+        return float(10.0 ** (self.reduction_db / 20.0))
+
+    # cat ramane din (castig - floor) dupa un hop
+    def _release_coef(self, samplerate: int) -> float:
+        if self.release_ms <= 0.0:
+            return 0.0
+        return float(np.exp(-self.hop / (self.release_ms * samplerate / 1000.0)))
+
+    def process_spectrum(self, spectrum: np.ndarray, samplerate: int) -> np.ndarray:
+        channels, count, bins = spectrum.shape
+        if self._gains is None or self._gains.shape != (channels, bins):
+            self._gains = np.ones((channels, bins), dtype=np.float32)
+
+        # magnitudinea unui bin scalata la amplitudinea sinusoidei corespunzatoare
+        analysis, _ = stft_windows(self.fft_size, self.overlap)
+        level = np.abs(spectrum) * (2.0 / float(analysis.sum()))
+        is_open = level > 10.0 ** (self.threshold_db / 20.0)
+
+        floor = self._floor()
+        coef = self._release_coef(samplerate)
+        gains = np.empty((channels, count, bins), dtype=np.float32)
+        g = self._gains
+        for idx in range(count):
+            g = np.where(is_open[:, idx], 1.0, floor + (g - floor) * coef).astype(np.float32)
+            gains[:, idx] = g
+        self._gains = g
+        return spectrum * gains
+
+    # pe liniste binurile se inchid exact ca in process_spectrum
+    def advance_spectrum(self, count: int, samplerate: int) -> None:
+        if self._gains is not None:
+            floor = self._floor()
+            self._gains = (floor + (self._gains - floor) * self._release_coef(samplerate) ** count).astype(np.float32)
+
+    def reset(self) -> None:
+        super().reset()
+        self._gains = None
+
+    def get_state(self) -> dict:
+        state = super().get_state()
+        if state and self._gains is not None:
+            state["gains"] = self._gains.copy()
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self._gains = np.array(state["gains"], dtype=np.float32) if "gains" in state else None
+
+    def params(self) -> dict:
+        return {
+            "threshold_db": self.threshold_db,
+            "reduction_db": self.reduction_db,
+            "release_ms": self.release_ms,
+            **super().params(),
+        }
@@ -5,11 +5,34 @@ from .effect import Effect
 class TremoloEffect(Effect):
     """Modulare de amplitudine"""
 
+    supports_planar = True
+    sample_params = ("rate_hz", "depth")
+
     def __init__(self, rate_hz: float = 5.0, depth: float = 0.7):
         self.rate_hz = float(rate_hz)
         self.depth = float(np.clip(depth, 0.0, 1.0))
         self._phase = 0.0
 
+    # faza totala parcursa in `frames` frame-uri (rate_hz poate fi un array per frame la automatizare)
+    def _phase_step(self, frames: int, samplerate: int) -> float:
+        if np.ndim(self.rate_hz) == 0:
+            return 2 * np.pi * self.rate_hz / samplerate * frames
+        return float((2 * np.pi * np.asarray(self.rate_hz, dtype=np.float64) / samplerate).sum())
+
+    # castigul LFO-ului pentru urmatoarele `frames` frame-uri, calculat vectorial
+    def _lfo(self, frames: int, samplerate: int) -> np.ndarray:
+        if np.ndim(self.rate_hz) == 0:
+            inc = 2 * np.pi * self.rate_hz / samplerate # incrementul de faza
+            phase = self._phase + inc * np.arange(frames)
+            self._phase = float((self._phase + inc * frames) % (2 * np.pi))
+        else:
+            steps = np.cumsum(2 * np.pi * np.asarray(self.rate_hz, dtype=np.float64) / samplerate)
+            phase = self._phase + np.concatenate(([0.0], steps[:-1]))
+            self._phase = float((self._phase + steps[-1]) % (2 * np.pi))
+        depth = np.asarray(self.depth, dtype=np.float64)
+        oscilator = (1.0 - depth) + depth * (0.5 * (1.0 + np.sin(phase))) # oscilator intre (1-depth) si 1
+        return oscilator.astype(np.float32)
+
     def apply(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
         if buffer.size == 0:
             return buffer
@@ -17,15 +40,29 @@ class TremoloEffect(Effect):
         x = buffer.astype(np.float32, copy=False)
         if x.ndim == 1:
             x = x[:, None]
+        return x * self._lfo(x.shape[0], samplerate)[:, None]
+
+    def apply_planar(self, buffer: np.ndarray, samplerate: int) -> np.ndarray:
+        if buffer.size == 0:
+            return buffer
+        x = buffer.astype(np.float32, copy=False)
+        return x * self._lfo(x.shape[1], samplerate)
+
+    def is_idle(self, threshold: float) -> bool:
+        return True
+
+    # faza LFO-ului avanseaza si cand blocul e sarit
+    def advance(self, frames: int, samplerate: int) -> None:
+        self._phase = float((self._phase + self._phase_step(frames, samplerate)) % (2 * np.pi))
+
+    def reset(self) -> None:
+        self._phase = 0.0
 
-        out = np.empty_like(x, dtype=np.float32) # creaza o variabila ca buffer ( x ) dar goala cu valori neinitializate practic random ( garbage din memorie )
-        inc = 2 * np.pi * self.rate_hz / samplerate # incrementul de faza
-        for i in range(x.shape[0]):
-            oscilator = (1.0 - self.depth) + self.depth * (0.5 * (1.0 + np.sin(self._phase))) # oscilator intre (1-depth) si 1
-            out[i] = x[i] * oscilator # aplicam tremolo
-            self._phase = (self._phase + inc) % (2 * np.pi)
+    def get_state(self) -> dict:
+        return {"phase": np.array(self._phase)}
 
-        return out
+    def set_state(self, state: dict) -> None:
+        self._phase = float(state.get("phase", 0.0))
 
     def params(self) -> dict:
         return {"rate_hz": self.rate_hz, "depth": self.depth}
@@ -1,31 +1,36 @@
+import json
+import os
+import threading
 import time
 
-from .effects.effect import Effect
-from .effects.gain import GainEffect
-from .effects.echo import EchoEffect
-from .effects.distortion import DistortionEffect
-from .effects.reverb import ReverbEffect
-from .effects.tremolo import TremoloEffect
+from .analysis.bus import AnalysisBus
+from .effects.registry import EffectRegistry
 
-from .sources.file_source import FileSource
-from .sources.live_source import LiveSource
-from .consumers.file_consumer import FileConsumer
-from .consumers.live_consumer import LiveConsumer
+
+# backend-urile (soundfile, sounddevice/PortAudio, numpy) sunt importate
+# abia cand sunt folosite, ca `import audio_engine` sa ramana rapid
+# pentru procesele care fac doar file-to-file
 
 
 class AudioEngine:
-	def __init__(self, samplerate=44100, channels=1, blocksize=1024):
+	# silence_threshold: pe blocurile de input sub acest nivel (1e-5 = -100 dBFS)
+	# efectele inactive (is_idle) nu mai sunt rulate; esantioanele trec neschimbate
+	# None sau 0 dezactiveaza detectia
+	# flush_tails: la sfarsitul input-ului continua cu liniste pana se sting
+	# cozile efectelor (ecou, reverb)
+	# planar: lantul ruleaza pe buffere (channels, frames) contigue; conversia se face
+	# o data la intrarea si iesirea din lant, iar intre efecte doar langa un efect
+	# care nu suporta planar (supports_planar)
+	def __init__(self, samplerate=44100, channels=1, blocksize=1024, silence_threshold=1e-5, flush_tails=True,
+				 planar=False):
 		self.samplerate = samplerate
 		self.channels = channels
 		self.blocksize = blocksize
+		self.silence_threshold = silence_threshold
+		self.flush_tails = flush_tails
+		self.planar = planar
 		
-		self._registry = {
-			"gain": GainEffect,
-			"echo": EchoEffect,
-			"distortion": DistortionEffect,
-			"reverb": ReverbEffect,
-			"tremolo": TremoloEffect,
-		}
+		self._registry = EffectRegistry()
 		
 		self._input = None
 		self._output = None
@@ -34,6 +39,35 @@ class AudioEngine:
 		self._consumer = None
 		self._built = False
 		self._should_stop = False
+		self._finished = threading.Event()
+		self._finished.set()
+		# pause(): sursa, consumer-ul si starea raman pentru urmatorul start()
+		self._pause_requested = False
+		self._paused = False
+		self._stream_pool = None
+		self._frames_in = 0
+		self._frames_out = 0
+		self._tail = None
+		self._tail_frames = 0
+		self._skip = 0
+		self._tuner = None
+		self._capture = None
+		self._limiter_params = {}
+		self._limiter = None
+		# normalizare: masuratoarea din prima trecere, cheie = input + lant + rutare
+		self._normalization = None
+		self._normalize_gain = None
+		self._measuring = False
+		self._loudness_cache = {}
+		self._loudness_report = None
+		self._automation = {}
+		self._timeline = 0
+		self._routing = {}
+		self._routers = {}
+		# blocul de iesire poate fi scris in buffer-ul prealocat al rutarii
+		# (doar cand e consumat imediat: start(), process_array)
+		self._reuse_output = False
+		self._bus = AnalysisBus()
 
 	#INFO
 	def list_input_devices(self):
@@ -68,8 +102,13 @@ class AudioEngine:
 	def get_output_configuration(self):
 		return self._output
 
+	# samplerate-ul efectiv al sursei (dupa build), altfel cel configurat
+	def get_samplerate(self):
+		return getattr(self._source, "samplerate", self.samplerate)
+
+	# registrul e lazy: clasele se importa doar la prima folosire
 	def get_effects_registry(self):
-		return dict(self._registry)
+		return self._registry.copy()
 
 	def get_effects(self):
 		return list(self._effects)
@@ -82,17 +121,286 @@ class AudioEngine:
 		return eff.params()
 
 
+	#ANALYSIS
+	# abonatii primesc blocurile procesate pe un thread separat,
+	# nu adauga latenta in bucla audio (spre deosebire de on_chunk)
+	# example:
+	# peak = engine.subscribe(PeakAnalyzer())
+	def subscribe(self, callback):
+		return self._bus.subscribe(callback)
+
+	def unsubscribe(self, callback):
+		self._bus.unsubscribe(callback)
+
+	def get_analysis_bus(self):
+		return self._bus
+
+
+	#LIMITER
+	# etapa de iesire: un limiter cu lookahead dupa tot lantul, inainte de consumer
+	# (efectele nu mai taie semnalul fiecare cu np.clip); activ implicit
+	# example:
+	# engine.enable_limiter(ceiling_db=-1.0, lookahead_ms=5.0, release_ms=80.0)
+	# engine.disable_limiter()
+	def enable_limiter(self, **params):
+		self._limiter_params = params
+		self._limiter = None
+		self._chain_changed()
+		return self
+	
+	def disable_limiter(self):
+		self._limiter_params = None
+		self._limiter = None
+		self._chain_changed()
+		return self
+	
+	# instanta e creata la prima folosire (importul numpy ramane lazy)
+	def get_limiter(self):
+		if self._limiter is None and self._limiter_params is not None:
+			from .effects.limiter import LimiterEffect
+			self._limiter = LimiterEffect(**self._limiter_params)
+		return self._limiter
+
+
+	#LOUDNESS
+	# normalizare in doua treceri pentru render-uri offline (input file / array):
+	# build() masoara intai loudness-ul integrat (BS.1770) al iesirii lantului, fara
+	# consumer si fara limiter, apoi start() aplica o singura corectie GainEffect
+	# intre mixul de output si limiter; masuratoarea e tinuta per input + lant + rutare (si in
+	# cache_path, un json intre sesiuni), deci un render repetat sare prima trecere
+	# example:
+	# engine.enable_normalization(target_lufs=-14.0, cache_path="loudness.json")
+	def enable_normalization(self, target_lufs=-14.0, cache_path=None):
+		self._normalization = {"target_lufs": float(target_lufs), "cache_path": cache_path}
+		self._normalize_gain = None
+		self._chain_changed()
+		return self
+	
+	def disable_normalization(self):
+		self._normalization = None
+		self._normalize_gain = None
+		self._loudness_report = None
+		self._chain_changed()
+		return self
+	
+	# return format (dupa build):
+	# { "target_lufs": -14.0, "measured_lufs": -19.2, "gain_db": 5.2, "cached": False, "measure_seconds": 0.8 }
+	# measured_lufs e None pentru un input sub pragul absolut (-70 LUFS), fara corectie
+	def get_loudness_report(self):
+		return self._loudness_report
+
+
+	#ROUTING
+	# canalele trec prin: sursa -> lant (chain_channels) -> output; unde numarul difera
+	# e inserata automat o etapa de mix (presetul standard pentru perechea de canale,
+	# vezi utils/routing.py), un singur matmul per bloc
+	# implicit lantul are canalele sursei, iar output-ul canalele configurate la
+	# configure_output(channels=...) sau tot pe ale sursei
+	# example:
+	# engine.set_routing(chain_channels=1)                    # lant mono, upmix doar la final
+	# engine.set_routing(output_channels=2)                   # mono -> stereo (L = R)
+	# engine.set_routing(preset="5.1_to_stereo")              # downmix ITU
+	# engine.set_routing(matrix=[[1, 0], [0, 1], [0.5, 0.5]]) # matrice proprie (output x lant)
+	def set_routing(self, chain_channels=None, output_channels=None, matrix=None, preset=None):
+		if chain_channels is not None and chain_channels <= 0:
+			raise ValueError()
+		if output_channels is not None and output_channels <= 0:
+			raise ValueError()
+		if matrix is not None and preset is not None:
+			raise ValueError("Use either matrix or preset")
+		self._routing = {
+			"chain_channels": chain_channels,
+			"output_channels": output_channels,
+			"matrix": None if matrix is None else [list(map(float, row)) for row in matrix],
+			"preset": preset,
+		}
+		self._routers = {}
+		self._discard_paused()
+		return self
+	
+	def clear_routing(self):
+		self._routing = {}
+		self._routers = {}
+		self._discard_paused()
+		return self
+	
+	# return format:
+	# { "source": 1, "chain": 1, "output": 2, "input_matrix": None, "output_matrix": [[1.0], [1.0]] }
+	def get_routing(self, channels=None):
+		channels = channels or getattr(self._source, "channels", self.channels)
+		chain, output = self._routing_for(channels)
+		return {
+			"source": channels,
+			"chain": channels if chain is None else chain.outputs,
+			"output": self._output_channels(channels),
+			"input_matrix": None if chain is None else chain.matrix.tolist(),
+			"output_matrix": None if output is None else output.matrix.tolist(),
+		}
+
+
+	#AUTOMATION
+	# valorile unui parametru in timp, pe timeline-ul input-ului (secunde de la inceput)
+	# parametrii din sample_params ai efectului primesc cate o valoare per frame,
+	# ceilalti valoarea de la inceputul blocului; la o curba "step" blocul e impartit
+	# exact la punctul de salt
+	# example:
+	# engine.automate(0, "gain_db", [(0.0, -60.0), (2.0, 0.0)])            # fade-in de 2 s
+	# engine.automate(1, "rate_hz", [(0.0, 2.0), (30.0, 12.0)])            # sweep tremolo
+	# engine.automate(2, "room_size", [(0.0, 0.2), (10.0, 0.9)], curve="step")
+	def automate(self, index: int, name: str, points, curve: str = "linear"):
+		from .utils.automation import AutomationCurve
+		
+		effect = self._effects[index]
+		if name not in effect.params():
+			raise KeyError(f"Unknown parameter for {effect.__class__.__name__}: {name}")
+		self._automation.setdefault(effect, {})[name] = AutomationCurve(points, curve)
+		return self
+	
+	# fara argumente sterge toata automatizarea
+	def clear_automation(self, index: int | None = None, name: str | None = None):
+		if index is None:
+			self._automation.clear()
+			return self
+		curves = self._automation.get(self._effects[index], {})
+		if name is None:
+			curves.clear()
+		else:
+			curves.pop(name, None)
+		if not curves:
+			self._automation.pop(self._effects[index], None)
+		return self
+	
+	# return format:
+	# { "gain_db": {"curve": "linear", "points": [[0.0, -60.0], [2.0, 0.0]]}, ... }
+	def get_automation(self, index: int):
+		curves = self._automation.get(self._effects[index], {})
+		return {name: curve.describe() for name, curve in curves.items()}
+
+
+	#AUTOTUNE
+	# blocksize-ul (si buffer-ul sursei live) e ales automat la build():
+	# cel mai mic din candidates la care lantul foloseste cel mult target_load
+	# din durata unui bloc; in timpul rularii creste daca load-ul real trece de tinta,
+	# revine dupa ce load-ul ramane mult sub tinta, iar la schimbarea lantului e re-masurat
+	# example:
+	# engine.enable_autotune(target_load=0.5)
+	def enable_autotune(self, target_load=0.5, candidates=None):
+		from .utils.autotune import BlockSizeTuner, CANDIDATE_BLOCKSIZES
+		
+		self._tuner = BlockSizeTuner(target_load=target_load, candidates=candidates or CANDIDATE_BLOCKSIZES)
+		return self
+	
+	def disable_autotune(self):
+		self._tuner = None
+		return self
+	
+	# return format:
+	# { "blocksize": 256, "buffer_frames": 1024, "target_load": 0.5, "runtime_load": 0.12,
+	#   "retunes": 0, "measurements": {64: {"cost_ms": ..., "worst_ms": ..., "load": ...}, ...} }
+	# None daca autotune nu e activ
+	def get_autotune_report(self):
+		if self._tuner is None:
+			return None
+		return self._tuner.report()
+
+
+	#LIVE INPUT / OUTPUT
+	# statistici ale sursei live / network (underrun-uri, overflow, nivelul buffer-ului)
+	# None pentru input-urile offline sau inainte de build()
+	def get_input_stats(self):
+		stats = getattr(self._source, "stats", None)
+		return stats() if stats is not None else None
+	
+	# statistici ale output-ului live (underflows: blocuri dupa care device-ul a ramas
+	# fara date); None pentru celelalte output-uri sau inainte de build()
+	def get_output_stats(self):
+		stats = getattr(self._consumer, "stats", None)
+		return stats() if stats is not None else None
+
+	# return format:
+	# { "ratio": 1.000042, "drift_ppm": 41.8, "fill_frames": 2203.5, "target_frames": 2205, "underruns": 0 }
+	# None daca sursa nu e live cu drift_compensation
+	def get_drift_info(self):
+		drift = getattr(self._source, "drift", None)
+		if drift is None:
+			return None
+		return drift.stats()
+
+
+	#CAPTURE
+	# exporta un interval din captura retroactiva, fara sa opreasca stream-ul
+	# last: ultimele N secunde; start/end: secunde de la inceputul capturii
+	# example:
+	# engine.export_capture("incident.wav", last=120)
+	def export_capture(self, path, last=None, start=None, end=None, subtype=None):
+		if self._capture is None:
+			raise ValueError("No capture configured (configure_input('live', capture_seconds=...))")
+		return self._capture.export(path, last=last, start=start, end=end, subtype=subtype)
+	
+	# return format:
+	# { "seconds": 95.2, "capacity_seconds": 600.0, "captured_seconds": 95.2,
+	#   "pending": 512, "dropped": 0, "path": "..." }
+	def get_capture_info(self):
+		if self._capture is None:
+			return None
+		return self._capture.info()
+	
+	# opreste captura si sterge fisierul temporar
+	def close_capture(self):
+		if self._capture is not None:
+			self._capture.close()
+			self._capture = None
+
+
 	#CONFIGURATION
 	# example:
 	# engine.configure_input("file", path="input.wav")
 	# engine.configure_input("live", samplerate=44100, channels=2, blocksize=1024, device=1)
+	# engine.configure_input("array", data=ndarray, samplerate=44100)
+	# engine.configure_input("iter", data=iterable_of_blocks, samplerate=44100)
+	# engine.configure_input("network", port=5000, protocol="udp", samplerate=48000, channels=1)
+	# network asculta implicit doar pe 127.0.0.1; host="0.0.0.0" expune portul pe toate interfetele
+	# pentru live/network, buffer_dtype="int16" sau "float16" stocheaza buffer-ul sursei
+	# compact (jumatate din memorie), util pentru buffer_seconds mare pe multe canale
+	# engine.configure_input("live", capture_seconds=600, capture_path="capture.bin", capture_dtype="int16")
+	# capture_seconds: ultimele N secunde de input live sunt pastrate intr-un fisier
+	# circular pe disc (vezi export_capture); capture_path=None foloseste un fisier temporar
+	# engine.configure_input("live", device=1, buffer_seconds=0.2, drift_compensation=True)
+	# drift_compensation: pentru output live pe alt device (alt ceas), input-ul e resamplat
+	# fin ca buffer-ul sursei sa nu se umple/goleasca in sesiuni lungi (+ buffer_seconds / 2 latenta)
+	# engine.configure_input("live", overflow="grow", max_buffer_seconds=2.0, underrun="repeat")
+	# overflow: "drop_oldest" (implicit), "drop_newest", "grow" (pana la max_buffer_seconds)
+	# underrun: "block" (implicit, asteapta input-ul), "silence", "repeat" (completeaza blocul
+	# dupa underrun_timeout secunde, implicit durata unui bloc, fara click)
 	def configure_input(self, kind: str, **kwargs):
+		self._discard_paused()
 		kind = kind.lower()
 		if kind == "file":
 			path = kwargs.get("path") or kwargs.get("filename")
 			if not path:
 				raise ValueError()
 			self._input = {"kind": "file", "path": path}
+		elif kind in ("array", "iter"):
+			data = kwargs.get("data")
+			samplerate = kwargs.get("samplerate", self.samplerate)
+			if data is None or samplerate <= 0:
+				raise ValueError()
+			self._input = {"kind": kind, "data": data, "samplerate": samplerate}
+		elif kind == "network":
+			samplerate = kwargs.get("samplerate", self.samplerate)
+			channels = kwargs.get("channels", self.channels)
+			if samplerate <= 0 or channels <= 0:
+				raise ValueError()
+			self._input = {
+				"kind": "network",
+				"host": kwargs.get("host", "127.0.0.1"),
+				"port": kwargs.get("port", 0),
+				"protocol": kwargs.get("protocol", "tcp"),
+				"samplerate": samplerate,
+				"channels": channels,
+				"latency_ms": kwargs.get("latency_ms", 50.0),
+				"buffer_dtype": kwargs.get("buffer_dtype", "float32"),
+			}
 		else:
 			samplerate = kwargs.get("samplerate", self.samplerate)
 			channels = kwargs.get("channels", self.channels)
@@ -106,10 +414,30 @@ class AudioEngine:
 				"blocksize": blocksize,
 				"device": kwargs.get("device"),
 				"buffer_seconds": kwargs.get("buffer_seconds", 0.1),
+				"buffer_dtype": kwargs.get("buffer_dtype", "float32"),
+				"capture_seconds": kwargs.get("capture_seconds"),
+				"capture_path": kwargs.get("capture_path"),
+				"capture_dtype": kwargs.get("capture_dtype", "float32"),
+				"drift_compensation": kwargs.get("drift_compensation", False),
+				"overflow": kwargs.get("overflow", "drop_oldest"),
+				"max_buffer_seconds": kwargs.get("max_buffer_seconds"),
+				"underrun": kwargs.get("underrun", "block"),
+				"underrun_timeout": kwargs.get("underrun_timeout"),
 			}
+			from .utils.ring_buffer import OVERFLOW_POLICIES
+			from .utils.underrun import UNDERRUN_POLICIES
+			if self._input["overflow"] not in OVERFLOW_POLICIES:
+				raise ValueError(f"Unknown overflow policy: {self._input['overflow']}")
+			if self._input["underrun"] not in UNDERRUN_POLICIES:
+				raise ValueError(f"Unknown underrun policy: {self._input['underrun']}")
 		return self
 
+	# example:
+	# engine.configure_output("file", path="out.wav")
+	# engine.configure_output("file", path="out.wav", checkpoint="out.ckpt", checkpoint_interval=5.0)
+	# cu checkpoint, un render intrerupt continua de la ultimul checkpoint la urmatorul build()
 	def configure_output(self, kind: str = "live", **kwargs):
+		self._discard_paused()
 		kind = kind.lower()
 		if kind == "file":
 			path = kwargs.get("path") or kwargs.get("filename")
@@ -120,6 +448,28 @@ class AudioEngine:
 				"path": path,
 				"samplerate": kwargs.get("samplerate"),
 				"channels": kwargs.get("channels"),
+				"checkpoint": kwargs.get("checkpoint"),
+				"checkpoint_interval": kwargs.get("checkpoint_interval", 5.0),
+			}
+		elif kind == "array":
+			out = kwargs.get("out")
+			if out is None:
+				raise ValueError()
+			# canalele output-ului sunt cele ale array-ului (mix automat daca difera)
+			self._output = {"kind": "array", "out": out, "channels": out.shape[1] if out.ndim == 2 else None}
+		elif kind == "network":
+			port = kwargs.get("port")
+			batch_blocks = kwargs.get("batch_blocks", 4)
+			if not port or batch_blocks <= 0:
+				raise ValueError()
+			self._output = {
+				"kind": "network",
+				"host": kwargs.get("host", "127.0.0.1"),
+				"port": port,
+				"protocol": kwargs.get("protocol", "tcp"),
+				"batch_blocks": batch_blocks,
+				"samplerate": kwargs.get("samplerate"),
+				"channels": kwargs.get("channels"),
 			}
 		else:
 			samplerate = kwargs.get("samplerate")
@@ -138,86 +488,361 @@ class AudioEngine:
 				"blocksize": blocksize,
 				"device": kwargs.get("device"),
 			}
+		self._routers = {}
 		return self
 
-	def add_effect(self, effect, **kwargs):
+	# example:
+	# engine.register_effect("flanger", FlangerEffect)
+	# engine.register_effect("flanger", "my_package.flanger:FlangerEffect")
+	def register_effect(self, name: str, target):
+		self._registry.register(name, target)
+		return self
+
+	# oversample=2/4/8 ruleaza doar acest efect la o rata mai mare (ex. distortion,
+	# ca sa nu produca aliasing), restul lantului ramane la samplerate-ul engine-ului
+	# example:
+	# engine.add_effect("distortion", oversample=4, intensity=8.0)
+	def add_effect(self, effect, oversample=None, **kwargs):
+		from .effects.effect import Effect
+		
 		if isinstance(effect, Effect):
-			self._effects.append(effect)
+			instance = effect
 		elif isinstance(effect, str):
 			name = effect.lower()
 			cls = self._registry.get(name)
 			if not cls:
 				raise KeyError(f"Unknown effect: {effect}")
-			self._effects.append(cls(**kwargs))
+			instance = cls(**kwargs)
 		elif isinstance(effect, type) and issubclass(effect, Effect):
 			instance = effect(**kwargs)
-			self._effects.append(instance)
 		else:
 			raise TypeError()
+		
+		if oversample and oversample > 1:
+			from .effects.oversample import OversampledEffect
+			instance = OversampledEffect(instance, factor=oversample)
+		self._effects.append(instance)
+		self._chain_changed()
 		return self
 
 	def clear_effects(self):
 		self._effects.clear()
+		self._automation.clear()
+		self._chain_changed()
 
 	def remove_effect(self, index: int):
 		if 0 <= index < len(self._effects):
-			self._effects.pop(index)
+			self._automation.pop(self._effects.pop(index), None)
+			self._chain_changed()
+
+	# parametrii unui efect din lant, dupa numele din params(); se aplica de la urmatorul bloc
+	# example:
+	# engine.set_effect_params(0, gain_db=-6.0)
+	def set_effect_params(self, index: int, **params):
+		effect = self._effects[index]
+		known = effect.params()
+		for name, value in params.items():
+			if name not in known:
+				raise KeyError(f"Unknown parameter for {effect.__class__.__name__}: {name}")
+			setattr(effect, name, value)
+		return self
 
 	def reorder_effects(self, old_index: int, new_index: int):
 		if 0 <= old_index < len(self._effects) and 0 <= new_index < len(self._effects):
 			effect = self._effects.pop(old_index)
 			self._effects.insert(new_index, effect)
+			self._chain_changed()
 
 
 	#BUILD, RUN
-	def build(self):
+	# consumer=False construieste doar sursa (ex. pentru stream() fara output)
+	def build(self, consumer=True):
 		if not self._input:
 			raise ValueError()
+		# un build nou inlocuieste resursele pastrate la pause()
+		self._discard_paused()
+		
+		# sursa live are nevoie de blocksize la creare, celelalte sunt masurate
+		# cu samplerate-ul lor efectiv; lantul e re-masurat doar daca s-a schimbat
+		live = self._input["kind"] == "live"
+		if self._tuner is not None and live:
+			self._tuner.ensure_tuned(self._stages(), self._input["samplerate"], self._input["channels"])
+			self.blocksize = self._tuner.blocksize
 		
 		self._source = self._create_source()
 		sr = getattr(self._source, "samplerate", self.samplerate)
 		ch = getattr(self._source, "channels", self.channels)
 		
-		if not self._output:
-			self._output = {"kind": "live", "samplerate": sr, "channels": ch}
+		if self._tuner is not None and not live:
+			self._tuner.ensure_tuned(self._stages(), sr, ch)
+			self.blocksize = self._tuner.blocksize
+		if self._normalization is not None:
+			self._normalize(sr, ch)
+		self._frames_in = 0
+		self._frames_out = 0
+		self._timeline = 0
+		self._tail = None
+		self._tail_frames = 0
+		
+		resume = False
+		if consumer:
+			if not self._output:
+				self._output = {"kind": "live", "samplerate": sr, "channels": ch}
+			
+			resume = self._restore_checkpoint()
+			self._consumer = self._create_consumer(sr, self._output_channels(ch),
+												   resume_frames=self._frames_out if resume else None)
 		
-		self._consumer = self._create_consumer(sr, ch)
+		# input offline: latenta lantului e scoasa de la inceputul iesirii,
+		# ca iesirea sa ramana aliniata cu input-ul (coada o completeaza la final)
+		# (la resume ramane cat era in checkpoint)
+		offline = self._input["kind"] in ("file", "array", "iter")
+		if not resume:
+			self._skip = self._output_latency(sr) if offline else 0
 		self._built = True
 		return self
 
+	# dupa pause() continua cu sursa, consumer-ul si starea pastrate (fara build)
 	def start(self, frames=None, duration=None, on_chunk=None):
 		self._ensure_built()
+		if self._paused:
+			self._resume_io()
 		
-		chunk = frames or self.blocksize
 		start_time = time.perf_counter()
 		
 		self._should_stop = False
+		self._pause_requested = False
+		self._finished.clear()
 		
+		checkpoint = self._output.get("checkpoint") if self._output else None
+		if checkpoint:
+			checkpoint_every = max(1, int(self._output["checkpoint_interval"] * self.get_samplerate()))
+			next_checkpoint = self._frames_in + checkpoint_every
+			# ultima stare consistenta (dupa un bloc scris complet in output): o intrerupere
+			# in mijlocul unui bloc o salveaza pe ea, nu starea avansata pe jumatate
+			consistent = self._checkpoint_snapshot()
+		in_block = False
+		finished = False
+		paused = False
+		
+		# blocurile sunt scrise imediat in consumer (si copiate pe bus)
+		self._reuse_output = True
 		try:
 			while not self._should_stop:
-				buf = self._source.read(chunk)
-				if buf.size == 0:
+				# blocksize-ul poate fi schimbat de autotune intre blocuri
+				in_block = True
+				buf = self._next_block(frames or self.blocksize, on_chunk)
+				in_block = False
+				if buf is None:
+					finished = not self._should_stop
 					break
 				
-				buf = self._process_buffer(buf)
-				
-				if on_chunk:
-					on_chunk(buf)
-				
-				self._consumer.write(buf)
+				if checkpoint and self._frames_in >= next_checkpoint:
+					consistent = self._checkpoint_snapshot()
+					self._save_checkpoint(consistent)
+					next_checkpoint += checkpoint_every
 				
 				if duration and (time.perf_counter() - start_time) >= duration:
 					break
+			
+			# oprit inainte de final: se poate relua de aici
+			if checkpoint and not finished:
+				self._save_checkpoint()
+			paused = self._pause_requested and not finished
 		except KeyboardInterrupt:
-			pass
+			if checkpoint:
+				self._save_checkpoint(consistent if in_block else None)
 		except Exception as e:
 			raise
 		finally:
-			self._cleanup_resources()
+			self._reuse_output = False
+			if paused:
+				self._pause_io()
+			else:
+				self._cleanup_resources()
+		
+		if checkpoint and finished:
+			from .utils.checkpoint import remove_checkpoint
+			remove_checkpoint(checkpoint)
 
 	def stop(self):
 		self._should_stop = True
 
+
+	#PAUSE, RESUME
+	# pause() opreste bucla lui start() ca stop(), dar pastreaza sursa si consumer-ul
+	# (stream-urile live raman deschise, oprite) si starea efectelor; start() / resume()
+	# continua de acolo fara build, primul bloc iese dupa ~un bloc
+	# configure_input / configure_output / set_routing sau build() renunta la ele
+	# la stop() stream-urile live nu sunt inchise, ci pastrate pentru urmatorul build()
+	# cu aceiasi parametri (utils/stream_pool.py); close_streams() le inchide
+	# example:
+	# engine.pause()
+	# engine.resume()
+	def pause(self):
+		self._pause_requested = True
+		self._should_stop = True
+
+	def resume(self, frames=None, duration=None, on_chunk=None):
+		return self.start(frames=frames, duration=duration, on_chunk=on_chunk)
+
+	def is_paused(self):
+		return self._paused
+
+	def close_streams(self):
+		self._discard_paused()
+		if self._stream_pool is not None:
+			self._stream_pool.close()
+
+
+	#IN-MEMORY
+	# proceseaza date deja aflate in memorie, fara fisiere temporare sau dispozitive
+	# tail=True continua cu liniste pana se sting cozile efectelor (ecou, reverb)
+	# fiecare apel porneste lantul din starea initiala (array-uri independente);
+	# blocurile unui singur stream trec prin process_iter
+	# example:
+	# processed = engine.process_array(data, 44100)
+	def process_array(self, data, samplerate, out=None, tail=True):
+		from .sources.array_source import ArraySource
+		from .consumers.array_consumer import ArrayConsumer
+		
+		self._reset_chain()
+		source = ArraySource(data, samplerate)
+		consumer = ArrayConsumer(channels=self._output_channels(source.channels), out=out)
+		self._reuse_output = True
+		try:
+			for buf in self._iter_source(source, self.blocksize, tail):
+				consumer.write(buf)
+		finally:
+			self._reuse_output = False
+		return consumer.result()
+
+	# example:
+	# for block in engine.process_iter(blocks, 44100):
+	#     send(block)
+	def process_iter(self, blocks, samplerate, tail=True):
+		from .sources.array_source import IterSource
+		
+		self._reset_chain()
+		source = IterSource(blocks, samplerate)
+		yield from self._iter_source(source, self.blocksize, tail)
+
+
+	#PARALLEL
+	# randeaza un singur fisier lung pe segmente, pe un process pool
+	# fiecare segment porneste cu un pre-roll egal cu memoria declarata a lantului
+	# (memory_frames), deci diferenta fata de render-ul serial ramane sub
+	# TAIL_THRESHOLD (-80 dBFS) per efect cu stare
+	# daca un efect nu declara memorie finita (sau e configurat checkpoint)
+	# se face render serial exact cu start()
+	# example:
+	# engine.render_parallel(workers=8, segment_seconds=60.0)
+	def render_parallel(self, workers=None, segment_seconds=30.0):
+		if not self._input or self._input["kind"] != "file":
+			raise ValueError("render_parallel needs file input")
+		if not self._output or self._output["kind"] != "file":
+			raise ValueError("render_parallel needs file output")
+		
+		from .parallel import chain_memory_frames, render_file_parallel
+		
+		self._ensure_built()
+		samplerate = self.get_samplerate()
+		stages = self._stages()
+		preroll = chain_memory_frames(stages, samplerate)
+		
+		# automatizarea e pe timeline-ul absolut: ramane pe render-ul serial
+		if preroll is None or self._output.get("checkpoint") or self._automation:
+			self.start()
+			return {"parallel": False, "segments": 1, "preroll_frames": preroll}
+		
+		try:
+			segments = render_file_parallel(
+				path=self._input["path"],
+				total_frames=self._source.frames,
+				samplerate=samplerate,
+				effects=list(self._effects),
+				consumer=self._consumer,
+				blocksize=self.blocksize,
+				segment_frames=max(1, int(segment_seconds * samplerate)),
+				preroll=preroll,
+				workers=workers,
+				silence_threshold=self.silence_threshold,
+				flush_tails=self.flush_tails,
+				latency=self._output_latency(samplerate),
+				planar=self.planar,
+				normalize=self._normalize_gain,
+				limiter=self.get_limiter(),
+				# in procesele din pool output-ul nu e configurat: canalele sunt date explicit
+				routing=dict(self._routing, output_channels=self._output_channels(self._source.channels)),
+			)
+		finally:
+			self._cleanup_resources()
+		return {"parallel": True, "segments": segments, "preroll_frames": preroll}
+
+
+	#ASYNC
+	# fiecare bloc e procesat ca job separat in executor, deci mai multe
+	# sesiuni din acelasi event loop se intercaleaza bloc cu bloc
+	# iar urmatorul bloc e citit doar cand consumatorul il cere (backpressure)
+	# example:
+	# async for block in engine.stream():
+	#     await websocket.send(block.tobytes())
+	async def stream(self, frames=None, executor=None, on_chunk=None):
+		if not self._built:
+			self.build(consumer=self._output is not None)
+		
+		import asyncio
+		
+		loop = asyncio.get_running_loop()
+		
+		if self._paused:
+			self._resume_io()
+		self._should_stop = False
+		self._finished.clear()
+		
+		# la anulare thread-ul din executor nu poate fi oprit: jobul in curs e asteptat
+		# (shield il pastreaza neanulat) inainte ca sursa sa fie inchisa
+		pending = None
+		try:
+			while not self._should_stop:
+				pending = loop.run_in_executor(executor, self._next_block, frames or self.blocksize, on_chunk)
+				buf = await asyncio.shield(pending)
+				if buf is None:
+					break
+				if buf.size == 0:
+					continue
+				yield buf
+		finally:
+			if pending is not None and not pending.done():
+				await asyncio.wait([pending])
+			self._cleanup_resources()
+
+	# echivalentul async pentru start(): DSP-ul ruleaza in executor,
+	# event loop-ul nu e blocat
+	async def render_async(self, frames=None, duration=None, on_chunk=None, executor=None):
+		self._ensure_built()
+		
+		import asyncio
+		
+		loop = asyncio.get_running_loop()
+		start_time = loop.time()
+		
+		blocks = self.stream(frames, executor=executor, on_chunk=on_chunk)
+		try:
+			async for _ in blocks:
+				if duration and (loop.time() - start_time) >= duration:
+					break
+		finally:
+			await blocks.aclose()
+
+	# cere oprirea si asteapta (fara sa blocheze loop-ul) eliberarea resurselor
+	async def stop_async(self, timeout=None):
+		self.stop()
+		import asyncio
+		
+		loop = asyncio.get_running_loop()
+		return await loop.run_in_executor(None, self._finished.wait, timeout)
+
 	def is_running(self):
 		return self._built and not self._should_stop
 
@@ -228,44 +853,554 @@ class AudioEngine:
 	def _create_source(self):
 		cfg = self._input
 		if cfg["kind"] == "file":
+			from .sources.file_source import FileSource
 			return FileSource(cfg["path"])
+		if cfg["kind"] == "array":
+			from .sources.array_source import ArraySource
+			return ArraySource(cfg["data"], cfg["samplerate"])
+		if cfg["kind"] == "iter":
+			from .sources.array_source import IterSource
+			return IterSource(cfg["data"], cfg["samplerate"])
+		if cfg["kind"] == "network":
+			from .sources.network_source import NetworkSource
+			return NetworkSource(
+				host=cfg["host"],
+				port=cfg["port"],
+				protocol=cfg["protocol"],
+				samplerate=cfg["samplerate"],
+				channels=cfg["channels"],
+				latency_ms=cfg["latency_ms"],
+				buffer_dtype=cfg["buffer_dtype"],
+			)
+		
+		from .sources.live_source import LiveSource
+		tuned = self._tuner is not None
+		
+		# o captura noua la fiecare build; cea veche (deja oprita) e inchisa
+		self.close_capture()
+		if cfg.get("capture_seconds"):
+			from .utils.capture import CaptureWriter
+			self._capture = CaptureWriter(
+				samplerate=cfg["samplerate"],
+				channels=cfg["channels"],
+				seconds=cfg["capture_seconds"],
+				path=cfg.get("capture_path"),
+				dtype=cfg.get("capture_dtype", "float32"),
+			)
 		
 		return LiveSource(
 			samplerate=cfg["samplerate"],
 			channels=cfg["channels"],
-			blocksize=cfg["blocksize"],
+			blocksize=self.blocksize if tuned else cfg["blocksize"],
 			device=cfg.get("device"),
 			buffer_seconds=cfg["buffer_seconds"],
+			capacity_frames=self._tuner.buffer_frames if tuned else None,
+			buffer_dtype=cfg["buffer_dtype"],
+			capture=self._capture,
+			drift_compensation=cfg.get("drift_compensation", False),
+			overflow=cfg.get("overflow", "drop_oldest"),
+			max_buffer_seconds=cfg.get("max_buffer_seconds"),
+			underrun=cfg.get("underrun", "block"),
+			underrun_timeout=cfg.get("underrun_timeout"),
+			pool=self._streams(),
+			should_stop=lambda: self._should_stop,
 		)
 
-	def _create_consumer(self, samplerate, channels):
+	def _create_consumer(self, samplerate, channels, resume_frames=None):
 		cfg = self._output
 		sr = cfg.get("samplerate") or samplerate
 		ch = cfg.get("channels") or channels
 		
 		if cfg["kind"] == "file":
-			return FileConsumer(filename=cfg["path"], samplerate=sr, channels=ch)
+			from .consumers.file_consumer import FileConsumer
+			return FileConsumer(filename=cfg["path"], samplerate=sr, channels=ch, resume_frames=resume_frames)
+		if cfg["kind"] == "array":
+			from .consumers.array_consumer import ArrayConsumer
+			return ArrayConsumer(channels=ch, out=cfg["out"])
+		if cfg["kind"] == "network":
+			from .consumers.network_consumer import NetworkConsumer
+			return NetworkConsumer(
+				host=cfg["host"],
+				port=cfg["port"],
+				protocol=cfg["protocol"],
+				samplerate=sr,
+				channels=ch,
+				batch_blocks=cfg["batch_blocks"],
+			)
 		
+		from .consumers.live_consumer import LiveConsumer
 		return LiveConsumer(
 			samplerate=sr,
 			channels=ch,
-			blocksize=cfg.get("blocksize", self.blocksize),
+			blocksize=self.blocksize if self._tuner is not None else cfg.get("blocksize", self.blocksize),
 			device=cfg.get("device"),
+			pool=self._streams(),
 		)
 
+	# stream-urile live eliberate la stop raman deschise pentru urmatorul build
+	def _streams(self):
+		if self._stream_pool is None:
+			from .utils.stream_pool import StreamPool
+			self._stream_pool = StreamPool()
+		return self._stream_pool
+
+	# pauza: doar stream-urile live sunt oprite, restul resurselor raman
+	def _pause_io(self):
+		for comp in (self._source, self._consumer):
+			pause = getattr(comp, "pause", None)
+			if pause is not None:
+				pause()
+		self._paused = True
+		self._finished.set()
+
+	def _resume_io(self):
+		self._paused = False
+		for comp in (self._source, self._consumer):
+			resume = getattr(comp, "resume", None)
+			if resume is not None:
+				resume()
+
+	# configuratia I/O s-a schimbat: resursele pastrate la pause() nu mai sunt valide
+	def _discard_paused(self):
+		if self._paused:
+			self._cleanup_resources()
+
 	def _ensure_built(self):
 		if not self._built:
 			self.build()
 
-	def _process_buffer(self, buf):
+	# citeste, proceseaza si scrie un bloc
+	# dupa sfarsitul input-ului scrie coada efectelor (daca flush_tails); la input
+	# offline cel putin latenta lantului, ca iesirea sa aiba lungimea input-ului
+	# returneaza None cand nu mai e nimic de scris
+	def _next_block(self, chunk, on_chunk=None):
+		if self._tail is None:
+			buf = self._source.read(chunk)
+			if buf.size == 0:
+				# read() intrerupt de stop() / pause(): nu e sfarsitul input-ului
+				if self._should_stop:
+					return None
+				offline = self._input["kind"] in ("file", "array", "iter")
+				if not self.flush_tails and not offline:
+					return None
+				channels = getattr(self._source, "channels", self.channels)
+				# dupa resume coada continua de unde a ramas
+				self._tail = self._tail_blocks(chunk, self.get_samplerate(), channels,
+											   tail=self.flush_tails, latency=offline, flushed=self._tail_frames)
+			else:
+				self._frames_in += buf.shape[0]
+				if self._tuner is not None:
+					start = time.perf_counter()
+					buf = self._process_buffer(buf)
+					self._autotune_step(buf.shape[0], time.perf_counter() - start)
+				else:
+					buf = self._process_buffer(buf)
+		
+		if self._tail is not None:
+			buf = next(self._tail, None)
+			if buf is None:
+				return None
+			self._tail_frames += buf.shape[0]
+		
+		# primele frame-uri sunt doar latenta lantului (un bloc gol e sarit)
+		if self._skip:
+			skip = min(self._skip, buf.shape[0])
+			self._skip -= skip
+			buf = buf[skip:]
+			if buf.size == 0:
+				return buf
+
+		if on_chunk:
+			on_chunk(buf)
+		
+		self._bus.publish(buf)
+		
+		if self._consumer is not None:
+			self._consumer.write(buf)
+			self._frames_out += buf.shape[0]
+		return buf
+
+	# etapele de mix (sursa -> lant, lant -> output) pentru o sursa cu `channels` canale
+	# None unde numarul de canale nu se schimba; calculate o data per numar de canale
+	def _routing_for(self, channels):
+		if channels in self._routers:
+			return self._routers[channels]
+		
+		from .utils.routing import ChannelRouter, mix_matrix
+		
+		routing = self._routing
+		chain_channels = routing.get("chain_channels") or channels
+		outputs = self._output_channels(channels)
+		
+		chain = None
+		if chain_channels != channels:
+			chain = ChannelRouter(mix_matrix(channels, chain_channels))
+		
+		output = None
+		if routing.get("matrix") is not None:
+			output = ChannelRouter(routing["matrix"])
+			if output.inputs != chain_channels or output.outputs != outputs:
+				raise ValueError(f"Routing matrix must be {outputs} x {chain_channels}, "
+								 f"got {output.outputs} x {output.inputs}")
+		elif routing.get("preset") is not None or outputs != chain_channels:
+			output = ChannelRouter(mix_matrix(chain_channels, outputs, routing.get("preset")))
+		
+		self._routers[channels] = (chain, output)
+		return chain, output
+	
+	# canalele de iesire pentru o sursa cu `channels` canale
+	def _output_channels(self, channels):
+		routing = self._routing
+		if routing.get("output_channels"):
+			return routing["output_channels"]
+		if routing.get("matrix") is not None:
+			return len(routing["matrix"])
+		if routing.get("preset") is not None:
+			from .utils.routing import MIX_PRESETS
+			return len(MIX_PRESETS[routing["preset"]])
+		return (self._output or {}).get("channels") or channels
+
+	# lantul de efecte plus corectia de loudness si limiter-ul de iesire, in ordinea
+	# procesarii (mixul de output e intre efecte si corectie, vezi _run_chain);
+	# in prima trecere a normalizarii doar efectele
+	def _stages(self):
+		stages = list(self._effects)
+		if self._measuring:
+			return stages
+		if self._normalize_gain is not None:
+			stages.append(self._normalize_gain)
+		limiter = self.get_limiter()
+		if limiter is not None:
+			stages.append(limiter)
+		return stages
+
+	# starea initiala pentru toate etapele (linii de delay, cozi, lookahead-ul limiter-ului)
+	def _reset_chain(self):
+		for eff in self._stages():
+			eff.reset()
+		self._timeline = 0
+
+	def _chain_changed(self):
+		if self._tuner is not None:
+			self._tuner.invalidate()
+
+	# load-ul real dupa fiecare bloc; re-masurare in fundal daca lantul s-a schimbat
+	# (copia lantului e facuta aici, pe thread-ul audio, intre doua blocuri)
+	def _autotune_step(self, frames, elapsed):
+		samplerate = self.get_samplerate()
+		if self._tuner.dirty:
+			channels = getattr(self._source, "channels", self.channels)
+			self._tuner.tune_async(self._stages(), samplerate, channels)
+		self._tuner.observe(frames, elapsed, samplerate)
+		
+		blocksize = self._tuner.blocksize
+		# blocul citit trebuie sa incapa de cel putin doua ori in buffer-ul sursei live
+		ring = getattr(self._source, "ring_buffer", None)
+		if ring is not None:
+			blocksize = min(blocksize, ring.capacity // 2)
+		self.blocksize = blocksize
+
+	def _iter_source(self, source, chunk, tail):
+		samplerate = source.samplerate
+		self._timeline = 0
+		skip = self._output_latency(samplerate)
+		for buf in self._iter_blocks(source, chunk, tail):
+			if skip:
+				n = min(skip, buf.shape[0])
+				skip -= n
+				buf = buf[n:]
+				if buf.size == 0:
+					continue
+			yield buf
+
+	def _iter_blocks(self, source, chunk, tail):
+		samplerate = source.samplerate
+		while True:
+			buf = source.read(chunk)
+			if buf.size == 0:
+				break
+			yield self._process_buffer(buf, samplerate)
+		
+		yield from self._tail_blocks(chunk, samplerate, source.channels, tail=tail)
+
+	# frame-uri de intarziere introduse de lant (lookahead-ul limiter-ului, STFT)
+	def _output_latency(self, samplerate):
+		return sum(eff.latency_frames(samplerate) for eff in self._stages())
+
+	# blocuri de liniste trecute prin lant pana se termina cozile efectelor:
+	# pana cand toate efectele sunt inactive, cel mult suma tail_frames (tail=True)
+	# latency=True: intai exact latenta lantului, indiferent de tail si de is_idle
+	# (frame-urile scoase la inceputul iesirii offline sunt recuperate la final)
+	def _tail_blocks(self, chunk, samplerate, channels, tail=True, latency=True, flushed=0):
+		import numpy as np
+		
+		threshold = self.silence_threshold
+		stages = self._stages()
+		minimum = self._output_latency(samplerate) if latency else 0
+		limit = max(minimum, sum(eff.tail_frames(samplerate) for eff in stages)) if tail else minimum
+		silence = np.zeros((chunk, channels), dtype=np.float32)
+		while flushed < limit:
+			if flushed >= minimum and threshold and all(eff.is_idle(threshold) for eff in stages):
+				break
+			n = min(chunk, limit - flushed)
+			if flushed < minimum:
+				n = min(n, minimum - flushed)
+			yield self._process_buffer(silence[:n], samplerate)
+			flushed += n
+
+	def _process_buffer(self, buf, samplerate=None):
 		if buf.ndim == 1:
 			buf = buf[:, None]
 		
-		for eff in self._effects:
-			buf = eff.apply(buf, getattr(self._source, "samplerate", self.samplerate))
+		if samplerate is None:
+			samplerate = self.get_samplerate()
+		
+		chain, output = self._routing_for(buf.shape[1])
+		if chain is not None:
+			# fara etapa de output blocul poate iesi din engine: nu e refolosit
+			buf = chain.apply(buf, reuse=output is not None)
+		
+		if not self._automation:
+			return self._run_chain(buf, samplerate, output, self._reuse_output)
+		
+		position = self._timeline
+		self._timeline += buf.shape[0]
+		return self._run_automated(buf, samplerate, position, output, self._reuse_output)
+
+	# blocul e impartit doar unde un parametru per bloc sare (curba "step")
+	def _run_automated(self, buf, samplerate, position, output=None, reuse=False):
+		import numpy as np
+		
+		frames = buf.shape[0]
+		cuts = set()
+		for effect, curves in self._automation.items():
+			for name, curve in curves.items():
+				if name not in effect.sample_params:
+					cuts.update(curve.steps(position, frames, samplerate))
+		if cuts:
+			bounds = [0] + sorted(cuts) + [frames]
+			# bucatile sunt concatenate: rutarea nu-si poate refolosi buffer-ul
+			return np.concatenate([
+				self._run_automated(buf[start:end], samplerate, position + start, output)
+				for start, end in zip(bounds[:-1], bounds[1:])
+			], axis=0)
 		
+		for effect, curves in self._automation.items():
+			for name, curve in curves.items():
+				if name in effect.sample_params:
+					setattr(effect, name, curve.block(position, frames, samplerate))
+				else:
+					setattr(effect, name, curve.value_at(position, samplerate))
+		try:
+			return self._run_chain(buf, samplerate, output, reuse)
+		finally:
+			# intre blocuri parametrii raman scalari (params(), GUI, checkpoint)
+			for effect, curves in self._automation.items():
+				for name in curves:
+					value = getattr(effect, name)
+					if np.ndim(value):
+						setattr(effect, name, float(value[-1]))
+
+	# output: mixul lant -> output, aplicat dupa efecte si inaintea corectiei de loudness
+	# si a limiter-ului (ceiling-ul ramane respectat si dupa un downmix)
+	def _run_chain(self, buf, samplerate, output=None, reuse=False):
+		import numpy as np
+		
+		# liniste la intrare: efectele inactive sunt sarite (doar isi avanseaza timpul),
+		# pana la primul efect care mai are semnal in stare (ex. coada unui reverb)
+		# blocul nu e inlocuit cu zero: esantioanele sub prag trec neschimbate, iar
+		# efectele cu latenta sunt sarite doar pe zero exact si cu linia de intarziere
+		# goala (altfel blocul ar ocoli intarzierea, iar is_idle(threshold) ar sterge
+		# esantioanele sub prag aflate inca in ea)
+		threshold = self.silence_threshold
+		silent = bool(threshold) and buf.size > 0 and buf.max() < threshold and buf.min() > -threshold
+		zero = silent and not buf.any()
+		empty = np.finfo(np.float32).tiny
+		
+		frames = buf.shape[0]
+		planar = False
+		stages = self._stages()
+		if output is not None:
+			stages.insert(len(self._effects), output)
+		for eff in stages:
+			if eff is output:
+				if planar:
+					buf = np.ascontiguousarray(buf.T)
+					planar = False
+				buf = output.apply(buf, reuse=reuse)
+				continue
+			if silent:
+				if eff.latency_frames(samplerate):
+					idle = zero and eff.is_idle(empty)
+				else:
+					idle = eff.is_idle(threshold)
+				if idle:
+					eff.advance(frames, samplerate)
+					continue
+			silent = False
+			if self.planar and eff.supports_planar:
+				if not planar:
+					buf = np.ascontiguousarray(buf.T)
+					planar = True
+				buf = eff.apply_planar(buf, samplerate)
+			else:
+				if planar:
+					buf = np.ascontiguousarray(buf.T)
+					planar = False
+				buf = eff.apply(buf, samplerate)
+		
+		if planar:
+			buf = np.ascontiguousarray(buf.T)
 		return buf
 	
+	# descrierea input-ului si a lantului; un checkpoint e valid doar pentru aceeasi
+	def _chain_signature(self):
+		signature = []
+		for eff in self._stages():
+			params = eff.params()
+			# parametrii automatizati sunt descrisi prin curba, nu prin valoarea curenta
+			for name, curve in self._automation.get(eff, {}).items():
+				params[name] = curve.describe()
+			signature.append([eff.__class__.__name__, params])
+		return signature
+
+	def _checkpoint_signature(self):
+		signature = self._file_signature(self._input["path"])
+		signature["effects"] = self._chain_signature()
+		signature["routing"] = self._routing
+		# normalizat prin JSON ca sa fie comparabil cu cel citit din fisier
+		return json.loads(json.dumps(signature))
+	
+	def _file_signature(self, path):
+		stat = os.stat(path)
+		return {"input": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+	
+	# cheia masuratorii de loudness: un array e identificat prin continut
+	def _loudness_signature(self, channels):
+		cfg = self._input
+		if cfg["kind"] == "file":
+			signature = self._file_signature(cfg["path"])
+		else:
+			import hashlib
+			import numpy as np
+			
+			data = np.ascontiguousarray(cfg["data"])
+			signature = {
+				"sha1": hashlib.sha1(data).hexdigest(),
+				"shape": list(data.shape),
+				"dtype": str(data.dtype),
+				"samplerate": cfg["samplerate"],
+			}
+		signature["effects"] = self._chain_signature()
+		signature["routing"] = self._routing
+		signature["channels"] = self._output_channels(channels)
+		signature["flush_tails"] = self.flush_tails
+		return json.dumps(signature, sort_keys=True)
+	
+	# prima trecere: loudness-ul integrat al lantului (fara corectie, fara limiter),
+	# pe o sursa separata; dupa ea starea efectelor e resetata
+	def _normalize(self, samplerate, channels):
+		if self._input["kind"] not in ("file", "array"):
+			raise ValueError("Loudness normalization needs file or array input")
+		
+		from .effects.gain import GainEffect
+		
+		cfg = self._normalization
+		cache_path = cfg["cache_path"]
+		if cache_path and os.path.exists(cache_path):
+			with open(cache_path) as f:
+				self._loudness_cache.update(json.load(f))
+		
+		self._measuring = True
+		try:
+			key = self._loudness_signature(channels)
+			cached = key in self._loudness_cache
+			elapsed = 0.0
+			if not cached:
+				start = time.perf_counter()
+				self._loudness_cache[key] = self._measure_loudness(samplerate)
+				elapsed = time.perf_counter() - start
+				if cache_path:
+					with open(cache_path, "w") as f:
+						json.dump(self._loudness_cache, f)
+		finally:
+			self._measuring = False
+		
+		measured = self._loudness_cache[key]
+		gain_db = 0.0 if measured is None else cfg["target_lufs"] - measured
+		self._normalize_gain = GainEffect(gain_db=gain_db)
+		self._loudness_report = {
+			"target_lufs": cfg["target_lufs"],
+			"measured_lufs": measured,
+			"gain_db": gain_db,
+			"cached": cached,
+			"measure_seconds": elapsed,
+		}
+	
+	def _measure_loudness(self, samplerate):
+		import math
+		from .analysis.loudness import LoudnessMeter
+		
+		meter = LoudnessMeter(samplerate)
+		source = self._create_source()
+		try:
+			for buf in self._iter_source(source, self.blocksize, self.flush_tails):
+				meter(buf)
+		finally:
+			if hasattr(source, "close"):
+				source.close()
+		
+		self._reset_chain()
+		loudness = meter.integrated()
+		return loudness if math.isfinite(loudness) else None
+
+	# reia starea din checkpoint daca exista; returneaza True la resume
+	def _restore_checkpoint(self):
+		path = self._output.get("checkpoint")
+		if not path:
+			return False
+		if self._input["kind"] != "file" or self._output["kind"] != "file":
+			raise ValueError("Checkpoints need file input and file output")
+		if not os.path.exists(path):
+			return False
+		
+		from .utils.checkpoint import load_checkpoint
+		stages = self._stages()
+		meta, states = load_checkpoint(path, len(stages))
+		if meta["signature"] != self._checkpoint_signature():
+			raise ValueError(f"Checkpoint {path} does not match the current input and effect chain")
+		
+		self._source.seek(meta["frames_in"])
+		for eff, state in zip(stages, states):
+			eff.set_state(state)
+		self._frames_in = meta["frames_in"]
+		self._frames_out = meta["frames_out"]
+		self._timeline = meta.get("timeline", meta["frames_in"])
+		self._skip = meta.get("skip", 0)
+		self._tail_frames = meta.get("tail_frames", 0)
+		return True
+
+	# pozitiile si starea efectelor intre doua blocuri (copii, get_state nu partajeaza buffere)
+	def _checkpoint_snapshot(self):
+		meta = {
+			"signature": self._checkpoint_signature(),
+			"frames_in": self._frames_in,
+			"frames_out": self._frames_out,
+			"timeline": self._timeline,
+			"skip": self._skip,
+			"tail_frames": self._tail_frames,
+		}
+		return meta, [eff.get_state() for eff in self._stages()]
+
+	# snapshot: unul luat anterior la granita unui bloc; implicit starea curenta
+	# output-ul poate avea frame-uri dupa frames_out: la resume sunt taiate
+	def _save_checkpoint(self, snapshot=None):
+		from .utils.checkpoint import save_checkpoint
+		
+		self._consumer.flush()
+		meta, states = snapshot or self._checkpoint_snapshot()
+		save_checkpoint(self._output["checkpoint"], meta, states)
+
 	def _cleanup_resources(self):
 		for comp in [self._source, self._consumer]:
 			if comp and hasattr(comp, "close"):
@@ -273,9 +1408,17 @@ class AudioEngine:
 					comp.close()
 				except Exception:
 					pass
+		# captura nu mai primeste date, dar ramane exportabila pana la urmatorul build
+		if self._capture is not None:
+			self._capture.stop()
 		self._source = None
 		self._consumer = None
+		self._tail = None
+		# corectia e valida doar pentru input-ul masurat la build
+		self._normalize_gain = None
 		self._built = False
+		self._paused = False
+		self._finished.set()
 
 
 
@@ -284,3 +1427,4 @@ class AudioEngine:
 
 	def __exit__(self, *args):
 		self.stop()
+		self.close_streams()
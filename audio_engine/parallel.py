@@ -0,0 +1,119 @@
+import collections
+import concurrent.futures
+import os
+import numpy as np
+
+
+def chain_memory_frames(effects, samplerate: int) -> int | None:
+    """
+    Pre-roll-ul necesar pentru un lant: suma memoriilor efectelor
+    (starea unui efect depinde de iesirea celor dinaintea lui)
+    None daca vreun efect nu declara o memorie finita
+    """
+    total = 0
+    for eff in effects:
+        memory = eff.memory_frames(samplerate)
+        if memory is None:
+            return None
+        total += int(memory)
+    return total
+
+
+def render_segment(path: str, start: int, end: int, preroll: int, effects: list, blocksize: int,
+                   silence_threshold: float | None = None, tail: bool = False, planar: bool = False,
+                   routing: dict | None = None, last: bool = False, normalize=None, limiter=None) -> np.ndarray:
+    """
+    Ruleaza intr-un proces din pool: randeaza frame-urile [start, end) dintr-un fisier
+    Lantul porneste de la starea initiala cu `preroll` frame-uri inainte de start,
+    ca efectele cu stare sa convearga; iesirea pentru pre-roll e aruncata
+    Blocurile trec prin AudioEngine (detectie de liniste, coada la tail=True),
+    la fel ca in render-ul serial; ultimul segment (last) se incheie cu latenta
+    lantului, scoasa din inceputul iesirii
+    normalize / limiter: corectia de loudness si limiter-ul engine-ului principal,
+    aplicate dupa mixul de output ca in render-ul serial
+    """
+    from .engine import AudioEngine
+    from .sources.file_source import FileSource
+
+    engine = AudioEngine(blocksize=blocksize, silence_threshold=silence_threshold, planar=planar)
+    if limiter is None:
+        engine.disable_limiter()
+    else:
+        engine.enable_limiter(**limiter.params())
+    if routing:
+        engine.set_routing(**routing)
+    for eff in effects:
+        eff.reset()
+        engine.add_effect(eff)
+    if normalize is not None:
+        normalize.reset()
+        engine._normalize_gain = normalize
+
+    source = FileSource(path)
+    try:
+        samplerate = source.samplerate
+        pos = max(0, start - preroll)
+        source.seek(pos)
+
+        parts = []
+        while pos < end:
+            buf = source.read(min(blocksize, end - pos))
+            if buf.size == 0:
+                break
+            buf = engine._process_buffer(buf, samplerate)
+
+            skip = max(0, start - pos)
+            pos += buf.shape[0]
+            if skip < buf.shape[0]:
+                parts.append(buf[skip:])
+
+        if last:
+            parts.extend(engine._tail_blocks(blocksize, samplerate, source.channels, tail=tail))
+        if not parts:
+            return np.empty((0, engine._output_channels(source.channels)), dtype=np.float32)
+        return np.concatenate(parts, axis=0)
+    finally:
+        source.close()
+
+
+def render_file_parallel(path: str, total_frames: int, samplerate: int, effects: list, consumer,
+                         blocksize: int, segment_frames: int, preroll: int, workers: int | None = None,
+                         silence_threshold: float | None = None, flush_tails: bool = False,
+                         latency: int = 0, planar: bool = False, routing: dict | None = None,
+                         normalize=None, limiter=None) -> int:
+    """
+    Imparte fisierul in segmente, le randeaza pe un process pool si le scrie in ordine
+    Cel mult 2 * workers segmente sunt in zbor, ca memoria sa ramana limitata
+    Ultimul segment se incheie cu latenta lantului si, daca flush_tails, cu coada efectelor
+    Primele `latency` frame-uri (latenta lantului) nu sunt scrise,
+    la fel ca in render-ul serial
+    returneaza numarul de segmente
+    """
+    bounds = [(start, min(total_frames, start + segment_frames)) for start in range(0, total_frames, segment_frames)]
+    workers = workers or os.cpu_count() or 1
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        window = 2 * workers
+        pending = collections.deque()
+        segments = iter(bounds)
+
+        def submit_next():
+            bound = next(segments, None)
+            if bound is not None:
+                last = bound[1] == total_frames
+                pending.append(pool.submit(render_segment, path, bound[0], bound[1], preroll, effects, blocksize,
+                                           silence_threshold, flush_tails, planar, routing, last,
+                                           normalize, limiter))
+
+        for _ in range(window):
+            submit_next()
+        while pending:
+            buf = pending.popleft().result()
+            if latency:
+                skip = min(latency, buf.shape[0])
+                latency -= skip
+                buf = buf[skip:]
+            consumer.write(buf)
+            submit_next()
+
+    return len(bounds)
@@ -0,0 +1,403 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from .engine import AudioEngine
+from .utils.shared_ring_buffer import SharedRingBuffer
+from .utils.xrun import XrunMonitor
+
+
+# cat de des trimite procesul DSP statisticile (secunde)
+STATS_INTERVAL = 0.5
+# cat asteapta parintele oprirea procesului DSP inainte sa-l termine fortat
+SHUTDOWN_TIMEOUT = 5.0
+
+
+class ProcessEngine(AudioEngine):
+    """
+    AudioEngine cu bucla DSP intr-un proces separat (multiprocessing "spawn")
+
+    Configurarea (input, output, lant, limiter, rutare, automatizare, autotune,
+    normalizare) se face ca la AudioEngine, in procesul curent; build() porneste
+    procesul DSP cu o copie a ei
+    Blocurile procesate ajung inapoi printr-un SharedRingBuffer si sunt publicate pe
+    bus-ul de analiza local (meter-ele raman in procesul GUI), fara sa incetineasca
+    procesul DSP: scrierea nu asteapta niciodata dupa cititor
+    start/stop, set_effect_params si editarea lantului sunt trimise pe un Pipe si
+    aplicate intre blocuri; restul configurarii se aplica la urmatorul build()
+
+    Thread-urile procesului curent (GUI, logging) nu mai concureaza cu bucla audio
+    pentru GIL. Input-ul "iter" trebuie sa fie picklable, iar output-ul "array" nu
+    e suportat (ramane in procesul DSP)
+    """
+
+    def __init__(self, *args, ring_seconds: float = 0.5, xrun_latency_blocks: int = 2, **kwargs):
+        """
+            ring_seconds: Capacitatea ring-ului procesat -> proces curent (secunde)
+            xrun_latency_blocks: Buffer-ul device-ului de output presupus la numararea
+                xrun-urilor (blocuri), vezi XrunMonitor
+            restul argumentelor: ca la AudioEngine
+        """
+        super().__init__(*args, **kwargs)
+        if ring_seconds <= 0:
+            raise ValueError("ring_seconds must be > 0")
+        self.ring_seconds = ring_seconds
+        self.xrun_latency_blocks = xrun_latency_blocks
+
+        self._ctx = multiprocessing.get_context("spawn")
+        self._process = None
+        self._conn = None
+        self._ring = None
+        self._send_lock = threading.Lock()
+        # ce a raportat procesul DSP la build (samplerate, canale, blocksize, autotune)
+        self._remote = {}
+        self._process_stats = None
+
+    #INFO
+    def get_samplerate(self):
+        return self._remote.get("samplerate") or super().get_samplerate()
+
+    def get_autotune_report(self):
+        if "autotune" in self._remote:
+            return self._remote["autotune"]
+        return super().get_autotune_report()
+
+    def get_loudness_report(self):
+        if "loudness" in self._remote:
+            return self._remote["loudness"]
+        return super().get_loudness_report()
+
+    def get_input_stats(self):
+        return (self._process_stats or {}).get("input")
+
+    def get_output_stats(self):
+        return (self._process_stats or {}).get("output")
+
+    def get_drift_info(self):
+        return (self._process_stats or {}).get("drift")
+
+    # return format:
+    # { "pid": 1234, "blocks": 9000, "xruns": 0, "max_late_ms": 1.8, "latency_ms": 10.7,
+    #   "skipped": 0, "input": {...}, "output": {...}, "drift": None }
+    # actualizat la fiecare STATS_INTERVAL cat ruleaza; None inainte de primul bloc
+    def get_process_stats(self):
+        if self._process_stats is None:
+            return None
+        return dict(self._process_stats)
+
+    #EFFECTS
+    # editarile lantului sunt trimise si procesului DSP (daca ruleaza)
+    def add_effect(self, effect, oversample=None, **kwargs):
+        super().add_effect(effect, oversample=oversample, **kwargs)
+        self._send("add_effect", self._effects[-1])
+        return self
+
+    def clear_effects(self):
+        super().clear_effects()
+        self._send("clear_effects")
+
+    def remove_effect(self, index: int):
+        super().remove_effect(index)
+        self._send("remove_effect", index)
+
+    def reorder_effects(self, old_index: int, new_index: int):
+        super().reorder_effects(old_index, new_index)
+        self._send("reorder_effects", (old_index, new_index))
+
+    def set_effect_params(self, index: int, **params):
+        super().set_effect_params(index, **params)
+        self._send("set_effect_params", (index, params))
+        return self
+
+    #BUILD, RUN
+    def build(self, consumer=True):
+        if not self._input:
+            raise ValueError()
+        if consumer and (self._output or {}).get("kind") == "array":
+            raise ValueError("array output is not supported out of process, use AudioEngine")
+        self._shutdown()
+
+        conn, child_conn = self._ctx.Pipe()
+        condition = self._ctx.Condition()
+        self._process = self._ctx.Process(
+            target=_engine_main,
+            args=(self._remote_config(consumer), child_conn, condition),
+            name="AudioEngineDSP",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = conn
+
+        try:
+            _, self._remote = self._receive()
+            # masuratorile din prima trecere raman in cache-ul parintelui pentru urmatorul build
+            self._loudness_cache.update(self._remote.pop("loudness_cache"))
+            capacity = max(4 * self._remote["blocksize"], int(self.ring_seconds * self._remote["samplerate"]))
+            self._ring = SharedRingBuffer(capacity, self._remote["channels"], condition=condition)
+            self._send("ring", self._ring.spec())
+        except BaseException:
+            self._shutdown()
+            raise
+        self.blocksize = self._remote["blocksize"]
+        self._built = True
+        return self
+
+    # blocheaza pana se opreste procesul DSP; on_chunk primeste blocurile procesate
+    # in procesul curent (monitorizare), valide doar in timpul apelului
+    # dupa pause() procesul DSP continua cu aceeasi sursa, acelasi output si aceeasi stare
+    def start(self, frames=None, duration=None, on_chunk=None):
+        self._ensure_built()
+        self._should_stop = False
+        self._pause_requested = False
+        self._paused = False
+        self._finished.clear()
+        paused = False
+        try:
+            self._send("start", {"frames": frames, "duration": duration})
+            paused = self._pump(on_chunk)
+        finally:
+            if paused:
+                self._paused = True
+                self._finished.set()
+            else:
+                self._shutdown()
+
+    def stop(self):
+        self._should_stop = True
+        self._send("stop")
+
+    # procesul DSP ramane pornit, cu stream-urile deschise (oprite)
+    def pause(self):
+        super().pause()
+        self._send("pause")
+
+    #INTERNAL
+    def _remote_config(self, consumer):
+        tuner = self._tuner
+        return {
+            "init": {
+                "samplerate": self.samplerate,
+                "channels": self.channels,
+                "blocksize": self.blocksize,
+                "silence_threshold": self.silence_threshold,
+                "flush_tails": self.flush_tails,
+                "planar": self.planar,
+            },
+            "consumer": consumer,
+            "input": self._input,
+            "output": self._output,
+            # in acelasi pickle: cheile automatizarii raman efectele din lant
+            "effects": self._effects,
+            "automation": self._automation,
+            "limiter": self._limiter_params,
+            "normalization": self._normalization,
+            "loudness_cache": self._loudness_cache,
+            "routing": self._routing,
+            "autotune": None if tuner is None else {"target_load": tuner.target_load, "candidates": tuner.candidates},
+            "xrun_latency_blocks": self.xrun_latency_blocks,
+        }
+
+    def _send(self, kind, payload=None):
+        with self._send_lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.send((kind, payload))
+            except OSError:
+                # procesul DSP s-a oprit deja
+                pass
+
+    # urmatorul mesaj de la procesul DSP, None daca nu vine in `timeout` secunde
+    # o eroare din procesul DSP e ridicata aici
+    def _receive(self, timeout=None):
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while not self._conn.poll(0.1 if timeout is None else min(0.1, timeout)):
+            if not self._process.is_alive() and not self._conn.poll():
+                raise RuntimeError(f"DSP process exited (code {self._process.exitcode})")
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+        kind, payload = self._conn.recv()
+        if kind == "error":
+            raise payload
+        return kind, payload
+
+    # copiaza blocurile din ring pe bus pana la mesajul "stopped" / "paused" si golirea
+    # ring-ului; returneaza True la pauza
+    def _pump(self, on_chunk):
+        blocksize = self._remote["blocksize"]
+        out = np.empty((blocksize, self._remote["channels"]), dtype=np.float32)
+        ended = None
+        while True:
+            block = self._ring.read(blocksize, timeout=0.05, out=out)
+            if block.shape[0]:
+                if on_chunk:
+                    on_chunk(block)
+                self._bus.publish(block)
+            elif ended is not None:
+                return ended == "paused"
+
+            while ended is None:
+                message = self._receive(0)
+                if message is None:
+                    break
+                kind, self._process_stats = message
+                if kind in ("stopped", "paused"):
+                    ended = kind
+
+    # resursele pastrate la pauza sunt in procesul DSP
+    def _cleanup_resources(self):
+        self._shutdown()
+
+    def _shutdown(self):
+        process, self._process = self._process, None
+        if process is not None:
+            self._send("close")
+            process.join(SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        with self._send_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        if self._ring is not None:
+            self._ring.close(unlink=True)
+            self._ring = None
+        self._remote = {}
+        self._built = False
+        self._paused = False
+        self._finished.set()
+
+
+def _apply(engine, kind, payload):
+    if kind == "add_effect":
+        engine.add_effect(payload)
+    elif kind == "clear_effects":
+        engine.clear_effects()
+    elif kind == "remove_effect":
+        engine.remove_effect(payload)
+    elif kind == "reorder_effects":
+        engine.reorder_effects(*payload)
+    elif kind == "set_effect_params":
+        index, params = payload
+        engine.set_effect_params(index, **params)
+
+
+def _send_error(conn, exc):
+    try:
+        conn.send(("error", exc))
+    except Exception:
+        # exceptia nu e picklable
+        conn.send(("error", RuntimeError(f"{exc.__class__.__name__}: {exc}")))
+
+
+def _engine_main(config, conn, condition):
+    """
+    Procesul DSP: construieste un AudioEngine din configuratia parintelui, scrie
+    blocurile procesate in ring-ul partajat si aplica comenzile primite intre blocuri
+    """
+    engine = AudioEngine(**config["init"])
+    try:
+        engine._input = config["input"]
+        engine._output = config["output"]
+        engine._effects = list(config["effects"])
+        engine._automation = config["automation"]
+        engine._limiter_params = config["limiter"]
+        engine._normalization = config["normalization"]
+        engine._loudness_cache = dict(config["loudness_cache"])
+        engine._routing = config["routing"]
+        if config["autotune"]:
+            engine.enable_autotune(**config["autotune"])
+        engine.build(consumer=config["consumer"])
+    except Exception as exc:
+        _send_error(conn, exc)
+        return
+
+    channels = engine._output_channels(getattr(engine._source, "channels", engine.channels))
+    conn.send(("built", {
+        "pid": os.getpid(),
+        "samplerate": engine.get_samplerate(),
+        "channels": channels,
+        "blocksize": engine.blocksize,
+        "autotune": engine.get_autotune_report(),
+        "loudness": engine.get_loudness_report(),
+        "loudness_cache": engine._loudness_cache,
+    }))
+
+    # comenzile sunt citite pe un thread separat: stop / pause opresc bucla imediat,
+    # restul sunt aplicate intre blocuri (sau imediat, cat bucla nu ruleaza)
+    commands = queue.Queue()
+
+    def listen():
+        while True:
+            try:
+                kind, payload = conn.recv()
+            except (EOFError, OSError):
+                kind, payload = "close", None
+            if kind in ("stop", "close"):
+                engine.stop()
+            elif kind == "pause":
+                engine.pause()
+            if kind not in ("stop", "pause"):
+                commands.put((kind, payload))
+            if kind == "close":
+                return
+
+    threading.Thread(target=listen, name="AudioEngineCommands", daemon=True).start()
+
+    samplerate = engine.get_samplerate()
+    monitor = XrunMonitor(samplerate, config["xrun_latency_blocks"] * engine.blocksize / samplerate)
+    stats = {"pid": os.getpid()}
+    last_stats = time.perf_counter()
+    ring = None
+
+    def on_chunk(buf):
+        nonlocal last_stats
+        monitor.tick(buf.shape[0])
+        ring.try_write(buf)
+        while not commands.empty():
+            _apply(engine, *commands.get())
+
+        now = time.perf_counter()
+        if now - last_stats >= STATS_INTERVAL:
+            last_stats = now
+            stats.update(monitor.stats(), skipped=ring.skipped, input=engine.get_input_stats(),
+                         output=engine.get_output_stats(), drift=engine.get_drift_info())
+            conn.send(("stats", dict(stats)))
+
+    try:
+        while True:
+            # intre build si start (sau in pauza): ring-ul si editarile lantului
+            kind, payload = commands.get()
+            if kind == "close":
+                engine._cleanup_resources()
+                return
+            if kind == "ring":
+                ring = SharedRingBuffer(**payload, condition=condition)
+            elif kind != "start":
+                _apply(engine, kind, payload)
+                continue
+            else:
+                monitor.resync()
+                try:
+                    engine.start(frames=payload["frames"], duration=payload["duration"], on_chunk=on_chunk)
+                except Exception as exc:
+                    _send_error(conn, exc)
+                    return
+
+                # la pauza sursa si consumer-ul raman deschise, procesul asteapta urmatorul start
+                stats.update(monitor.stats(), skipped=ring.skipped)
+                if engine.is_paused():
+                    conn.send(("paused", dict(stats)))
+                    continue
+                # sursa si consumer-ul sunt deja inchise: raman ultimele lor statistici
+                conn.send(("stopped", dict(stats)))
+                return
+    finally:
+        if ring is not None:
+            ring.close()
@@ -0,0 +1,68 @@
+import numpy
+from .source import Source
+
+
+class ArraySource(Source):
+	"""
+	Sursa din memorie: un array numpy (frames,) sau (frames, channels)
+	read() returneaza copii ale blocurilor: efectele pot lucra in loc pe blocul primit
+	(ex. nan_to_num in distortion), iar array-ul caller-ului ramane neschimbat
+	"""
+
+	def __init__(self, data: numpy.ndarray, samplerate: int):
+		data = numpy.asarray(data, dtype=numpy.float32)
+		if data.ndim == 1:
+			data = data[:, None]
+		if data.ndim != 2:
+			raise ValueError("data must be (frames,) or (frames, channels)")
+		if samplerate <= 0:
+			raise ValueError("samplerate must be > 0")
+
+		self._data = data
+		self._pos = 0
+		self.samplerate = samplerate
+		self.channels = data.shape[1]
+
+	def read(self, num_frames: int) -> numpy.ndarray:
+		chunk = self._data[self._pos:self._pos + num_frames].copy()
+		self._pos += chunk.shape[0]
+		return chunk
+
+
+class IterSource(Source):
+	"""
+	Sursa dintr-un iterabil de blocuri (frames,) sau (frames, channels)
+	Fiecare read() returneaza urmatorul bloc (copie, ca la ArraySource), num_frames e ignorat
+	"""
+
+	def __init__(self, blocks, samplerate: int, channels: int | None = None):
+		if samplerate <= 0:
+			raise ValueError("samplerate must be > 0")
+
+		self._blocks = iter(blocks)
+		self._first = None
+		self.samplerate = samplerate
+
+		# canalele se afla din primul bloc daca nu sunt date explicit
+		if channels is None:
+			self._first = self._next()
+			channels = self._first.shape[1] if self._first is not None else 1
+		self.channels = channels
+
+	def _next(self):
+		for block in self._blocks:
+			block = numpy.array(block, dtype=numpy.float32)
+			if block.ndim == 1:
+				block = block[:, None]
+			if block.size:
+				return block
+		return None
+
+	def read(self, num_frames: int) -> numpy.ndarray:
+		if self._first is not None:
+			block, self._first = self._first, None
+		else:
+			block = self._next()
+		if block is None:
+			return numpy.empty((0, self.channels), dtype=numpy.float32)
+		return block
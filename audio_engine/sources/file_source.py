@@ -7,6 +7,7 @@ class FileSource(Source):
 		self.sound_file = soundfile.SoundFile(filename, mode='r')
 		self.samplerate = self.sound_file.samplerate
 		self.channels = self.sound_file.channels
+		self.frames = self.sound_file.frames
 
 	def read(self, num_frames: int) -> numpy.ndarray:
 		data = self.sound_file.read(frames=num_frames, dtype='float32', always_2d=True)
@@ -15,5 +16,11 @@ class FileSource(Source):
 			return numpy.empty((0, self.channels), dtype='float32')
 		return data
 
+	def seek(self, frame: int):
+		self.sound_file.seek(frame)
+
+	def tell(self) -> int:
+		return self.sound_file.tell()
+
 	def close(self):
 		self.sound_file.close()
\ No newline at end of file
@@ -2,9 +2,27 @@ import sounddevice
 import numpy
 from .source import Source
 from ..utils.ring_buffer import RingBuffer
+from ..utils.drift import DriftCompensator
+from ..utils.underrun import UnderrunConcealer, UNDERRUN_POLICIES
 
 
+# underrun="block": cat asteapta read() intre doua verificari ale opririi
+BLOCK_POLL_SECONDS = 0.1
+
 class LiveSource(Source):
+	"""
+	Input de la un device audio: callback-ul scrie in RingBuffer, read() citeste din el
+
+	overflow (buffer plin, consumatorul a ramas in urma): vezi OVERFLOW_POLICIES;
+	"grow" mareste buffer-ul pana la max_buffer_seconds
+	underrun (input-ul nu vine la timp): vezi UNDERRUN_POLICIES; "silence" si "repeat"
+	asteapta cel mult underrun_timeout (implicit durata blocului) si completeaza blocul,
+	deci un stall de moment nu opreste sesiunea
+	Golurile (completate sau frame-uri pierdute la overflow) sunt unite cu un crossfade scurt
+	Cu pool (StreamPool) stream-ul e luat din / returnat in pool in loc sa fie deschis / inchis
+	should_stop: returneaza True cand engine-ul s-a oprit; read() nu mai asteapta input-ul
+	"""
+
 	def __init__(
 		self,
 		samplerate: int = 44100,
@@ -12,18 +30,69 @@ class LiveSource(Source):
 		blocksize: int = 1024,
 		device=None,
 		buffer_seconds: float = 2.0,
+		capacity_frames: int | None = None,
+		buffer_dtype: str = "float32",
+		capture=None,
+		drift_compensation: bool = False,
+		overflow: str = "drop_oldest",
+		max_buffer_seconds: float | None = None,
+		underrun: str = "block",
+		underrun_timeout: float | None = None,
+		pool=None,
+		should_stop=None,
 	):
+		if underrun not in UNDERRUN_POLICIES:
+			raise ValueError(f"Unknown underrun policy: {underrun} (expected one of {', '.join(UNDERRUN_POLICIES)})")
+
 		self.samplerate = samplerate
 		self.channels = channels
 		self._blocksize = blocksize
 
 		# Use smaller buffer (3-4 blocks) instead of 2 seconds for lower latency
-		capacity_frames = max(self._blocksize * 4, int(self.samplerate * buffer_seconds))
-		self.ring_buffer = RingBuffer(capacity_frames=capacity_frames, channels=self.channels)
+		# capacity_frames (ex. ales de autotune) are prioritate fata de buffer_seconds
+		if capacity_frames is None:
+			capacity_frames = max(self._blocksize * 4, int(self.samplerate * buffer_seconds))
+		# buffer_dtype="int16"/"float16" injumatateste memoria pentru ferestre lungi
+		self.ring_buffer = RingBuffer(
+			capacity_frames=capacity_frames,
+			channels=self.channels,
+			dtype=buffer_dtype,
+			overflow=overflow,
+			max_capacity_frames=int(self.samplerate * max_buffer_seconds) if max_buffer_seconds else None,
+		)
+
+		self.underrun = underrun
+		self.underruns = 0
+		self._underrun_timeout = underrun_timeout
+		# la "block" concealer-ul doar uneste datele de dupa un overflow
+		self._concealer = UnderrunConcealer(
+			self.channels, self.samplerate, policy="silence" if underrun == "block" else underrun
+		)
+		self._gaps = []
+		self._closed = False
+		self._should_stop = should_stop
+
+		# capture (CaptureWriter): copie a input-ului pentru captura retroactiva pe disc
+		self.capture = capture
+
+		# drift_compensation: output-ul e pe alt device (alt ceas); citirile sunt
+		# resamplate fin ca buffer-ul sa ramana la jumatate (vezi DriftCompensator)
+		self.drift = None
+		if drift_compensation:
+			self.drift = DriftCompensator(self.samplerate, self.channels, target_frames=capacity_frames // 2)
 
 		def callback(indata, frames, time, status):
 			self.ring_buffer.write(indata.copy())
+			if self.drift is not None:
+				self.drift.on_input(frames)
+			if self.capture is not None:
+				self.capture.push(indata)
 
+		self._pool = pool
+		if pool is not None:
+			self._stream = pool.input_stream(callback, samplerate=self.samplerate, channels=self.channels,
+											 blocksize=self._blocksize, device=device)
+			return
 		self._stream = sounddevice.InputStream(
 			samplerate=self.samplerate,
 			channels=self.channels,
@@ -34,15 +103,105 @@ class LiveSource(Source):
 		self._stream.start()
 
 	def read(self, num_frames: int) -> numpy.ndarray:
-		data = self.ring_buffer.read(num_frames, block=True, timeout=1.0)
-		if data.size == 0:
-			return numpy.empty((0, self.channels), dtype=numpy.float32)
-		return data
+		if self.underrun == "block":
+			data = self._read_blocking(num_frames)
+			num_frames = data.shape[0]
+		else:
+			timeout = self._underrun_timeout
+			if timeout is None:
+				timeout = num_frames / self.samplerate
+			data = self._read_ring(num_frames, timeout)
+			if data.shape[0] < num_frames:
+				self.underruns += 1
+		
+		return self._join(data, num_frames)
+
+	# return format:
+	# { "underruns": 3, "concealed_frames": 1536, "dropped": 0, "buffered": 2048, "capacity": 4410 }
+	def stats(self) -> dict:
+		return {
+			"underruns": self.underruns,
+			"concealed_frames": self._concealer.concealed_frames,
+			"dropped": self.ring_buffer.dropped,
+			"buffered": self.ring_buffer.available(),
+			"capacity": self.ring_buffer.capacity,
+		}
+
+	# pauza: stream-ul e oprit, dar ramane deschis
+	def pause(self):
+		try:
+			self._stream.stop()
+		except Exception:
+			pass
+
+	# input-ul ramas din sesiunea trecuta e aruncat, primul bloc nou e unit prin crossfade
+	def resume(self):
+		self.ring_buffer.read(self.ring_buffer.available(), block=False)
+		self._concealer.discontinuity()
+		self._stream.start()
 
 	def close(self):
+		self._closed = True
+		if self._pool is not None:
+			self._pool.release(self._stream)
+			return
 		try:
 			self._stream.stop()
 			self._stream.close()
 		except Exception:
-			pass    
+			pass
+
+	#INTERNAL
+	# offset: pozitia datelor citite in blocul final (pentru pozitiile golurilor)
+	def _read_ring(self, num_frames: int, timeout: float, offset: int = 0) -> numpy.ndarray:
+		if self.drift is not None:
+			data = self.drift.read(self.ring_buffer, num_frames, timeout=timeout)
+			# dupa resampler pozitia exacta se pierde: crossfade la inceputul datelor
+			if self.ring_buffer.last_read_gaps:
+				self._gaps.append(offset)
+			return data
+		
+		data = self.ring_buffer.read(num_frames, block=True, timeout=timeout)
+		self._gaps.extend(offset + gap for gap in self.ring_buffer.last_read_gaps)
+		return data
 
+	# blocul final: crossfade la frame-urile pierdute la overflow, completare la underrun
+	def _join(self, data: numpy.ndarray, num_frames: int) -> numpy.ndarray:
+		if not self._gaps:
+			return self._concealer.process(data, num_frames)
+		
+		parts = []
+		start = 0
+		for gap in sorted(set(self._gaps)):
+			if gap > start:
+				parts.append(self._concealer.process(data[start:gap], gap - start))
+				start = gap
+			self._concealer.discontinuity()
+		self._gaps = []
+		parts.append(self._concealer.process(data[start:], num_frames - start))
+		return numpy.concatenate(parts)
+
+	# underrun="block": asteapta tot blocul; se termina (bloc gol) doar daca
+	# stream-ul de input s-a oprit, sursa a fost inchisa sau engine-ul s-a oprit
+	# (un device activ care nu mai livreaza nimic nu blocheaza stop())
+	def _read_blocking(self, num_frames: int) -> numpy.ndarray:
+		parts = []
+		missing = num_frames
+		stalled = False
+		while missing:
+			data = self._read_ring(missing, timeout=BLOCK_POLL_SECONDS, offset=num_frames - missing)
+			if data.shape[0]:
+				parts.append(data)
+				missing -= data.shape[0]
+				continue
+			stalled = True
+			if self._closed or not getattr(self._stream, "active", True):
+				break
+			if self._should_stop is not None and self._should_stop():
+				break
+		if stalled:
+			self.underruns += 1
+		
+		if not parts:
+			return numpy.empty((0, self.channels), dtype=numpy.float32)
+		return parts[0] if len(parts) == 1 else numpy.concatenate(parts)
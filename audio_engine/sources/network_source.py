@@ -0,0 +1,208 @@
+import socket
+import threading
+import numpy
+from .source import Source
+from ..utils.ring_buffer import RingBuffer
+from ..utils.net_frame import HEADER, FLAG_EOS, unpack_header, decode_frames
+
+
+class NetworkSource(Source):
+	"""
+	Primeste audio prin TCP sau UDP (pachete cu header din utils/net_frame.py)
+	Un thread de receptie scrie in RingBuffer, care e si jitter buffer:
+	read() incepe abia dupa ce s-au adunat `latency_ms` de audio
+
+	Pentru UDP pachetele pierdute sunt inlocuite cu liniste (lost),
+	iar cele sosite in afara ordinii sunt aruncate (late)
+	"""
+
+	def __init__(
+		self,
+		host: str = "127.0.0.1",
+		port: int = 0,
+		protocol: str = "tcp",
+		samplerate: int = 44100,
+		channels: int = 1,
+		latency_ms: float = 50.0,
+		buffer_seconds: float = 2.0,
+		timeout: float = 1.0,
+		buffer_dtype: str = "float32",
+	):
+		protocol = protocol.lower()
+		if protocol not in ("tcp", "udp"):
+			raise ValueError(f"Unknown protocol: {protocol}")
+
+		self.samplerate = samplerate
+		self.channels = channels
+		self.protocol = protocol
+		self._timeout = timeout
+
+		self._prebuffer = max(1, int(samplerate * latency_ms / 1000.0))
+		capacity_frames = max(self._prebuffer * 2, int(samplerate * buffer_seconds))
+		self.ring_buffer = RingBuffer(capacity_frames=capacity_frames, channels=channels, dtype=buffer_dtype)
+
+		self.received = 0
+		self.lost = 0
+		self.late = 0
+		self.invalid = 0
+		self.underruns = 0
+
+		self._expected_seq = None
+		self._primed = False
+		self._eos = threading.Event()
+		self._closed = False
+
+		kind = socket.SOCK_STREAM if protocol == "tcp" else socket.SOCK_DGRAM
+		self._sock = socket.socket(socket.AF_INET, kind)
+		self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+		if protocol == "udp":
+			self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+		self._sock.bind((host, port))
+		if protocol == "tcp":
+			self._sock.listen(1)
+		self.port = self._sock.getsockname()[1]
+
+		target = self._receive_tcp if protocol == "tcp" else self._receive_udp
+		self._thread = threading.Thread(target=target, daemon=True)
+		self._thread.start()
+
+	def read(self, num_frames: int) -> numpy.ndarray:
+		# jitter buffer: asteapta pana e plin la nivelul de latenta dorit
+		if not self._primed:
+			while self.ring_buffer.available() < self._prebuffer and not self._eos.is_set():
+				self._eos.wait(0.001)
+			self._primed = True
+
+		data = self.ring_buffer.read(num_frames, block=not self._eos.is_set(), timeout=self._timeout)
+		if data.shape[0] == num_frames:
+			return data
+
+		if self._eos.is_set():
+			rest = self.ring_buffer.read(num_frames - data.shape[0], block=False)
+			if data.size == 0 and rest.size == 0:
+				return numpy.empty((0, self.channels), dtype=numpy.float32)
+			return numpy.concatenate((data, rest), axis=0)
+
+		# underrun: completeaza cu liniste si reumple jitter buffer-ul
+		self.underruns += 1
+		self._primed = False
+		out = numpy.zeros((num_frames, self.channels), dtype=numpy.float32)
+		out[:data.shape[0]] = data
+		return out
+
+	def stats(self) -> dict:
+		return {
+			"received": self.received,
+			"lost": self.lost,
+			"late": self.late,
+			"invalid": self.invalid,
+			"underruns": self.underruns,
+			"buffered": self.ring_buffer.available(),
+		}
+
+	def close(self):
+		self._closed = True
+		self._eos.set()
+		try:
+			self._sock.close()
+		except Exception:
+			pass
+
+	#INTERNAL
+	def _handle_packet(self, header: dict, payload) -> bool:
+		# returneaza False la sfarsit de stream
+		if header["flags"] & FLAG_EOS:
+			return False
+		if header["channels"] != self.channels:
+			self.invalid += 1
+			return True
+
+		seq = header["seq"]
+		if self._expected_seq is not None and seq != self._expected_seq:
+			gap = (seq - self._expected_seq) & 0xFFFFFFFF
+			if gap >= 0x80000000:
+				# pachet mai vechi decat cel asteptat
+				self.late += 1
+				return True
+			# pastreaza timeline-ul: liniste in locul pachetelor pierdute
+			self.lost += gap
+			frames = header["frames"] * min(gap, 16)
+			self.ring_buffer.write(numpy.zeros((frames, self.channels), dtype=numpy.float32))
+		self._expected_seq = (seq + 1) & 0xFFFFFFFF
+
+		data = decode_frames(payload, self.channels)
+		if self.protocol == "tcp":
+			# fara pierderi pe TCP: asteapta loc in buffer, iar backpressure-ul
+			# ajunge la emitator prin fereastra TCP
+			needed = min(data.shape[0], self.ring_buffer.capacity)
+			while (self.ring_buffer.capacity - self.ring_buffer.available() < needed
+					and not self._closed):
+				self._eos.wait(0.001)
+
+		self.received += 1
+		self.ring_buffer.write(data)
+		return True
+
+	def _receive_tcp(self):
+		try:
+			conn, _ = self._sock.accept()
+		except OSError:
+			self._eos.set()
+			return
+
+		conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		header_buf = bytearray(HEADER.size)
+		payload = bytearray()
+		try:
+			with conn:
+				while not self._closed:
+					if not self._recv_exact(conn, memoryview(header_buf)):
+						break
+					header = unpack_header(header_buf)
+					size = header["frames"] * header["channels"] * 4
+					if len(payload) < size:
+						payload = bytearray(size)
+					view = memoryview(payload)[:size]
+					if not self._recv_exact(conn, view):
+						break
+					if not self._handle_packet(header, view):
+						break
+		except (OSError, ValueError):
+			pass
+		finally:
+			self._eos.set()
+
+	def _receive_udp(self):
+		packet = bytearray(65536)
+		view = memoryview(packet)
+		try:
+			while not self._closed:
+				size = self._sock.recv_into(packet)
+				try:
+					header = unpack_header(view[:size])
+				except ValueError:
+					self.invalid += 1
+					continue
+				# datagrama trunchiata sau cu header fals: restul buffer-ului e din pachete vechi
+				end = HEADER.size + header["frames"] * header["channels"] * 4
+				if size != end:
+					self.invalid += 1
+					continue
+				try:
+					if not self._handle_packet(header, view[HEADER.size:end]):
+						break
+				except ValueError:
+					self.invalid += 1
+		except OSError:
+			pass
+		finally:
+			self._eos.set()
+
+	@staticmethod
+	def _recv_exact(conn, view) -> bool:
+		while len(view):
+			n = conn.recv_into(view)
+			if n == 0:
+				return False
+			view = view[n:]
+		return True
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+CURVES = ("linear", "step")
+
+
+class AutomationCurve:
+    """
+    Valorile unui parametru in timp: puncte (secunde, valoare) pe timeline-ul input-ului
+    "linear" interpoleaza intre puncte, "step" tine valoarea pana la urmatorul punct
+    Inainte de primul punct si dupa ultimul valoarea ramane constanta
+
+    Evaluarea e vectoriala pe tot blocul; cand curba e constanta pe bloc
+    rezultatul e un singur float (costul ramane neglijabil)
+    """
+
+    def __init__(self, points, curve: str = "linear"):
+        if curve not in CURVES:
+            raise ValueError(f"Unknown curve: {curve} (expected one of {', '.join(CURVES)})")
+        points = sorted((float(t), float(v)) for t, v in points)
+        if not points:
+            raise ValueError("Automation needs at least one point")
+
+        self.curve = curve
+        self.points = points
+        self._times = np.array([t for t, _ in points])
+        self._values = np.array([v for _, v in points])
+        self._samplerate = None
+        self._frames = None
+
+    # pozitiile punctelor in frame-uri, recalculate doar la alt samplerate
+    def _breakpoints(self, samplerate: int) -> np.ndarray:
+        if samplerate != self._samplerate:
+            self._frames = np.round(self._times * samplerate).astype(np.int64)
+            self._samplerate = samplerate
+        return self._frames
+
+    def value_at(self, frame: int, samplerate: int) -> float:
+        frames = self._breakpoints(samplerate)
+        if self.curve == "step":
+            idx = max(0, int(np.searchsorted(frames, frame, side="right")) - 1)
+            return float(self._values[idx])
+        return float(np.interp(frame, frames, self._values))
+
+    def block(self, start: int, count: int, samplerate: int):
+        """
+        Valorile pentru frame-urile [start, start + count): float daca sunt toate egale,
+        altfel array float32 per frame
+        """
+        frames = self._breakpoints(samplerate)
+        first = int(np.searchsorted(frames, start, side="right"))
+        last = int(np.searchsorted(frames, start + count - 1, side="right"))
+        if first == last:
+            # acelasi segment pe tot blocul: constant pentru "step", in afara
+            # punctelor sau intre doua valori egale pentru "linear"
+            if (self.curve == "step" or first == 0 or first == len(frames)
+                    or self._values[first - 1] == self._values[first]):
+                return self.value_at(start, samplerate)
+
+        positions = np.arange(start, start + count)
+        if self.curve == "step":
+            idx = np.maximum(np.searchsorted(frames, positions, side="right") - 1, 0)
+            return self._values[idx].astype(np.float32)
+        return np.interp(positions, frames, self._values).astype(np.float32)
+
+    # pozitiile (relative la start) unde curba sare in interiorul blocului
+    def steps(self, start: int, count: int, samplerate: int) -> list:
+        if self.curve != "step":
+            return []
+        frames = self._breakpoints(samplerate)
+        inside = frames[(frames > start) & (frames < start + count)]
+        return [int(frame - start) for frame in inside]
+
+    def describe(self) -> dict:
+        return {"curve": self.curve, "points": [list(point) for point in self.points]}
@@ -0,0 +1,217 @@
+import copy
+import math
+import threading
+import time
+import numpy as np
+
+
+# marimile de bloc incercate, crescator
+CANDIDATE_BLOCKSIZES = (64, 128, 256, 512, 1024, 2048, 4096)
+
+
+def measure_block_cost(effects, blocksize: int, samplerate: int, channels: int, repeats: int = 5,
+                       idle: float = 0.0) -> list:
+    """
+    Timpul (secunde) pentru fiecare din `repeats` blocuri trecute printr-o copie a lantului
+    Copia nu atinge starea efectelor din engine; input-ul e zgomot, deci
+    detectia de liniste nu sare nimic (cazul cel mai rau)
+        idle: secunde de pauza dupa fiecare bloc masurat (lasa CPU bucla audio care ruleaza)
+    """
+    chain = copy.deepcopy(list(effects))
+    rng = np.random.default_rng(0)
+    block = (rng.standard_normal((blocksize, channels)) * 0.1).astype(np.float32)
+
+    def run():
+        buf = block
+        for eff in chain:
+            buf = eff.apply(buf, samplerate)
+
+    # primul bloc aloca buffer-ele interne (delay lines), nu e masurat
+    run()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+        if idle:
+            time.sleep(idle)
+    return times
+
+
+class BlockSizeTuner:
+    """
+    Alege cel mai mic blocksize pentru care lantul foloseste cel mult `target_load`
+    din timpul unui bloc (load = timp de procesare / durata blocului)
+
+    La build() masoara marimile din `candidates` crescator si se opreste la prima
+    care incape; in timpul rularii urmareste load-ul real (medie exponentiala)
+    si trece la urmatoarea marime cand e depasit
+    Histerezis: dupa `recover_blocks` blocuri consecutive cu load-ul sub
+    `shrink_load * target_load` revine la marimea anterioara, dar nu sub cea masurata
+    (o supraincarcare de moment nu mareste latenta definitiv)
+    Cand lantul se schimba, re-masurarea ruleaza pe un thread separat, pe o copie
+    a lantului facuta pe thread-ul audio, cu pauze intre blocuri
+    """
+
+    def __init__(self, target_load: float = 0.5, candidates=CANDIDATE_BLOCKSIZES, repeats: int = 5,
+                 smoothing: float = 0.05, warmup_blocks: int = 20, shrink_load: float = 0.5,
+                 recover_blocks: int = 500):
+        if not 0.0 < target_load <= 1.0:
+            raise ValueError("target_load must be in (0, 1]")
+        if not candidates:
+            raise ValueError()
+
+        self.target_load = float(target_load)
+        self.candidates = tuple(sorted(int(bs) for bs in candidates))
+        self.repeats = repeats
+        self.smoothing = smoothing
+        self.warmup_blocks = warmup_blocks
+        self.shrink_load = shrink_load
+        self.recover_blocks = recover_blocks
+
+        self.blocksize = None
+        self.buffer_frames = None
+        self.measurements = {}
+        self.runtime_load = None
+        self.retunes = 0
+
+        self._observed = 0
+        # blocuri consecutive cu load sub pragul de revenire
+        self._calm = 0
+        # marimea aleasa de ultima masurare: observe() nu coboara sub ea
+        self._floor = None
+        self._dirty = True
+        self._tuned_for = None
+        self._tuning = False
+        self._lock = threading.Lock()
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    # lantul s-a schimbat: masuratorile nu mai sunt valide
+    def invalidate(self):
+        self._dirty = True
+
+    # la build: masoara doar daca lantul sau formatul s-a schimbat de la ultima masurare
+    # (blocksize-ul ales sau marit in timpul rularii ramane)
+    def ensure_tuned(self, effects, samplerate: int, channels: int) -> int:
+        if self._dirty or self.blocksize is None or self._tuned_for != (samplerate, channels):
+            return self.tune(effects, samplerate, channels)
+        return self.blocksize
+
+    def tune(self, effects, samplerate: int, channels: int) -> int:
+        with self._lock:
+            self._dirty = False
+            self._tuned_for = (samplerate, channels)
+        return self._measure(effects, samplerate, channels)
+
+    def _measure(self, effects, samplerate: int, channels: int, background: bool = False) -> int:
+        measurements = {}
+        chosen = None
+        for blocksize in self.candidates:
+            # in fundal: pauza de un bloc dupa fiecare masurare, bucla audio are prioritate
+            idle = blocksize / samplerate if background else 0.0
+            times = measure_block_cost(effects, blocksize, samplerate, channels, self.repeats, idle)
+            period = blocksize / samplerate
+            cost = float(np.median(times))
+            measurements[blocksize] = {
+                "cost_ms": cost * 1000.0,
+                "worst_ms": max(times) * 1000.0,
+                "load": cost / period,
+            }
+            if cost / period <= self.target_load:
+                chosen = blocksize
+                break
+        if chosen is None:
+            chosen = self.candidates[-1]
+
+        # ring buffer-ul trebuie sa acopere cel mai lent bloc masurat, plus o marja
+        worst_load = measurements[chosen]["worst_ms"] / 1000.0 * samplerate / chosen
+        buffer_frames = chosen * max(4, math.ceil(worst_load) + 2)
+
+        with self._lock:
+            self.measurements = measurements
+            self.blocksize = chosen
+            self.buffer_frames = buffer_frames
+            self.runtime_load = None
+            self._observed = 0
+            self._calm = 0
+            self._floor = chosen
+            if background:
+                self.retunes += 1
+        return chosen
+
+    # re-masurare in fundal (ex. efect adaugat in timpul rularii)
+    # apelat de pe thread-ul audio, intre blocuri: copia lantului e facuta aici, cat
+    # efectele nu sunt modificate; thread-ul de masurare nu atinge lantul din engine
+    def tune_async(self, effects, samplerate: int, channels: int):
+        with self._lock:
+            if self._tuning:
+                return
+            self._tuning = True
+            self._dirty = False
+            self._tuned_for = (samplerate, channels)
+        chain = copy.deepcopy(list(effects))
+
+        def run():
+            try:
+                self._measure(chain, samplerate, channels, background=True)
+            finally:
+                with self._lock:
+                    self._tuning = False
+
+        threading.Thread(target=run, daemon=True).start()
+
+    # apelat dupa fiecare bloc procesat; returneaza True daca blocksize-ul s-a schimbat
+    def observe(self, frames: int, elapsed: float, samplerate: int) -> bool:
+        if frames <= 0 or self.blocksize is None:
+            return False
+        load = elapsed * samplerate / frames
+
+        with self._lock:
+            if self.runtime_load is None:
+                self.runtime_load = load
+            else:
+                self.runtime_load += self.smoothing * (load - self.runtime_load)
+            self._observed += 1
+
+            if self._observed < self.warmup_blocks:
+                return False
+            if self.runtime_load > self.target_load:
+                # supraincarcat: urmatoarea marime
+                self._calm = 0
+                larger = [bs for bs in self.candidates if bs > self.blocksize]
+                return bool(larger) and self._resize(larger[0])
+
+            if self.runtime_load > self.shrink_load * self.target_load:
+                self._calm = 0
+                return False
+            self._calm += 1
+            floor = self._floor or self.candidates[0]
+            smaller = [bs for bs in self.candidates if floor <= bs < self.blocksize]
+            if self._calm < self.recover_blocks or not smaller:
+                return False
+            # load-ul a ramas mult sub tinta: inapoi la marimea anterioara
+            return self._resize(smaller[-1])
+
+    # noua marime, cu buffer-ul scalat la fel; apelantul detine lock-ul
+    def _resize(self, blocksize: int) -> bool:
+        self.buffer_frames = self.buffer_frames * blocksize // self.blocksize
+        self.blocksize = blocksize
+        self.runtime_load = None
+        self._observed = 0
+        self._calm = 0
+        self.retunes += 1
+        return True
+
+    def report(self) -> dict:
+        with self._lock:
+            return {
+                "target_load": self.target_load,
+                "blocksize": self.blocksize,
+                "buffer_frames": self.buffer_frames,
+                "measurements": {bs: dict(m) for bs, m in self.measurements.items()},
+                "runtime_load": self.runtime_load,
+                "retunes": self.retunes,
+            }
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import threading
+import time
+import weakref
+import numpy as np
+
+from .ring_buffer import RingBuffer
+from .memmap_ring_buffer import MemmapRingBuffer
+
+
+class CaptureWriter:
+    """
+    Captura continua ("always recording") a ultimelor `seconds` de input live
+    intr-un MemmapRingBuffer pe disc, exportabila oricand in WAV
+
+    Callback-ul audio apeleaza doar push(), care copiaza blocul intr-un buffer mic
+    in RAM; un thread separat muta datele in fisier, deci callback-ul nu asteapta
+    niciodata dupa disc. Daca thread-ul ramane in urma mai mult de `staging_seconds`,
+    frame-urile cele mai vechi din buffer-ul RAM sunt pierdute (numarate in `dropped`)
+
+    Timpii (start/end) sunt in secunde de la inceputul capturii
+    """
+
+    def __init__(
+        self,
+        samplerate: int,
+        channels: int,
+        seconds: float,
+        path: str | None = None,
+        dtype="float32",
+        staging_seconds: float = 2.0,
+        flush_seconds: float = 5.0,
+    ):
+        if seconds <= 0:
+            raise ValueError("seconds must be > 0")
+
+        self.samplerate = samplerate
+        self.channels = channels
+        self.dropped = 0
+
+        remove = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".capture")
+            os.close(fd)
+        self.path = path
+
+        self.ring = MemmapRingBuffer(path, int(seconds * samplerate), channels, dtype=dtype)
+        self._staging = RingBuffer(max(1, int(staging_seconds * samplerate)), channels)
+        self._flush_seconds = flush_seconds
+
+        # fisierul temporar e sters si daca obiectul nu e inchis explicit
+        self._finalizer = weakref.finalize(self, self.ring.close, remove)
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # apelat din callback-ul audio: doar o copie in RAM, fara I/O
+    def push(self, block: np.ndarray):
+        overflow = self._staging.available() + block.shape[0] - self._staging.capacity
+        if overflow > 0:
+            self.dropped += overflow
+        self._staging.write(block)
+
+    def export(self, path: str, last: float | None = None, start: float | None = None,
+               end: float | None = None, subtype: str | None = None) -> dict:
+        """
+        Scrie un interval din captura intr-un fisier audio, fara sa opreasca stream-ul
+            last: ultimele `last` secunde
+            start / end: secunde de la inceputul capturii (end=None = pana acum)
+        Intervalul e limitat la ce mai e in buffer
+        """
+        import soundfile as sf
+
+        sr = self.samplerate
+        written = self.ring.frames_written()
+        if last is not None:
+            first, stop = written - int(last * sr), written
+        else:
+            first = int((start or 0.0) * sr)
+            stop = written if end is None else min(written, int(end * sr))
+        first = max(first, self.ring.oldest_frame())
+        if stop <= first:
+            raise ValueError("Nothing captured in the requested range")
+
+        # bucati de o secunda: lock-ul ring-ului e tinut doar cat dureaza o copie
+        chunk = max(1, sr)
+        scratch = np.empty((chunk, self.channels), dtype=np.float32)
+        exported = 0
+        pos = first
+        with sf.SoundFile(path, mode="w", samplerate=sr, channels=self.channels, subtype=subtype) as f:
+            while pos < stop:
+                n = min(chunk, stop - pos)
+                try:
+                    block = self.ring.read_range(pos, n, out=scratch)
+                except ValueError:
+                    # suprascris intre timp: continua de la cel mai vechi frame ramas
+                    pos = max(pos + 1, self.ring.oldest_frame())
+                    continue
+                f.write(block)
+                exported += n
+                pos += n
+
+        return {"path": path, "start": first / sr, "end": stop / sr, "frames": exported}
+
+    def info(self) -> dict:
+        written = self.ring.frames_written()
+        return {
+            "seconds": (written - self.ring.oldest_frame()) / self.samplerate,
+            "capacity_seconds": self.ring.capacity / self.samplerate,
+            "captured_seconds": written / self.samplerate,
+            "pending": self._staging.available(),
+            "dropped": self.dropped,
+            "path": self.path,
+        }
+
+    # opreste thread-ul dupa ce muta tot ce a ramas in RAM; captura ramane exportabila
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def close(self):
+        if self._thread.is_alive():
+            self.stop()
+        self._finalizer()
+
+    #INTERNAL
+    def _run(self):
+        chunk = max(1, self.samplerate // 20)
+        scratch = np.empty((chunk, self.channels), dtype=np.float32)
+        last_flush = time.monotonic()
+        while True:
+            data = self._staging.read(chunk, block=True, timeout=0.05, out=scratch)
+            if data.size:
+                self.ring.write(data)
+            elif self._stop.is_set():
+                break
+
+            now = time.monotonic()
+            if now - last_flush >= self._flush_seconds:
+                # paginile scrise devin curate si pot fi eliberate din RAM
+                self.ring.flush()
+                last_flush = now
+        self.ring.flush()
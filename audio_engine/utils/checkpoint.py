@@ -0,0 +1,54 @@
+import json
+import os
+import numpy as np
+
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, meta: dict, states: list):
+    """
+    Salveaza atomic un checkpoint (npz necomprimat, scriere in .tmp + rename)
+    meta: dict serializabil JSON (pozitii, semnatura lantului)
+    states: lista de dict-uri nume -> array, cate unul per efect
+    """
+    arrays = {"meta": np.array(json.dumps(dict(meta, version=CHECKPOINT_VERSION)))}
+    for idx, state in enumerate(states):
+        for key, value in state.items():
+            arrays[f"effect{idx}/{key}"] = np.asarray(value)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, num_effects: int):
+    """
+    Incarca un checkpoint salvat cu save_checkpoint
+    returneaza (meta, states)
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        if meta.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {meta.get('version')}")
+
+        states = [{} for _ in range(num_effects)]
+        for name in data.files:
+            if not name.startswith("effect"):
+                continue
+            prefix, key = name.split("/", 1)
+            idx = int(prefix[len("effect"):])
+            if idx < num_effects:
+                states[idx][key] = data[name]
+    return meta, states
+
+
+def remove_checkpoint(path: str):
+    for p in (path, f"{path}.tmp"):
+        try:
+            os.remove(p)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,160 @@
+import time
+import numpy as np
+
+
+class CubicResampler:
+    """
+    Resampler cu raport variabil (interpolare cubica Catmull-Rom), cu stare intre blocuri
+    ratio = frame-uri de input consumate per frame de output (1.0 = fara schimbare)
+
+    Pozitia de citire e pastrata fractionar, deci raportul poate fi schimbat la fiecare
+    bloc fara discontinuitati; needed() spune exact cate frame-uri noi trebuie citite
+    """
+
+    def __init__(self, channels: int):
+        self.channels = channels
+        # history[1] e frame-ul de la pozitia curenta, history[0] cel dinainte
+        self._history = np.zeros((1, channels), dtype=np.float32)
+        self._phase = 0.0
+
+    # cate frame-uri noi de input sunt necesare pentru `frames` frame-uri de output
+    def needed(self, frames: int, ratio: float) -> int:
+        last = int(np.floor(1.0 + self._phase + (frames - 1) * ratio)) + 2
+        return max(0, last + 1 - self._history.shape[0])
+
+    # returneaza cel mult `frames` frame-uri: mai putine daca input-ul nu ajunge (underrun)
+    def process(self, data: np.ndarray, frames: int, ratio: float) -> np.ndarray:
+        history = np.concatenate((self._history, data.astype(np.float32, copy=False)))
+        positions = 1.0 + self._phase + np.arange(frames) * ratio
+        index = positions.astype(np.int64)
+        frames = int(np.searchsorted(index, history.shape[0] - 3, side="right"))
+        index = index[:frames]
+        frac = (positions[:frames] - index).astype(np.float32)[:, None]
+
+        p0 = history[index - 1]
+        p1 = history[index]
+        p2 = history[index + 1]
+        p3 = history[index + 2]
+        out = p1 + 0.5 * frac * (p2 - p0 + frac * (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3
+                                                    + frac * (3.0 * (p1 - p2) + p3 - p0)))
+
+        position = self._phase + frames * ratio
+        advance = int(position)
+        self._phase = position - advance
+        self._history = history[advance:].copy()
+        return out
+
+    def reset(self):
+        self._history = np.zeros((1, self.channels), dtype=np.float32)
+        self._phase = 0.0
+
+
+class DriftCompensator:
+    """
+    Compensarea derivei de ceas intre un device de input si unul de output separate
+
+    Engine-ul citeste din buffer-ul sursei live in ritmul device-ului de output; daca
+    ceasurile difera putin, buffer-ul se umple (date vechi suprascrise) sau se goleste
+    (underrun). Dupa fiecare citire nivelul buffer-ului e netezit, iar un regulator PI
+    ajusteaza raportul resampler-ului ca nivelul sa ramana la `target_frames`:
+        ratio = 1 + kp * eroare + integrala(ki * eroare)
+    Integrala converge la deriva reala (ppm) a celor doua ceasuri
+
+    Buffer-ul primeste input in blocuri intregi, deci nivelul vazut la citire sare cu cate
+    un bloc; on_input() (din callback) noteaza momentul ultimului bloc, iar nivelul folosit
+    e interpolat: available + (acum - ultimul bloc) * samplerate
+
+    response_seconds: constanta de timp a buclei (amortizare critica)
+    smoothing_seconds: netezirea nivelului (jitter-ul de la callback-urile de input)
+    max_ppm: limita corectiei
+    """
+
+    def __init__(
+        self,
+        samplerate: int,
+        channels: int,
+        target_frames: int,
+        response_seconds: float = 10.0,
+        smoothing_seconds: float = 1.0,
+        max_ppm: float = 2000.0,
+        clock=time.monotonic,
+    ):
+        if target_frames <= 0:
+            raise ValueError("target_frames must be > 0")
+        self.samplerate = samplerate
+        self.target_frames = target_frames
+        self.response_seconds = response_seconds
+        self.smoothing_seconds = smoothing_seconds
+        self.max_ratio = max_ppm * 1e-6
+        self.clock = clock
+
+        self.resampler = CubicResampler(channels)
+        self.ratio = 1.0
+        self.underruns = 0
+        self._integral = 0.0
+        self._fill = None
+        self._input_time = None
+        self._input_frames = 0
+
+    # apelat dupa fiecare bloc scris in buffer (callback-ul device-ului de input)
+    def on_input(self, frames: int):
+        self._input_time = self.clock()
+        self._input_frames = frames
+
+    # nivelul buffer-ului plus ce a acumulat device-ul de input de la ultimul bloc
+    def measure(self, available: int) -> float:
+        if self._input_time is None:
+            return float(available)
+        pending = (self.clock() - self._input_time) * self.samplerate
+        return available + min(max(pending, 0.0), self._input_frames)
+
+    # ajusteaza raportul dupa un bloc de `frames` frame-uri, cu nivelul curent al buffer-ului
+    def update(self, fill: float, frames: int) -> float:
+        seconds = frames / self.samplerate
+        if self._fill is None:
+            self._fill = float(fill)
+        else:
+            alpha = min(1.0, seconds / self.smoothing_seconds)
+            self._fill += alpha * (fill - self._fill)
+
+        # frecventa naturala a buclei per bloc; fiecare bloc muta nivelul cu frames * ratio
+        omega = seconds / self.response_seconds
+        error = self._fill - self.target_frames
+        self._integral += omega * omega / frames * error
+        self._integral = min(max(self._integral, -self.max_ratio), self.max_ratio)
+
+        correction = self._integral + 2.0 * omega / frames * error
+        self.ratio = 1.0 + min(max(correction, -self.max_ratio), self.max_ratio)
+        return self.ratio
+
+    # citeste din `ring` cat trebuie pentru `frames` frame-uri la raportul curent
+    # (mai putine la underrun, completate de politica sursei)
+    def read(self, ring, frames: int, timeout: float = 1.0) -> np.ndarray:
+        needed = self.resampler.needed(frames, self.ratio)
+        data = ring.read(needed, block=True, timeout=timeout)
+        if data.shape[0] < needed:
+            self.underruns += 1
+        out = self.resampler.process(data, frames, self.ratio)
+        if out.shape[0]:
+            self.update(self.measure(ring.available()), out.shape[0])
+        return out
+
+    # return format:
+    # { "ratio": 1.000042, "drift_ppm": 41.8, "fill_frames": 2203.5, "target_frames": 2205, "underruns": 0 }
+    # drift_ppm: deriva estimata (integrala), ratio: raportul curent, cu termenul proportional
+    def stats(self) -> dict:
+        return {
+            "ratio": self.ratio,
+            "drift_ppm": self._integral * 1e6,
+            "fill_frames": self._fill,
+            "target_frames": self.target_frames,
+            "underruns": self.underruns,
+        }
+
+    def reset(self):
+        self.resampler.reset()
+        self.ratio = 1.0
+        self.underruns = 0
+        self._integral = 0.0
+        self._fill = None
+        self._input_time = None
@@ -0,0 +1,79 @@
+import mmap
+import os
+import numpy as np
+
+from .ring_buffer import RingBuffer
+
+
+class MemmapRingBuffer(RingBuffer):
+    """
+    RingBuffer cu stocarea intr-un fisier mapat in memorie (np.memmap)
+    Aceeasi semantica la write (suprascrie datele vechi cand e plin), dar
+    memoria folosita nu creste cu capacitatea: paginile sunt ale fisierului
+
+    In plus permite citirea oricarui interval de pe timeline (read_range)
+    fara sa consume datele, cat timp nu a fost inca suprascris
+    """
+
+    def __init__(self, path: str, capacity_frames: int, channels: int, dtype="float32"):
+        """
+            path: Fisierul de stocare (creat / suprascris)
+            capacity_frames: Numar maxim de frame-uri audio
+            channels: Numar canale
+            dtype: Tipul de stocare: "float32", "float16" sau "int16"
+        """
+        self.path = path
+        super().__init__(capacity_frames, channels, dtype)
+
+    def _allocate(self, capacity_frames: int, channels: int, dtype: np.dtype) -> np.ndarray:
+        return np.memmap(self.path, dtype=dtype, mode="w+", shape=(capacity_frames, channels))
+
+    # primul frame de pe timeline care mai e in buffer
+    def oldest_frame(self) -> int:
+        with self._lock:
+            return max(0, self._written - self._capacity)
+
+    def read_range(self, start_frame: int, num_frames: int, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Citeste frame-urile [start_frame, start_frame + num_frames) de pe timeline (float32)
+        ValueError daca intervalul nu mai e (sau inca nu e) in buffer
+        """
+        if out is None:
+            out = np.empty((num_frames, self._channels), dtype=np.float32)
+        output = out[:num_frames]
+
+        with self._lock:
+            oldest = max(0, self._written - self._capacity)
+            if start_frame < oldest or start_frame + num_frames > self._written:
+                raise ValueError(
+                    f"Frames [{start_frame}, {start_frame + num_frames}) not in buffer "
+                    f"(available [{oldest}, {self._written}))"
+                )
+            # ultimul frame scris e la write_pos - 1
+            pos = (self._write_pos - (self._written - start_frame)) % self._capacity
+            first_chunk = min(num_frames, self._capacity - pos)
+            self._load(output[:first_chunk], self._buffer[pos:pos + first_chunk])
+            if first_chunk < num_frames:
+                self._load(output[first_chunk:], self._buffer[:num_frames - first_chunk])
+        return output
+
+    # scrie paginile modificate pe disc si le scoate din memoria procesului,
+    # ca memoria folosita sa nu creasca odata cu fereastra
+    def flush(self):
+        with self._lock:
+            self._buffer.flush()
+            mapping = getattr(self._buffer, "_mmap", None)
+            if mapping is not None and hasattr(mmap, "MADV_DONTNEED"):
+                mapping.madvise(mmap.MADV_DONTNEED)
+
+    def close(self, remove: bool = False):
+        with self._lock:
+            if self._buffer is not None:
+                self._buffer.flush()
+                # eliberarea mapping-ului inchide fisierul
+                self._buffer = None
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -0,0 +1,54 @@
+import struct
+import numpy as np
+
+
+# header compact (20 bytes), little endian:
+# magic, versiune, flags, canale, blocuri in pachet, samplerate, frame-uri, secventa
+HEADER = struct.Struct("<2sBBHHIII")
+MAGIC = b"AE"
+VERSION = 1
+
+FLAG_EOS = 0x01  # sfarsit de stream
+
+# payload maxim pentru un datagram UDP
+MAX_UDP_PAYLOAD = 65507 - HEADER.size
+
+SAMPLE_DTYPE = np.dtype("<f4")
+
+
+def pack_header(channels: int, blocks: int, samplerate: int, frames: int, seq: int, flags: int = 0) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, flags, channels, blocks, samplerate, frames, seq & 0xFFFFFFFF)
+
+
+def unpack_header(data) -> dict:
+    """
+    Decodeaza header-ul unui pachet
+    ValueError daca nu e un pachet valid
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Packet too short")
+    magic, version, flags, channels, blocks, samplerate, frames, seq = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Bad packet header")
+    return {
+        "flags": flags,
+        "channels": channels,
+        "blocks": blocks,
+        "samplerate": samplerate,
+        "frames": frames,
+        "seq": seq,
+    }
+
+
+def encode_frames(blocks) -> bytes:
+    """Concateneaza mai multe blocuri (frames, channels) intr-un payload float32"""
+    if len(blocks) == 1:
+        data = blocks[0]
+    else:
+        data = np.concatenate(blocks, axis=0)
+    return np.ascontiguousarray(data, dtype=SAMPLE_DTYPE).tobytes()
+
+
+def decode_frames(payload, channels: int) -> np.ndarray:
+    data = np.frombuffer(payload, dtype=SAMPLE_DTYPE)
+    return data.reshape(-1, channels).astype(np.float32, copy=False)
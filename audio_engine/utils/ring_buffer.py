@@ -3,38 +3,112 @@ import numpy as np
 import time
 
 
+# tipurile de stocare suportate; int16 e scalat la [-1, 1] (32767 = 1.0)
+STORAGE_DTYPES = ("float32", "float16", "int16")
+INT16_SCALE = 32767.0
+
+# ce se intampla cand write() nu mai are loc:
+# drop_oldest - datele cele mai vechi sunt suprascrise (latenta ramane mica)
+# drop_newest - frame-urile noi care nu incap sunt aruncate (datele vechi raman continue)
+# grow        - capacitatea e dublata pana la max_capacity_frames, apoi drop_oldest
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "grow")
+
+
 class RingBuffer:
     """
     Buffer circular thread safe
-    Suprascrie automat datele vechi cannd e plin
+    Suprascrie automat datele vechi cannd e plin (overflow="drop_oldest")
+    
+    Datele pot fi stocate compact (float16 / int16, jumatate din memorie);
+    conversia se face vectorial la write/read, iar read() returneaza mereu float32
     
     """
     
-    def __init__(self, capacity_frames: int, channels: int):
+    def __init__(self, capacity_frames: int, channels: int, dtype="float32",
+                 overflow: str = "drop_oldest", max_capacity_frames: int | None = None):
         """        
             capacity_frames: Numar maxim de frame-uri audio
             channels: Numar canale (1=mono, 2=stereo)
+            dtype: Tipul de stocare: "float32", "float16" sau "int16"
+            overflow: Politica la buffer plin, din OVERFLOW_POLICIES
+            max_capacity_frames: Limita pentru overflow="grow" (implicit 8 x capacity_frames)
         """
         if capacity_frames <= 0:
             raise ValueError("capacity_frames must be > 0")
         if channels <= 0:
             raise ValueError("channels must be > 0")
+        dtype = np.dtype(dtype)
+        if dtype.name not in STORAGE_DTYPES:
+            raise ValueError(f"Unsupported storage dtype: {dtype.name}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow} (expected one of {', '.join(OVERFLOW_POLICIES)})")
         
-        self._buffer = np.zeros((capacity_frames, channels), dtype=np.float32)
+        self._buffer = self._allocate(capacity_frames, channels, dtype)
         self._capacity = capacity_frames
         self._channels = channels
+        self._overflow = overflow
+        self._max_capacity = max(capacity_frames, max_capacity_frames or 8 * capacity_frames)
+        # frame-uri pierdute la overflow (suprascrise sau aruncate)
+        self.dropped = 0
+        # pozitiile de pe timeline dupa care lipsesc date (overflow) si, dupa fiecare
+        # read(), offset-urile lor in blocul citit (pentru crossfade la consumator)
+        self._gaps = []
+        self.last_read_gaps = []
         
         self._write_pos = 0
         self._read_pos = 0
         self._size = 0
+        self._written = 0
         
         self._lock = threading.Lock()
         self._data_available = threading.Condition(self._lock)
     
+    def _allocate(self, capacity_frames: int, channels: int, dtype: np.dtype) -> np.ndarray:
+        """
+        Uz intern: aloca stocarea (subclasele pot folosi alt backend, ex. memmap)
+        """
+        return np.zeros((capacity_frames, channels), dtype=dtype)
+    
     def available(self) -> int:
         with self._lock:
             return self._size
     
+    # cate frame-uri au fost scrise de la creare (pozitia pe timeline)
+    def frames_written(self) -> int:
+        with self._lock:
+            return self._written
+    
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+    
+    @property
+    def overflow(self) -> str:
+        return self._overflow
+    
+    @property
+    def dtype(self) -> np.dtype:
+        return self._buffer.dtype
+    
+    @property
+    def nbytes(self) -> int:
+        return self._buffer.nbytes
+    
+    def _store(self, dst: np.ndarray, data: np.ndarray):
+        # float32 -> tipul de stocare, direct in slice-ul din buffer
+        if dst.dtype == np.int16:
+            scaled = np.clip(data, -1.0, 1.0) * INT16_SCALE
+            np.rint(scaled, out=scaled)
+            dst[...] = scaled
+        else:
+            dst[...] = data
+    
+    def _load(self, dst: np.ndarray, src: np.ndarray):
+        # tipul de stocare -> float32, direct in buffer-ul apelantului
+        dst[...] = src
+        if src.dtype == np.int16:
+            dst *= 1.0 / INT16_SCALE
+    
     
     def _copy_into_buffer(self, data: np.ndarray):
         """
@@ -47,43 +121,63 @@ class RingBuffer:
         end_pos = (self._write_pos + num_frames) % self._capacity
         
         if self._write_pos + num_frames <= self._capacity:
-            self._buffer[self._write_pos:self._write_pos + num_frames] = data
+            self._store(self._buffer[self._write_pos:self._write_pos + num_frames], data)
         else:
             first_chunk = self._capacity - self._write_pos
-            self._buffer[self._write_pos:] = data[:first_chunk]
-            self._buffer[:end_pos] = data[first_chunk:]
+            self._store(self._buffer[self._write_pos:], data[:first_chunk])
+            self._store(self._buffer[:end_pos], data[first_chunk:])
         
         self._write_pos = end_pos
     
     
-    def _copy_from_buffer(self, num_frames: int) -> np.ndarray:
+    def _copy_from_buffer(self, num_frames: int, out: np.ndarray | None = None) -> np.ndarray:
         """
         Uz intern: copiaza date din buffer la pozitia curenta de citire.
         Gestioneaza wrap around automat
         Caller trebuie sa detina lock
 
         
-        returneaza date audio copiate (num_frames, channels)
+        returneaza date audio copiate (num_frames, channels), float32
         """
         end_pos = (self._read_pos + num_frames) % self._capacity
+        if out is None:
+            output = np.empty((num_frames, self._channels), dtype=np.float32)
+        else:
+            output = out[:num_frames]
         
         if self._read_pos + num_frames <= self._capacity:
-            output = self._buffer[self._read_pos:self._read_pos + num_frames].copy()
+            self._load(output, self._buffer[self._read_pos:self._read_pos + num_frames])
         else:
             first_chunk = self._capacity - self._read_pos
-            output = np.vstack((
-                self._buffer[self._read_pos:],
-                self._buffer[:end_pos]
-            ))
+            self._load(output[:first_chunk], self._buffer[self._read_pos:])
+            self._load(output[first_chunk:], self._buffer[:end_pos])
         
         self._read_pos = end_pos
         return output
     
     
+    def _grow(self, required: int):
+        """
+        Uz intern: mareste capacitatea (dublare, pana la limita) si aduce datele
+        la inceputul noii stocari, fara conversie
+        Caller trebuie sa detina lock
+        """
+        capacity = min(self._max_capacity, max(required, 2 * self._capacity))
+        buffer = self._allocate(capacity, self._channels, self._buffer.dtype)
+        first_chunk = min(self._size, self._capacity - self._read_pos)
+        buffer[:first_chunk] = self._buffer[self._read_pos:self._read_pos + first_chunk]
+        buffer[first_chunk:self._size] = self._buffer[:self._size - first_chunk]
+        
+        self._buffer = buffer
+        self._capacity = capacity
+        self._read_pos = 0
+        self._write_pos = self._size % capacity
+    
+    
     def write(self, data: np.ndarray):
         """
         Scrie frame-uri audio in buffer (apelat din callback thread)
-        Suprascrie automat datele vechi daca e plin
+        Daca e plin aplica politica de overflow (implicit suprascrie datele vechi)
         Normalizeaza format si notifica thread-urile care asteapta
         
         """
@@ -104,6 +198,24 @@ class RingBuffer:
         num_frames = data.shape[0]
         
         with self._lock:
+            free = self._capacity - self._size
+            if num_frames > free and self._overflow == "grow" and self._capacity < self._max_capacity:
+                self._grow(self._size + num_frames)
+                free = self._capacity - self._size
+            
+            if num_frames > free and self._overflow == "drop_newest":
+                self.dropped += num_frames - free
+                self._copy_into_buffer(data[:free])
+                self._size += free
+                self._written += free
+                # urmatorul frame scris nu mai continua datele din buffer
+                self._add_gap(self._written)
+                self._data_available.notify_all()
+                return
+            
+            if num_frames > free:
+                self.dropped += num_frames - free
+            
             if num_frames >= self._capacity:
                 self._copy_into_buffer(data[-self._capacity:])
                 self._read_pos = self._write_pos
@@ -118,22 +230,43 @@ class RingBuffer:
                 self._copy_into_buffer(data)
                 self._size += num_frames
             
+            self._written += num_frames
+            if num_frames > free:
+                # cel mai vechi frame pastrat nu continua ce s-a citit inainte
+                self._add_gap(self._written - self._size)
             self._data_available.notify_all()
     
     
+    def _add_gap(self, position: int):
+        """
+        Uz intern: marcheaza o discontinuitate la `position` pe timeline
+        Caller trebuie sa detina lock
+        """
+        oldest = self._written - self._size
+        self._gaps = [gap for gap in self._gaps if gap >= oldest and gap != position]
+        self._gaps.append(position)
+    
+    
     def read(self, num_frames: int, block: bool = True, 
-             timeout: float | None = None) -> np.ndarray:
+             timeout: float | None = None, out: np.ndarray | None = None) -> np.ndarray:
         """
         Citeste frame-uri audio din buffer (apelat din main thread).
         
         num_frames: Numar frame-uri de citit
         block: Daca True asteapta date, daca False returneaza imediat
         timeout: Secunde maxime de asteptare (None = infinit), doar daca block=True
+        out: Buffer float32 (>= num_frames, canale) in care se scrie, fara alocare
         
         returneaza:
             Date audio (frames_reale, canale) unde frames_reale <= num_frames.
+            Cu out, un view out[:frames_reale].
             Returneaza array gol (0, canale) daca nu sunt date si nu blocheaza.
         """
+        if out is not None:
+            if out.dtype != np.float32 or out.ndim != 2 or out.shape[1] != self._channels:
+                raise ValueError(f"out must be float32 (frames, {self._channels})")
+            num_frames = min(num_frames, out.shape[0])
+        
         if num_frames <= 0:
             return np.empty((0, self._channels), dtype=np.float32)
         
@@ -153,9 +286,17 @@ class RingBuffer:
             frames_to_read = min(num_frames, self._size)
             
             if frames_to_read == 0:
+                self.last_read_gaps = []
                 return np.empty((0, self._channels), dtype=np.float32)
             
-            output = self._copy_from_buffer(frames_to_read)
+            output = self._copy_from_buffer(frames_to_read, out)
+            start = self._written - self._size
             self._size -= frames_to_read
+            if self._gaps:
+                end = start + frames_to_read
+                self.last_read_gaps = [gap - start for gap in self._gaps if start <= gap < end]
+                self._gaps = [gap for gap in self._gaps if gap >= end]
+            else:
+                self.last_read_gaps = []
             
             return output
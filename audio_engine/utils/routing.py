@@ -0,0 +1,86 @@
+import numpy as np
+
+
+# ordinea canalelor ca in WAV / SMPTE: quad = L R Ls Rs, 5.1 = L R C LFE Ls Rs
+_HALF = float(np.sqrt(0.5))
+
+# matrici standard (output x input); downmix-urile surround urmeaza ITU-R BS.775 (LFE omis)
+MIX_PRESETS = {
+    "mono_to_stereo": [[1.0], [1.0]],
+    "stereo_to_mono": [[0.5, 0.5]],
+    "stereo_to_quad": [[1, 0], [0, 1], [0, 0], [0, 0]],
+    "quad_to_stereo": [[1, 0, _HALF, 0], [0, 1, 0, _HALF]],
+    "mono_to_5.1": [[0], [0], [1], [0], [0], [0]],
+    "stereo_to_5.1": [[1, 0], [0, 1], [0, 0], [0, 0], [0, 0], [0, 0]],
+    "5.1_to_stereo": [[1, 0, _HALF, 0, _HALF, 0], [0, 1, _HALF, 0, 0, _HALF]],
+    "5.1_to_mono": [[0.5, 0.5, _HALF, 0, 0.5 * _HALF, 0.5 * _HALF]],
+}
+
+
+def mix_matrix(inputs: int, outputs: int, preset: str | None = None) -> np.ndarray:
+    """
+    Matricea de mix (outputs, inputs) pentru un numar de canale
+    Fara preset: identitate, presetul standard pentru perechea de canale (MIX_PRESETS)
+    sau, pentru alte perechi, canalul de output j primeste input-ul j % inputs (upmix)
+    respectiv media input-urilor i cu i % outputs == j (downmix)
+    """
+    if preset is not None:
+        if preset not in MIX_PRESETS:
+            raise ValueError(f"Unknown mix preset: {preset} (expected one of {', '.join(MIX_PRESETS)})")
+        matrix = np.array(MIX_PRESETS[preset], dtype=np.float32)
+        if matrix.shape != (outputs, inputs):
+            raise ValueError(f"Preset {preset} mixes {matrix.shape[1]} -> {matrix.shape[0]} channels, "
+                             f"not {inputs} -> {outputs}")
+        return matrix
+
+    if inputs == outputs:
+        return np.eye(outputs, dtype=np.float32)
+    for matrix in MIX_PRESETS.values():
+        if len(matrix) == outputs and len(matrix[0]) == inputs:
+            return np.array(matrix, dtype=np.float32)
+
+    matrix = np.zeros((outputs, inputs), dtype=np.float32)
+    if outputs > inputs:
+        matrix[np.arange(outputs), np.arange(outputs) % inputs] = 1.0
+    else:
+        matrix[np.arange(inputs) % outputs, np.arange(inputs)] = 1.0
+        matrix /= matrix.sum(axis=1, keepdims=True)
+    return matrix
+
+
+class ChannelRouter:
+    """
+    Etapa de rutare: (frames, inputs) -> (frames, outputs) printr-un singur matmul
+    Cu reuse=True rezultatul e scris intr-un buffer prealocat (crescut doar la blocuri
+    mai mari), valid pana la urmatorul apel
+    """
+
+    def __init__(self, matrix):
+        matrix = np.asarray(matrix, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.size == 0:
+            raise ValueError("matrix must be 2D (outputs, inputs)")
+        self.matrix = matrix
+        self._matrix_t = np.ascontiguousarray(matrix.T)
+        self._buffer = np.empty((0, matrix.shape[0]), dtype=np.float32)
+
+    @property
+    def inputs(self) -> int:
+        return self.matrix.shape[1]
+
+    @property
+    def outputs(self) -> int:
+        return self.matrix.shape[0]
+
+    def apply(self, buffer: np.ndarray, reuse: bool = True) -> np.ndarray:
+        if buffer.ndim == 1:
+            buffer = buffer[:, None]
+        if buffer.shape[1] != self.inputs:
+            raise ValueError(f"Channel mismatch: got {buffer.shape[1]}, expected {self.inputs}")
+        buffer = buffer.astype(np.float32, copy=False)
+        if not reuse:
+            return buffer @ self._matrix_t
+
+        frames = buffer.shape[0]
+        if self._buffer.shape[0] < frames:
+            self._buffer = np.empty((frames, self.outputs), dtype=np.float32)
+        return np.matmul(buffer, self._matrix_t, out=self._buffer[:frames])
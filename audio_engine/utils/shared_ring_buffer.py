@@ -0,0 +1,127 @@
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+from .ring_buffer import RingBuffer
+
+
+# header-ul partajat (int64, inaintea datelor): starea pe care o modifica ambele procese
+_HEADER_FIELDS = ("_write_pos", "_read_pos", "_size", "_written", "dropped")
+_HEADER_BYTES = 64
+
+
+def _shared_field(index: int):
+    def get(self):
+        return int(self._header[index])
+
+    def set(self, value):
+        # la atasare RingBuffer.__init__ nu trebuie sa reseteze starea existenta
+        if not self._attaching:
+            self._header[index] = value
+
+    return property(get, set)
+
+
+class SharedRingBuffer(RingBuffer):
+    """
+    RingBuffer in `multiprocessing.shared_memory`, folosit intre doua procese
+    Aceeasi semantica la write/read (politica de overflow, read blocant cu timeout,
+    conversia tipului de stocare); pozitiile si contoarele sunt in header-ul partajat,
+    iar lock-ul e un multiprocessing.Condition
+
+    Un proces il creeaza (name=None), celalalt se ataseaza cu spec() si acelasi
+    `condition` (primit la pornirea procesului)
+    Capacitatea e fixa (fara overflow="grow"), iar pozitiile golurilor
+    (last_read_gaps) raman in procesul care scrie
+    """
+
+    _write_pos = _shared_field(0)
+    _read_pos = _shared_field(1)
+    _size = _shared_field(2)
+    _written = _shared_field(3)
+    dropped = _shared_field(4)
+
+    def __init__(self, capacity_frames: int, channels: int, dtype="float32", overflow: str = "drop_oldest",
+                 name: str | None = None, condition=None):
+        """
+            capacity_frames: Numar maxim de frame-uri audio
+            channels: Numar canale
+            dtype: Tipul de stocare: "float32", "float16" sau "int16"
+            overflow: "drop_oldest" sau "drop_newest"
+            name: Blocul de memorie partajata la care se ataseaza (None = creeaza unul nou)
+            condition: multiprocessing.Condition comun ambelor procese
+        """
+        if overflow == "grow":
+            raise ValueError("SharedRingBuffer has a fixed capacity (overflow='grow' not supported)")
+        self._name = name
+        self._shm = None
+        self._header = None
+        self._attaching = name is not None
+        super().__init__(capacity_frames, channels, dtype, overflow=overflow)
+        self._attaching = False
+
+        if condition is None:
+            condition = multiprocessing.get_context("spawn").Condition()
+        self._lock = condition
+        self._data_available = condition
+        # blocuri pe care try_write() nu le-a putut scrie (lock ocupat de cititor)
+        self.skipped = 0
+
+    def _allocate(self, capacity_frames: int, channels: int, dtype: np.dtype) -> np.ndarray:
+        nbytes = _HEADER_BYTES + capacity_frames * channels * dtype.itemsize
+        if self._name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self._shm = shared_memory.SharedMemory(name=self._name)
+            if self._shm.size < nbytes:
+                raise ValueError(f"Shared memory block {self._name} is too small ({self._shm.size} < {nbytes} bytes)")
+        self._header = np.ndarray((len(_HEADER_FIELDS),), dtype=np.int64, buffer=self._shm.buf)
+        return np.ndarray((capacity_frames, channels), dtype=dtype, buffer=self._shm.buf, offset=_HEADER_BYTES)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    # argumentele pentru atasarea din celalalt proces: SharedRingBuffer(**spec, condition=...)
+    def spec(self) -> dict:
+        return {
+            "capacity_frames": self._capacity,
+            "channels": self._channels,
+            "dtype": self._buffer.dtype.name,
+            "overflow": self._overflow,
+            "name": self._shm.name,
+        }
+
+    def try_write(self, data: np.ndarray) -> bool:
+        """
+        Ca write(), dar nu asteapta niciodata lock-ul: daca celalalt proces il tine
+        (ex. cititorul a ramas fara GIL in mijlocul unei copieri) blocul e sarit
+        Pentru scriitorul real-time; returneaza False daca blocul a fost sarit
+        """
+        if not self._lock.acquire(False):
+            self.skipped += 1
+            return False
+        try:
+            # lock-ul e reentrant, write() il reia
+            self.write(data)
+        finally:
+            self._lock.release()
+        return True
+
+    def close(self, unlink: bool = False):
+        """
+        Elibereaza maparea in procesul curent; unlink=True sterge si blocul de memorie
+        (o singura data, de procesul care l-a creat, dupa ce celalalt s-a detasat)
+        """
+        if self._shm is None:
+            return
+        # view-urile numpy tin buffer-ul exportat, trebuie eliberate inainte de close()
+        self._buffer = None
+        self._header = None
+        self._shm.close()
+        if unlink:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
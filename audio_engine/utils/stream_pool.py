@@ -0,0 +1,112 @@
+import threading
+
+
+class _Callback:
+    # callback-ul unui stream de input din pool: tinta e schimbata la fiecare reutilizare
+    def __init__(self):
+        self.target = None
+
+    def __call__(self, indata, frames, time, status):
+        target = self.target
+        if target is not None:
+            target(indata, frames, time, status)
+
+
+def _close(stream):
+    try:
+        stream.abort()
+        stream.close()
+    except Exception:
+        pass
+
+
+class StreamPool:
+    """
+    Stream-uri sounddevice pastrate deschise intre sesiuni (warm restart)
+
+    Un stream eliberat e oprit (fara audio), dar ramane deschis; urmatoarea cerere cu
+    aceiasi parametri (directie, samplerate, canale, blocksize, device) il reporneste
+    in loc sa redeschida device-ul (lent si uneori esueaza pe device-uri ocupate)
+    Un stream liber cu alti parametri pe aceeasi directie e inchis la urmatoarea cerere,
+    deci pool-ul tine cel mult un input si un output nefolosite
+    """
+
+    def __init__(self):
+        self._idle = {}
+        self._active = {}
+        self._lock = threading.Lock()
+
+        self.opened = 0
+        self.reused = 0
+
+    # stream pornit; callback(indata, frames, time, status) ca la sounddevice.InputStream
+    def input_stream(self, callback, **params):
+        return self._acquire("input", params, callback)
+
+    # stream pornit, scris cu write() ca sounddevice.OutputStream
+    def output_stream(self, **params):
+        return self._acquire("output", params, None)
+
+    def _acquire(self, direction: str, params: dict, callback):
+        import sounddevice
+
+        key = (direction,) + tuple(sorted(params.items()))
+        with self._lock:
+            entry = self._idle.pop(key, None)
+            stale = [self._idle.pop(k)[0] for k in list(self._idle) if k[0] == direction]
+        for stream in stale:
+            _close(stream)
+
+        if entry is None:
+            if direction == "input":
+                trampoline = _Callback()
+                stream = sounddevice.InputStream(callback=trampoline, **params)
+            else:
+                trampoline = None
+                stream = sounddevice.OutputStream(**params)
+            self.opened += 1
+        else:
+            stream, trampoline = entry
+            self.reused += 1
+
+        if trampoline is not None:
+            trampoline.target = callback
+        stream.start()
+        with self._lock:
+            self._active[id(stream)] = (key, trampoline)
+        return stream
+
+    def release(self, stream):
+        """
+        Opreste stream-ul si il pastreaza pentru urmatoarea cerere cu aceiasi parametri
+        """
+        with self._lock:
+            key, trampoline = self._active.pop(id(stream), (None, None))
+        if key is None:
+            _close(stream)
+            return
+        try:
+            stream.stop()
+        except Exception:
+            _close(stream)
+            return
+        if trampoline is not None:
+            trampoline.target = None
+
+        with self._lock:
+            previous = self._idle.pop(key, None)
+            self._idle[key] = (stream, trampoline)
+        if previous is not None:
+            _close(previous[0])
+
+    # inchide stream-urile nefolosite; cele in uz raman ale surselor / consumer-elor
+    def close(self):
+        with self._lock:
+            idle = [stream for stream, _ in self._idle.values()]
+            self._idle.clear()
+        for stream in idle:
+            _close(stream)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"opened": self.opened, "reused": self.reused, "idle": len(self._idle)}
@@ -0,0 +1,97 @@
+import numpy as np
+
+
+# ce face sursa live cand input-ul nu ajunge la timp:
+# block   - asteapta datele (sesiunea se opreste doar daca device-ul se opreste)
+# silence - completeaza cu liniste, cu rampa de la ultimul frame (fara click)
+# repeat  - repeta ultimele milisecunde de input (ping-pong), cu fade-out
+UNDERRUN_POLICIES = ("block", "silence", "repeat")
+
+
+class UnderrunConcealer:
+    """
+    Completeaza blocurile incomplete ale unei surse live fara discontinuitati
+
+    Golul incepe mereu de la ultimul frame emis: "silence" coboara liniar la 0 in
+    `fade_ms`, "repeat" reda istoricul de `history_ms` inapoi si inainte (ping-pong,
+    deci continuu la fiecare intoarcere) cu gain care scade la 0 in `repeat_ms`
+    Cand datele revin, continuarea golului e mixata in ele pe `fade_ms` (crossfade);
+    la fel dupa discontinuity() (frame-uri pierdute la overflow)
+
+    Pe blocurile complete costul e doar copia ultimelor `history_ms` de input
+    """
+
+    def __init__(
+        self,
+        channels: int,
+        samplerate: int,
+        policy: str = "silence",
+        fade_ms: float = 5.0,
+        history_ms: float = 20.0,
+        repeat_ms: float = 100.0,
+    ):
+        if policy not in ("silence", "repeat"):
+            raise ValueError(f"Unknown concealment policy: {policy} (expected silence or repeat)")
+        self.channels = channels
+        self.policy = policy
+        self.fade = max(1, int(samplerate * fade_ms / 1000.0))
+        self.period = max(1, int(samplerate * history_ms / 1000.0))
+        self.repeat = max(1, int(samplerate * repeat_ms / 1000.0))
+
+        self.concealed_frames = 0
+        self._history = np.zeros((self.period, channels), dtype=np.float32)
+        # pozitia in golul curent; _gap: urmatoarele date trebuie mixate (crossfade)
+        self._offset = 0
+        self._gap = False
+
+    # urmatoarele date nu continua ultimele frame-uri emise (ex. date pierdute la overflow)
+    def discontinuity(self):
+        self._gap = True
+
+    # `count` frame-uri de continuare a golului, de la pozitia curenta
+    def _conceal(self, count: int) -> np.ndarray:
+        steps = self._offset + 1 + np.arange(count)
+        if self.policy == "silence":
+            gain = np.maximum(0.0, 1.0 - steps / self.fade).astype(np.float32)
+            return self._history[-1] * gain[:, None]
+
+        # ping-pong: history[-2], history[-3], ..., history[0], history[0], ..., history[-1], ...
+        phase = steps % (2 * self.period)
+        index = np.where(phase < self.period, self.period - 1 - phase, phase - self.period)
+        gain = np.maximum(0.0, 1.0 - steps / self.repeat).astype(np.float32)
+        return self._history[index] * gain[:, None]
+
+    def _remember(self, data: np.ndarray):
+        frames = data.shape[0]
+        if frames >= self.period:
+            self._history = data[-self.period:].copy()
+        elif frames:
+            self._history = np.concatenate((self._history[frames:], data))
+
+    def process(self, data: np.ndarray, num_frames: int) -> np.ndarray:
+        """
+        data: frame-urile primite (<= num_frames); returneaza exact num_frames frame-uri
+        """
+        frames = data.shape[0]
+        if frames and self._gap:
+            # revenire: crossfade din continuarea golului in datele noi
+            n = min(self.fade, frames)
+            tail = self._conceal(n)
+            weight = ((np.arange(n) + 1.0) / (n + 1.0)).astype(np.float32)[:, None]
+            data = data.copy()
+            data[:n] = tail + (data[:n] - tail) * weight
+            self._offset = 0
+            self._gap = False
+
+        self._remember(data)
+        missing = num_frames - frames
+        if missing <= 0:
+            return data
+
+        fill = self._conceal(missing)
+        self._offset += missing
+        self._gap = True
+        self.concealed_frames += missing
+        if frames == 0:
+            return fill
+        return np.concatenate((data, fill))
@@ -0,0 +1,70 @@
+import time
+
+
+class XrunMonitor:
+    """
+    Numara xrun-urile unei bucle audio dupa momentele in care livreaza blocurile
+
+    Modelul: un device de output porneste la primul bloc si consuma in timp real,
+    cu `latency` secunde de buffer; un bloc livrat dupa ce device-ul a consumat tot
+    ce primise e un xrun (device-ul reda liniste si se resincronizeaza)
+    Pentru bucle in ritmul unui device (input live); un render mai rapid decat
+    timpul real nu produce niciodata xrun-uri
+    """
+
+    def __init__(self, samplerate: int, latency: float, clock=time.perf_counter):
+        """
+            samplerate: Rata device-ului
+            latency: Secunde de audio tinute in buffer-ul device-ului
+            clock: Sursa de timp (secunde)
+        """
+        if samplerate <= 0:
+            raise ValueError("samplerate must be > 0")
+        self.samplerate = samplerate
+        self.latency = float(latency)
+        self._clock = clock
+        self._start = None
+        self._frames = 0
+
+        self.blocks = 0
+        self.xruns = 0
+        self.max_late = 0.0
+
+    def reset(self):
+        self._start = None
+        self._frames = 0
+        self.blocks = 0
+        self.xruns = 0
+        self.max_late = 0.0
+
+    # dupa o pauza: urmatorul bloc e din nou primul (pauza nu e un xrun)
+    def resync(self):
+        self._start = None
+        self._frames = 0
+
+    def tick(self, frames: int):
+        """
+        Apelat la livrarea fiecarui bloc de `frames` frame-uri
+        """
+        now = self._clock()
+        self.blocks += 1
+        if self._start is None:
+            self._start = now
+            self._frames = frames
+            return
+
+        # cat a intarziat blocul fata de momentul in care ar fi inceput redarea lui
+        late = now - (self._start + self._frames / self.samplerate)
+        self.max_late = max(self.max_late, late)
+        if late > self.latency:
+            self.xruns += 1
+            self._start += late - self.latency
+        self._frames += frames
+
+    def stats(self) -> dict:
+        return {
+            "blocks": self.blocks,
+            "xruns": self.xruns,
+            "max_late_ms": self.max_late * 1e3,
+            "latency_ms": self.latency * 1e3,
+        }
@@ -0,0 +1,112 @@
+"""
+Simulare: un device de input cu ceasul decalat cu --ppm fata de device-ul de output,
+cu si fara DriftCompensator; raporteaza nivelul buffer-ului, overflow-uri si underrun-uri
+
+    python benchmarks/bench_drift.py --ppm 80 -120 --hours 3 --blocksize 512
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.utils.drift import DriftCompensator
+from audio_engine.utils.ring_buffer import RingBuffer
+
+
+def simulate(ppm, args, compensate):
+    sr = args.samplerate
+    capacity = max(args.blocksize * 4, int(sr * args.buffer_seconds))
+    ring = RingBuffer(capacity_frames=capacity, channels=1)
+    clock = [0.0]
+    drift = None
+    if compensate:
+        drift = DriftCompensator(sr, 1, target_frames=capacity // 2, clock=lambda: clock[0])
+
+    # sinus continuu la rata input-ului: output-ul trebuie sa ramana un sinus curat
+    in_rate = sr * (1.0 + ppm * 1e-6)
+    in_block = args.blocksize
+    in_period = in_block / in_rate
+    out_period = args.blocksize / sr
+    freq = 1000.0
+
+    in_time = 0.0
+    in_frames = 0
+    overflows = 0
+    underruns = 0
+    fills = []
+    worst_step = 0.0
+    previous = None
+
+    # primul bloc de output abia dupa ce input-ul a umplut jumatate din buffer
+    out_time = capacity / 2 / in_rate
+    end = args.hours * 3600.0
+    while out_time < end:
+        while in_time <= out_time:
+            t = (in_frames + np.arange(in_block)) / in_rate
+            block = (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32)[:, None]
+            if ring.available() + in_block > capacity:
+                overflows += 1
+            clock[0] = in_time
+            ring.write(block)
+            if drift is not None:
+                drift.on_input(in_block)
+            in_frames += in_block
+            in_time += in_period
+
+        clock[0] = out_time
+        if drift is None:
+            if ring.available() < args.blocksize:
+                underruns += 1
+            out = ring.read(args.blocksize, block=False)
+        else:
+            if ring.available() < drift.resampler.needed(args.blocksize, drift.ratio):
+                underruns += 1
+            out = drift.read(ring, args.blocksize, timeout=0.0)
+        fills.append(ring.available())
+
+        # discontinuitate: saltul maxim intre frame-uri consecutive (sinusul are ~0.07)
+        if out.shape[0]:
+            joined = out[:, 0] if previous is None else np.concatenate(([previous], out[:, 0]))
+            worst_step = max(worst_step, float(np.abs(np.diff(joined)).max(initial=0.0)))
+            previous = out[-1, 0]
+        out_time += out_period
+
+    fills = np.asarray(fills[len(fills) // 10:])
+    return {
+        "overflows": overflows,
+        "underruns": underruns,
+        "fill": (int(fills.min()), int(fills.max()), capacity),
+        "ppm": None if drift is None else drift.stats()["drift_ppm"],
+        "step": worst_step,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ppm", type=float, nargs="+", default=[50.0, -200.0])
+    parser.add_argument("--hours", type=float, default=2.0)
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, default=512)
+    parser.add_argument("--buffer-seconds", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{args.hours:g} h simulated @ {args.samplerate} Hz, blocksize {args.blocksize}")
+    for ppm in args.ppm:
+        for compensate in (False, True):
+            start = time.perf_counter()
+            res = simulate(ppm, args, compensate)
+            elapsed = time.perf_counter() - start
+            low, high, capacity = res["fill"]
+            estimate = "" if res["ppm"] is None else f"  estimated {res['ppm']:+8.2f} ppm"
+            print(f"  {ppm:+7.1f} ppm  {'drift' if compensate else 'plain'}:"
+                  f"  overflows {res['overflows']:>6}  underruns {res['underruns']:>6}"
+                  f"  fill {low:>5}..{high:<5} / {capacity}  max step {res['step']:.3f}"
+                  f"{estimate}  ({elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
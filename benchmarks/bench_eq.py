@@ -0,0 +1,56 @@
+"""
+EQ cu 10 benzi (cascada de biquad-uri): de cate ori mai rapid decat timpul real, pe blocksize
+
+    python benchmarks/bench_eq.py --channels 2 --samplerate 48000 --blocksize 64 256 1024
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.effects.eq import EqEffect
+
+
+BANDS = [
+    {"type": "highpass", "freq": 30.0, "q": 0.707},
+    {"type": "lowshelf", "freq": 80.0, "gain_db": 3.0, "q": 0.707},
+    {"type": "peak", "freq": 200.0, "gain_db": -2.0, "q": 1.4},
+    {"type": "peak", "freq": 500.0, "gain_db": 1.5, "q": 1.0},
+    {"type": "peak", "freq": 1000.0, "gain_db": -1.0, "q": 2.0},
+    {"type": "peak", "freq": 2500.0, "gain_db": 2.0, "q": 1.0},
+    {"type": "peak", "freq": 4000.0, "gain_db": -3.0, "q": 4.0},
+    {"type": "peak", "freq": 6500.0, "gain_db": 1.0, "q": 1.0},
+    {"type": "highshelf", "freq": 10000.0, "gain_db": -2.0, "q": 0.707},
+    {"type": "lowpass", "freq": 18000.0, "q": 0.707},
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, nargs="+", default=[64, 256, 1024])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = (rng.standard_normal((int(args.seconds * args.samplerate), args.channels)) * 0.2).astype(np.float32)
+
+    print(f"{len(BANDS)} bands, {args.channels} ch @ {args.samplerate} Hz, {args.seconds:.0f} s")
+    for blocksize in args.blocksize:
+        eq = EqEffect(BANDS)
+        eq.apply(data[:blocksize], args.samplerate)
+        start = time.perf_counter()
+        for i in range(0, data.shape[0], blocksize):
+            eq.apply(data[i:i + blocksize], args.samplerate)
+        elapsed = time.perf_counter() - start
+        print(f"  block {blocksize:>5}: {elapsed / args.seconds * 1e3:7.2f} ms per second of audio"
+              f"  ({args.seconds / elapsed:6.0f}x realtime)")
+
+
+if __name__ == "__main__":
+    main()
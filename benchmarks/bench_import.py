@@ -0,0 +1,47 @@
+"""
+Timpul de `import audio_engine` intr-un proces nou (cum pornesc worker-ii din process pool)
+Verifica si ca backend-urile grele nu sunt importate
+
+    python benchmarks/bench_import.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import audio_engine
+engine = audio_engine.AudioEngine()
+engine.configure_input("file", path="in.wav").configure_output("file", path="out.wav")
+elapsed = time.perf_counter() - start
+heavy = [m for m in ("numpy", "soundfile", "sounddevice", "asyncio", "importlib.metadata") if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    times = []
+    heavy = ""
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, "-c", SNIPPET], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(out[0]) * 1000.0)
+        heavy = out[1] if len(out) > 1 else ""
+
+    print(f"import audio_engine + configure ({args.runs} runs)")
+    print(f"  median {statistics.median(times):.2f} ms, min {min(times):.2f} ms, max {max(times):.2f} ms")
+    print(f"  heavy modules loaded: {heavy or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
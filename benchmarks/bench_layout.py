@@ -0,0 +1,76 @@
+"""
+Layout-ul buffer-elor in lant: interleaved (frames, channels) vs planar (channels, frames)
+Timp per bloc pentru fiecare efect si pentru tot lantul prin AudioEngine, la 1, 2 si 16 canale
+
+    python benchmarks/bench_layout.py --channels 1 2 16 --blocksize 1024
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine import AudioEngine
+from audio_engine.effects.registry import EffectRegistry
+
+
+def bench_effect(name, data, blocksize, samplerate, planar, repeats):
+    eff = EffectRegistry().get(name)()
+    if planar:
+        blocks = [np.ascontiguousarray(data[i:i + blocksize].T) for i in range(0, data.shape[0], blocksize)]
+        run = eff.apply_planar
+    else:
+        blocks = [data[i:i + blocksize] for i in range(0, data.shape[0], blocksize)]
+        run = eff.apply
+
+    run(blocks[0], samplerate)
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for block in blocks:
+            run(block, samplerate)
+        best = min(best, time.perf_counter() - start)
+    return best / len(blocks)
+
+
+def bench_chain(chain, data, blocksize, samplerate, planar, repeats):
+    engine = AudioEngine(samplerate=samplerate, blocksize=blocksize, silence_threshold=None, planar=planar)
+    for name in chain:
+        engine.add_effect(name)
+
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        engine.process_array(data, samplerate, tail=False)
+        best = min(best, time.perf_counter() - start)
+    return best / -(-data.shape[0] // blocksize)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 2, 16])
+    parser.add_argument("--chain", nargs="+", default=["gain", "echo", "reverb", "tremolo", "distortion"])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--blocksize", type=int, default=1024)
+    parser.add_argument("--samplerate", type=int, default=44100)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for channels in args.channels:
+        data = (rng.standard_normal((int(args.seconds * args.samplerate), channels)) * 0.2).astype(np.float32)
+        print(f"{channels} ch, blocks of {args.blocksize} (us/block, best of {args.repeats})   interleaved      planar")
+        for name in args.chain:
+            inter = bench_effect(name, data, args.blocksize, args.samplerate, False, args.repeats)
+            planar = bench_effect(name, data, args.blocksize, args.samplerate, True, args.repeats)
+            print(f"  {name:<24} {inter * 1e6:14.1f} {planar * 1e6:11.1f}")
+        inter = bench_chain(args.chain, data, args.blocksize, args.samplerate, False, args.repeats)
+        planar = bench_chain(args.chain, data, args.blocksize, args.samplerate, True, args.repeats)
+        print(f"  {'engine (chain + limiter)':<24} {inter * 1e6:14.1f} {planar * 1e6:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Politicile de overflow / underrun ale LiveSource, pe un stream de input simulat
+(sounddevice inlocuit cu un stub, callback-ul e apelat direct, timp simulat):
+- overflow: consumatorul se opreste --stall secunde, input-ul continua
+- underrun: input-ul se opreste --stall secunde, output-ul cere blocuri in continuare
+  (la "block" read() asteapta in timp real pana revine input-ul)
+
+Raporteaza frame-urile pierdute / completate, latenta maxima si cel mai mare salt intre
+doua frame-uri consecutive (sinusul curat are ~0.03; un click e de ordinul 0.1 - 1)
+Verificarile (numar de frame-uri, statistici, continuitate) sunt in tests/test_live_policies.py
+
+    python benchmarks/bench_live_policies.py --stall 0.25 0.8 --blocksize 512
+"""
+import argparse
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+FREQ = 440.0
+
+
+class StubInputStream:
+    """
+    Inlocuieste sounddevice.InputStream: push() livreaza blocuri de sinus continuu
+    """
+
+    def __init__(self, callback=None, blocksize=1024, samplerate=48000, **kwargs):
+        self.callback = callback
+        self.blocksize = blocksize
+        self.samplerate = samplerate
+        self.position = 0
+        self.active = False
+
+    def push(self, blocks=1):
+        for _ in range(blocks):
+            t = (self.position + np.arange(self.blocksize)) / self.samplerate
+            data = (0.5 * np.sin(2 * np.pi * FREQ * t)).astype(np.float32)[:, None]
+            self.callback(data, self.blocksize, None, None)
+            self.position += self.blocksize
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+
+sys.modules["sounddevice"] = types.SimpleNamespace(InputStream=StubInputStream)
+
+from audio_engine.sources.live_source import LiveSource
+from audio_engine.utils.ring_buffer import OVERFLOW_POLICIES
+from audio_engine.utils.underrun import UNDERRUN_POLICIES
+
+
+def max_step(blocks):
+    signal = np.concatenate(blocks)[:, 0]
+    return float(np.abs(np.diff(signal)).max())
+
+
+def make_source(args, **kwargs):
+    return LiveSource(samplerate=args.samplerate, channels=1, blocksize=args.blocksize,
+                      buffer_seconds=args.buffer_seconds, **kwargs)
+
+
+def overflow_run(policy, stall, args):
+    sr, block = args.samplerate, args.blocksize
+    source = make_source(args, overflow=policy, max_buffer_seconds=args.max_buffer_seconds)
+    stream = source._stream
+
+    stall_start = int(args.seconds / 3 * sr / block)
+    stall_blocks = int(stall * sr / block)
+    out, latency = [], 0
+    for i in range(int(args.seconds * sr / block)):
+        stream.push()
+        if stall_start <= i < stall_start + stall_blocks:
+            continue
+        # dupa stall consumatorul recupereaza tot ce e in buffer
+        while source.ring_buffer.available() >= block:
+            latency = max(latency, source.ring_buffer.available())
+            out.append(source.read(block))
+    source.close()
+    return {"lost": source.stats()["dropped"], "latency_ms": latency / sr * 1e3, "step": max_step(out)}
+
+
+def underrun_run(policy, stall, args):
+    sr, block = args.samplerate, args.blocksize
+    source = make_source(args, underrun=policy, underrun_timeout=0.0 if policy != "block" else None)
+    stream = source._stream
+
+    stall_start = int(args.seconds / 3 * sr / block)
+    stall_blocks = max(1, int(stall * sr / block))
+    out, blocked = [], 0.0
+    i = 0
+    while i < int(args.seconds * sr / block):
+        if i == stall_start and policy == "block":
+            # input-ul revine dupa stall (timp real); read() asteapta, nu completeaza
+            timer = threading.Timer(stall, stream.push)
+            start = time.perf_counter()
+            timer.start()
+            out.append(source.read(block))
+            blocked = time.perf_counter() - start
+            timer.join()
+            i += stall_blocks + 1
+            continue
+        if not stall_start <= i < stall_start + stall_blocks:
+            stream.push()
+        out.append(source.read(block))
+        i += 1
+    source.close()
+    stats = source.stats()
+    return {"filled": stats["concealed_frames"], "underruns": stats["underruns"],
+            "blocked_ms": blocked * 1e3, "step": max_step(out)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stall", type=float, nargs="+", default=[0.05, 0.5])
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, default=512)
+    parser.add_argument("--seconds", type=float, default=6.0)
+    parser.add_argument("--buffer-seconds", type=float, default=0.1)
+    parser.add_argument("--max-buffer-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{args.samplerate} Hz, blocksize {args.blocksize}, buffer {args.buffer_seconds * 1e3:.0f} ms")
+    for stall in args.stall:
+        print(f"stalled consumer, {stall * 1e3:.0f} ms (overflow)")
+        for policy in OVERFLOW_POLICIES:
+            res = overflow_run(policy, stall, args)
+            print(f"  {policy:<12} lost {res['lost']:>7} frames  max latency {res['latency_ms']:7.1f} ms"
+                  f"  max step {res['step']:.3f}")
+        print(f"stalled input, {stall * 1e3:.0f} ms (underrun)")
+        for policy in UNDERRUN_POLICIES:
+            res = underrun_run(policy, stall, args)
+            print(f"  {policy:<12} filled {res['filled']:>7} frames  underruns {res['underruns']:>4}"
+                  f"  blocked {res['blocked_ms']:6.1f} ms  max step {res['step']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
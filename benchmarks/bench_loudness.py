@@ -0,0 +1,99 @@
+"""
+Normalizare la o tinta de loudness: render + analiza separata a fisierului + trecere
+de gain (fluxul vechi) fata de enable_normalization() (masurare fara consumer, apoi
+un singur render cu corectia) si un render repetat cu masuratoarea din cache
+Plus costul LoudnessMeter pe blocurile engine-ului, ca fractie din timpul real
+
+    python benchmarks/bench_loudness.py --seconds 60 --blocksize 512
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine import AudioEngine
+from audio_engine.analysis.loudness import LoudnessMeter
+
+
+TARGET_LUFS = -14.0
+
+
+def engine_for(args, path, out):
+    engine = AudioEngine(blocksize=args.blocksize)
+    engine.add_effect("eq").add_effect("reverb").add_effect("echo")
+    engine.configure_input("file", path=path).configure_output("file", path=out)
+    return engine
+
+
+def separate_passes(args, path, out):
+    engine_for(args, path, out).start()
+
+    # analiza fisierului randat, apoi gain-ul aplicat pe el
+    data, samplerate = sf.read(out, dtype="float32")
+    meter = LoudnessMeter(samplerate)
+    meter(data)
+    gain = 10.0 ** ((TARGET_LUFS - meter.integrated()) / 20.0)
+    sf.write(out, np.clip(data * gain, -1.0, 1.0), samplerate)
+
+
+def two_pass(args, path, out, cache):
+    engine = engine_for(args, path, out)
+    engine.enable_normalization(target_lufs=TARGET_LUFS, cache_path=cache)
+    engine.build()
+    engine.start()
+    return engine.get_loudness_report()
+
+
+def timed(fn, *fn_args):
+    start = time.perf_counter()
+    result = fn(*fn_args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, default=512)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frames = int(args.seconds * args.samplerate)
+    data = (rng.standard_normal((frames, 2)) * 0.05).astype(np.float32)
+
+    meter = LoudnessMeter(args.samplerate)
+    start = time.perf_counter()
+    for pos in range(0, frames, args.blocksize):
+        meter(data[pos:pos + args.blocksize])
+    cost = time.perf_counter() - start
+    print(f"LoudnessMeter: {cost / args.seconds:.2%} of real time "
+          f"({args.blocksize}-frame stereo blocks at {args.samplerate} Hz)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "input.wav")
+        out = str(Path(tmp) / "output.wav")
+        cache = str(Path(tmp) / "loudness.json")
+        sf.write(path, data, args.samplerate)
+
+        print(f"{args.seconds:g} s stereo, chain eq + reverb + echo, target {TARGET_LUFS} LUFS")
+        elapsed, _ = timed(separate_passes, args, path, out)
+        print(f"  render + analysis + gain pass {elapsed:7.2f} s")
+        elapsed, report = timed(two_pass, args, path, out, cache)
+        print(f"  two-pass normalize            {elapsed:7.2f} s   (measure {report['measure_seconds']:.2f} s)")
+        elapsed, report = timed(two_pass, args, path, out, cache)
+        print(f"  repeat render (cached)        {elapsed:7.2f} s   (cached {report['cached']})")
+
+        result, samplerate = sf.read(out, dtype="float32")
+        meter = LoudnessMeter(samplerate)
+        meter(result)
+        print(f"  output loudness {meter.integrated():.2f} LUFS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Throughput pentru multe stream-uri mono pe loopback (NetworkConsumer -> NetworkSource)
+
+    python benchmarks/bench_network.py --streams 256 --protocol udp
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.sources.network_source import NetworkSource
+from audio_engine.consumers.network_consumer import NetworkConsumer
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=256)
+    parser.add_argument("--protocol", default="udp", choices=["tcp", "udp"])
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--blocksize", type=int, default=1024)
+    parser.add_argument("--batch", type=int, default=4)
+    parser.add_argument("--samplerate", type=int, default=48000)
+    args = parser.parse_args()
+
+    sources = [
+        NetworkSource(port=0, protocol=args.protocol, samplerate=args.samplerate, channels=1, buffer_seconds=10.0)
+        for _ in range(args.streams)
+    ]
+    consumers = [
+        NetworkConsumer(port=s.port, protocol=args.protocol, samplerate=args.samplerate, channels=1, batch_blocks=args.batch)
+        for s in sources
+    ]
+    block = np.zeros((args.blocksize, 1), dtype=np.float32)
+
+    start = time.perf_counter()
+    for _ in range(args.blocks):
+        for consumer in consumers:
+            consumer.write(block)
+        # receptorii golesc buffer-ele ca un engine
+        for source in sources:
+            source.ring_buffer.read(args.blocksize, block=False)
+    for consumer in consumers:
+        consumer.close()
+    elapsed = time.perf_counter() - start
+
+    audio_seconds = args.streams * args.blocks * args.blocksize / args.samplerate
+    lost = sum(s.stats()["lost"] for s in sources)
+    print(f"{args.streams} {args.protocol} streams, batch={args.batch}")
+    print(f"  {audio_seconds / elapsed:.1f}x realtime total "
+          f"({audio_seconds / elapsed / args.streams:.2f}x per stream), lost packets: {lost}")
+
+    for source in sources:
+        source.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Costul oversampling-ului doar pe efectul neliniar vs tot engine-ul la 4x samplerate
+
+    python benchmarks/bench_oversampling.py --chain gain echo distortion --factor 4
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine import AudioEngine
+
+
+def render(chain, nonlinear, samplerate, factor, data, blocksize):
+    # factor > 1 doar pe efectul neliniar; samplerate-ul engine-ului ramane `samplerate`
+    engine = AudioEngine(samplerate=samplerate, blocksize=blocksize, silence_threshold=None)
+    for name in chain:
+        engine.add_effect(name, oversample=factor if name == nonlinear else None)
+
+    start = time.perf_counter()
+    engine.process_array(data, samplerate, tail=False)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chain", nargs="+", default=["gain", "echo", "distortion"])
+    parser.add_argument("--nonlinear", default="distortion")
+    parser.add_argument("--factor", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--blocksize", type=int, default=1024)
+    parser.add_argument("--samplerate", type=int, default=44100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    sr = args.samplerate
+    data = (rng.standard_normal((int(args.seconds * sr), 1)) * 0.2).astype(np.float32)
+    # acelasi semnal la rata mare (doar costul conteaza, nu continutul)
+    data_high = np.repeat(data, args.factor, axis=0)
+
+    print(f"{args.seconds:.1f} s audio, chain: {' -> '.join(args.chain)}, {args.nonlinear} x{args.factor}")
+    native = render(args.chain, None, sr, 1, data, args.blocksize)
+    wrapped = render(args.chain, args.nonlinear, sr, args.factor, data, args.blocksize)
+    whole = render(args.chain, None, sr * args.factor, 1, data_high, args.blocksize * args.factor)
+
+    for label, elapsed in (("native", native), (f"{args.nonlinear} x{args.factor}", wrapped), (f"engine x{args.factor}", whole)):
+        print(f"  {label:<18} {elapsed * 1000:9.1f} ms  {args.seconds / elapsed:8.1f}x realtime")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Bucla DSP pe un thread din procesul "GUI" (AudioEngine) fata de procesul separat
+(ProcessEngine), cu --busy thread-uri Python ocupate in procesul GUI (redraw, logging)
+
+Input-ul e livrat in timp real (ca un device live); xrun-urile sunt numarate cu
+XrunMonitor la livrarea fiecarui bloc procesat, cu un buffer de output de 2 blocuri
+
+    python benchmarks/bench_process_engine.py --busy 0 1 2 --blocksize 256 --seconds 5
+"""
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine import AudioEngine, ProcessEngine
+from audio_engine.analysis.analyzers import PeakAnalyzer
+from audio_engine.utils.xrun import XrunMonitor
+
+
+LATENCY_BLOCKS = 2
+
+
+class PacedBlocks:
+    """
+    Blocurile unui array livrate in ritmul unui device (picklable, pentru ProcessEngine)
+    """
+
+    def __init__(self, data, samplerate, blocksize):
+        self.data = data
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+
+    def __iter__(self):
+        period = self.blocksize / self.samplerate
+        start = None
+        for i, pos in enumerate(range(0, self.data.shape[0], self.blocksize)):
+            # primul bloc e citit deja la build(): ceasul porneste la al doilea
+            if i == 1:
+                start = time.perf_counter() - period
+            elif start is not None:
+                delay = start + i * period - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            yield self.data[pos:pos + self.blocksize]
+
+
+def busy_gui(stop):
+    # redraw-uri si formatare de text in Python pur, fara pauze
+    while not stop.is_set():
+        sum(i * i for i in range(5000))
+        "".join(f"{i:05d}" for i in range(200))
+
+
+def configure(engine, data, args):
+    engine.add_effect("eq").add_effect("reverb").add_effect("echo")
+    engine.configure_input("iter", data=PacedBlocks(data, args.samplerate, args.blocksize), samplerate=args.samplerate)
+    engine.subscribe(PeakAnalyzer())
+
+
+def run(mode, busy, data, args):
+    if mode == "thread":
+        engine = AudioEngine(blocksize=args.blocksize)
+    else:
+        engine = ProcessEngine(blocksize=args.blocksize, xrun_latency_blocks=LATENCY_BLOCKS)
+    configure(engine, data, args)
+    engine.build(consumer=False)
+
+    monitor = XrunMonitor(args.samplerate, LATENCY_BLOCKS * args.blocksize / args.samplerate)
+    # ca in gui.py: bucla ruleaza pe un thread din procesul GUI
+    on_chunk = (lambda buf: monitor.tick(buf.shape[0])) if mode == "thread" else None
+    runner = threading.Thread(target=engine.start, kwargs={"on_chunk": on_chunk})
+
+    stop = threading.Event()
+    workers = [threading.Thread(target=busy_gui, args=(stop,), daemon=True) for _ in range(busy)]
+    for worker in workers:
+        worker.start()
+    runner.start()
+    runner.join()
+    stop.set()
+    for worker in workers:
+        worker.join()
+    engine.get_analysis_bus().stop()
+
+    return monitor.stats() if mode == "thread" else engine.get_process_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--busy", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, default=256)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = (rng.standard_normal((int(args.seconds * args.samplerate), 2)) * 0.1).astype(np.float32)
+
+    print(f"{args.samplerate} Hz, blocksize {args.blocksize}, output buffer {LATENCY_BLOCKS} blocks, "
+          f"{args.seconds:g} s in real time")
+    for busy in args.busy:
+        for mode in ("thread", "process"):
+            res = run(mode, busy, data, args)
+            print(f"  busy GUI threads {busy}  {mode:<8} blocks {res['blocks']:>5}  xruns {res['xruns']:>4}"
+                  f"  max late {res['max_late_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Memoria si costul conversiei per bloc pentru RingBuffer cu stocare float32 / float16 / int16
+
+    python benchmarks/bench_ring_dtype.py --channels 16 --seconds 600
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.utils.ring_buffer import RingBuffer, STORAGE_DTYPES
+
+
+def bench(dtype, args, blocks):
+    capacity = int(args.seconds * args.samplerate)
+    ring = RingBuffer(capacity_frames=capacity, channels=args.channels, dtype=dtype)
+    out = np.empty((args.blocksize, args.channels), dtype=np.float32)
+
+    start = time.perf_counter()
+    for block in blocks:
+        ring.write(block)
+    write_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in blocks:
+        ring.read(args.blocksize, block=False, out=out)
+    read_time = time.perf_counter() - start
+
+    # eroarea de cuantizare fata de float32 (dupa clip la [-1, 1])
+    ring.write(blocks[0])
+    ring.read(ring.available() - args.blocksize, block=False)
+    error = float(np.abs(ring.read(args.blocksize, block=False, out=out) - np.clip(blocks[0], -1.0, 1.0)).max())
+    return ring.nbytes, write_time / len(blocks), read_time / len(blocks), error
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=600.0)
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, default=1024)
+    parser.add_argument("--blocks", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    blocks = [
+        (rng.standard_normal((args.blocksize, args.channels)) * 0.2).astype(np.float32)
+        for _ in range(16)
+    ]
+    blocks = [blocks[idx % len(blocks)] for idx in range(args.blocks)]
+
+    print(f"{args.channels} ch x {args.seconds:.0f} s @ {args.samplerate} Hz, blocks of {args.blocksize}")
+    for dtype in STORAGE_DTYPES:
+        nbytes, write_t, read_t, error = bench(dtype, args, blocks)
+        print(f"  {dtype:<8} {nbytes / 2**20:8.1f} MB  write {write_t * 1e6:7.1f} us/block"
+              f"  read {read_t * 1e6:7.1f} us/block  max error {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
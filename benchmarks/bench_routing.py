@@ -0,0 +1,62 @@
+"""
+Costul etapei de rutare (un matmul per bloc) si castigul lantului procesat in mono
+cu upmix doar la final, fata de lantul pe toate canalele sursei
+
+    python benchmarks/bench_routing.py --channels 2 6 --blocksize 256 1024
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine import AudioEngine
+from audio_engine.utils.routing import ChannelRouter, mix_matrix
+
+
+def render(data, samplerate, blocksize, chain_channels=None, repeats=3):
+    best = None
+    for _ in range(repeats):
+        engine = AudioEngine(blocksize=blocksize)
+        engine.add_effect("eq").add_effect("reverb").add_effect("echo")
+        if chain_channels:
+            engine.set_routing(chain_channels=chain_channels)
+        start = time.perf_counter()
+        engine.process_array(data, samplerate, tail=False)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, nargs="+", default=[2, 6])
+    parser.add_argument("--blocksize", type=int, nargs="+", default=[256, 1024])
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for channels in args.channels:
+        data = (rng.standard_normal((int(args.seconds * args.samplerate), channels)) * 0.1).astype(np.float32)
+        for blocksize in args.blocksize:
+            router = ChannelRouter(mix_matrix(1, channels))
+            mono = data[:blocksize, :1].copy()
+            count = 2000
+            start = time.perf_counter()
+            for _ in range(count):
+                router.apply(mono)
+            route_us = (time.perf_counter() - start) / count * 1e6
+
+            full = render(data, args.samplerate, blocksize)
+            mixed = render(data, args.samplerate, blocksize, chain_channels=1)
+            print(f"  {channels} ch, block {blocksize:>5}: upmix {route_us:6.1f} us/block   "
+                  f"chain {channels} ch {args.seconds / full:6.0f}x realtime, "
+                  f"mono + upmix {args.seconds / mixed:6.0f}x realtime")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Throughput pentru multe sesiuni concurente: SessionBatchEngine vs un lant per sesiune
+
+    python benchmarks/bench_sessions.py --sessions 256 --chain gain echo tremolo
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.batch.session_engine import SessionBatchEngine
+
+
+def bench_batched(args, blocks):
+    batch = SessionBatchEngine(args.chain, samplerate=args.samplerate, channels=1, blocksize=args.blocksize)
+    rng = np.random.default_rng(0)
+    gain_idx = args.chain.index("gain") if "gain" in args.chain else None
+    for _ in range(args.sessions):
+        params = {gain_idx: {"gain_db": float(rng.uniform(-12, 0))}} if gain_idx is not None else None
+        batch.add_session(params)
+
+    start = time.perf_counter()
+    for block in blocks:
+        batch.process(block)
+    return time.perf_counter() - start
+
+
+def bench_per_session(args, blocks):
+    batch = SessionBatchEngine(args.chain, samplerate=args.samplerate, channels=1, blocksize=args.blocksize)
+    registry = batch._registry
+    chains = [[registry[name]() for name in args.chain] for _ in range(args.sessions)]
+
+    start = time.perf_counter()
+    for block in blocks:
+        for idx, chain in enumerate(chains):
+            x = block[idx]
+            for eff in chain:
+                x = eff.apply(x, args.samplerate)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=256)
+    parser.add_argument("--chain", nargs="+", default=["gain", "echo", "tremolo"])
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--blocksize", type=int, default=1024)
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    blocks = [
+        (rng.standard_normal((args.sessions, args.blocksize, 1)) * 0.1).astype(np.float32)
+        for _ in range(args.blocks)
+    ]
+    audio_seconds = args.sessions * args.blocks * args.blocksize / args.samplerate
+
+    print(f"{args.sessions} sessions @ {args.samplerate} Hz, chain: {' -> '.join(args.chain)}")
+    elapsed = bench_batched(args, blocks)
+    print(f"  batched:     {audio_seconds / elapsed:8.1f}x realtime ({audio_seconds / elapsed / args.sessions:.2f}x per session)")
+    if not args.skip_baseline:
+        elapsed = bench_per_session(args, blocks[:2])
+        seconds = audio_seconds * 2 / args.blocks
+        print(f"  per-session: {seconds / elapsed:8.1f}x realtime ({seconds / elapsed / args.sessions:.2f}x per session)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Cadre STFT procesate pe secunda de SpectralGateEffect, pe marimi de FFT, canale si blocksize
+
+    python benchmarks/bench_spectral.py --fft 512 1024 2048 --channels 1 2 16 --blocksize 256 1024
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.effects.spectral_gate import SpectralGateEffect
+
+
+def bench(fft_size, overlap, channels, blocksize, samplerate, seconds):
+    rng = np.random.default_rng(0)
+    data = (rng.standard_normal((channels, int(seconds * samplerate))) * 0.1).astype(np.float32)
+    blocks = [np.ascontiguousarray(data[:, i:i + blocksize]) for i in range(0, data.shape[1], blocksize)]
+
+    gate = SpectralGateEffect(fft_size=fft_size, overlap=overlap)
+    gate.apply_planar(blocks[0], samplerate)
+    start = time.perf_counter()
+    for block in blocks:
+        gate.apply_planar(block, samplerate)
+    elapsed = time.perf_counter() - start
+
+    # cadre pe canal: cate un hop per fft_size / overlap frame-uri de input
+    frames = data.shape[1] // gate.hop
+    return frames * channels / elapsed, data.shape[1] / samplerate / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fft", type=int, nargs="+", default=[512, 1024, 2048])
+    parser.add_argument("--overlap", type=int, default=4)
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 2, 16])
+    parser.add_argument("--blocksize", type=int, nargs="+", default=[256, 1024])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--samplerate", type=int, default=44100)
+    args = parser.parse_args()
+
+    print(f"overlap {args.overlap}, {args.seconds:.0f} s @ {args.samplerate} Hz")
+    print(f"  {'fft':>5} {'ch':>3} {'block':>6} {'frames/s':>12} {'x realtime':>11}")
+    for fft_size in args.fft:
+        for channels in args.channels:
+            for blocksize in args.blocksize:
+                fps, realtime = bench(fft_size, args.overlap, channels, blocksize, args.samplerate, args.seconds)
+                print(f"  {fft_size:>5} {channels:>3} {blocksize:>6} {fps:>12,.0f} {realtime:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Timpul de la Start la primul bloc procesat: build complet (cold), build repetat cu
+aceeasi configuratie (autotune si stream-urile pastrate) si resume dupa pause()
+pentru AudioEngine si ProcessEngine (procesul DSP pornit la build)
+
+    python benchmarks/bench_warm_restart.py --blocksize 256 --repeats 5
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine import AudioEngine, ProcessEngine
+
+
+def first_block(engine, build):
+    start = time.perf_counter()
+    if build:
+        engine.build()
+    first = []
+
+    def on_chunk(buf):
+        if not first:
+            first.append(time.perf_counter() - start)
+            engine.pause()
+
+    engine.start(on_chunk=on_chunk)
+    return first[0]
+
+
+def run(cls, path, args):
+    engine = cls(blocksize=args.blocksize)
+    engine.add_effect("eq").add_effect("reverb").add_effect("echo")
+    engine.enable_autotune(target_load=0.5)
+    engine.configure_input("file", path=path).configure_output("file", path=str(Path(path).with_suffix(".out.wav")))
+
+    cold = first_block(engine, build=True)
+    rebuild = statistics.median(first_block(engine, build=True) for _ in range(args.repeats))
+    resume = statistics.median(first_block(engine, build=False) for _ in range(args.repeats))
+    engine.close_streams()
+    return cold, rebuild, resume
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--blocksize", type=int, default=256)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = (rng.standard_normal((args.samplerate * 5, 2)) * 0.1).astype(np.float32)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "input.wav")
+        sf.write(path, data, args.samplerate)
+
+        print(f"{args.samplerate} Hz, chain eq + reverb + echo, autotune, block period "
+              f"{args.blocksize / args.samplerate * 1e3:.1f} ms (before autotune)")
+        for cls in (AudioEngine, ProcessEngine):
+            cold, rebuild, resume = run(cls, path, args)
+            print(f"  {cls.__name__:<14} cold {cold * 1e3:8.1f} ms   rebuild {rebuild * 1e3:7.1f} ms"
+                  f"   resume {resume * 1e3:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Piramida min/max pentru forma de unda a unui fisier lung: calculul (citire in blocuri
+mari), memoria maxima alocata, dimensiunea sidecar-ului, incarcarea din cache si
+view() la cateva niveluri de zoom (ce face GUI-ul la fiecare redesenare)
+
+    python benchmarks/bench_waveform.py --minutes 60
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_engine.analysis.waveform import WaveformPeaks, sidecar_path, waveform_peaks
+
+
+def write_input(path, args):
+    rng = np.random.default_rng(0)
+    chunk = args.samplerate * 60
+    with sf.SoundFile(path, "w", samplerate=args.samplerate, channels=2, subtype="PCM_16") as f:
+        for _ in range(int(args.minutes)):
+            f.write((rng.standard_normal((chunk, 2)) * 0.1).astype(np.float32))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samplerate", type=int, default=48000)
+    parser.add_argument("--minutes", type=float, default=60.0)
+    parser.add_argument("--width", type=int, default=460)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "long.wav")
+        write_input(path, args)
+        print(f"{args.minutes:g} min stereo PCM_16 at {args.samplerate} Hz ({os.path.getsize(path) / 1e6:.0f} MB)")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        peaks = waveform_peaks(path)
+        elapsed = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        sidecar = sidecar_path(path)
+        print(f"  build     {elapsed:7.2f} s   peak memory {peak_memory / 1e6:6.1f} MB"
+              f"   sidecar {os.path.getsize(sidecar) / 1e6:5.1f} MB, {len(peaks.mins)} levels")
+
+        start = time.perf_counter()
+        peaks = WaveformPeaks.load(sidecar, path)
+        print(f"  cached    {(time.perf_counter() - start) * 1e3:7.1f} ms")
+
+        for seconds in (peaks.duration, 600.0, 10.0, 0.1):
+            frames = int(seconds * peaks.samplerate)
+            center = peaks.frames // 2
+            start = time.perf_counter()
+            for _ in range(100):
+                peaks.view(center - frames // 2, center + frames // 2, args.width)
+            cost = (time.perf_counter() - start) / 100
+            print(f"  view {seconds:8.1f} s over {args.width} px   {cost * 1e3:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import math
 import sys
 import threading
 import time
@@ -6,18 +7,26 @@ from tkinter import filedialog, messagebox
 from tkinter import ttk
 from pathlib import Path
 
-from audio_engine import AudioEngine
+from audio_engine import AudioEngine, ProcessEngine
+from audio_engine.analysis.analyzers import PeakAnalyzer, RmsAnalyzer, SpectrumAnalyzer, ClipCounter
+from audio_engine.analysis.loudness import LoudnessMeter
+from audio_engine.analysis.waveform import waveform_peaks
 
 STANDARD_SAMPLERATES = [44100, 48000, 88200, 96000, 192000]
+METER_REFRESH_MS = 50
+METER_FLOOR_DB = -60.0
+WAVEFORM_POLL_MS = 100
+WAVEFORM_ZOOM_STEP = 0.8
 
 class AudioEngineGUI:
     def __init__(self, engine: AudioEngine | None = None):
-        self.engine = engine or AudioEngine()
+        # DSP runs in its own process by default, so Tk redraws never hold up the audio loop
+        self.engine = engine or ProcessEngine()
 
         self.root = tk.Tk()
         self.root.title("Audio Engine")
-        self.root.geometry("480x650")
-        self.root.minsize(480, 650)
+        self.root.geometry("480x760")
+        self.root.minsize(480, 760)
         style = ttk.Style(self.root)
         style.theme_use("clam")
         base_path = Path(getattr(sys, "_MEIPASS", Path(__file__).parent))  # pyinstaller support
@@ -36,6 +45,7 @@ class AudioEngineGUI:
         self.samplerate_var = tk.IntVar(value=self.engine.samplerate)
         self.channels_var = tk.IntVar(value=self.engine.channels)
         self.blocksize_var = tk.IntVar(value=self.engine.blocksize)
+        self.autotune_var = tk.BooleanVar(value=False)
 
         # Input vars
         self.input_mode_var = tk.StringVar(value="live")
@@ -57,10 +67,29 @@ class AudioEngineGUI:
         self.general_summary_var = tk.StringVar(value="")
         self.io_summary_var = tk.StringVar(value="")
         self.effects_summary_var = tk.StringVar(value="")
+        self.clip_var = tk.StringVar(value="Clips: 0")
+
+        # Waveform overview of the input file (peak pyramid built on a background thread)
+        self.waveform_status_var = tk.StringVar(value="No input file.")
+        self._waveform = None
+        self._waveform_path = None
+        self._waveform_view = (0, 0)
+        self._waveform_token = 0
+        self._waveform_progress = 0.0
+        self._waveform_result = None
+        self._waveform_drag = None
+
+        # Meters (abonate la analysis bus, citite cu after())
+        self.peak_meter = self.engine.subscribe(PeakAnalyzer())
+        self.rms_meter = self.engine.subscribe(RmsAnalyzer(samplerate=self.engine.samplerate))
+        self.spectrum_meter = self.engine.subscribe(SpectrumAnalyzer(samplerate=self.engine.samplerate, decimate=2))
+        self.clip_counter = self.engine.subscribe(ClipCounter())
+        self.loudness_meter = self.engine.subscribe(LoudnessMeter(samplerate=self.engine.samplerate))
 
         self._build_ui()
         self._apply_default_configuration()
         self._refresh_dashboard_summary()
+        self.root.after(METER_REFRESH_MS, self._update_meters)
 
     # UI build
     def _build_ui(self):
@@ -102,10 +131,32 @@ class AudioEngineGUI:
         effects_card.grid(row=1, column=0, columnspan=2, sticky="nsew", pady=(0, 8))
         ttk.Label(effects_card, textvariable=self.effects_summary_var, anchor="nw", justify="left", font=("TkFixedFont", 9)).pack(fill="both", expand=True, padx=8, pady=6)
 
+        waveform_card = ttk.LabelFrame(container, text="Input Waveform")
+        waveform_card.grid(row=2, column=0, columnspan=2, sticky="nsew", pady=(0, 8))
+        self.waveform_canvas = tk.Canvas(waveform_card, height=70, background="#1e1e1e", highlightthickness=0)
+        self.waveform_canvas.pack(fill="x", padx=8, pady=(6, 2))
+        ttk.Label(waveform_card, textvariable=self.waveform_status_var, font=("TkFixedFont", 9)).pack(anchor="w", padx=8, pady=(0, 4))
+        # wheel zooms around the pointer, drag pans, double click shows the whole file
+        self.waveform_canvas.bind("<Configure>", lambda _event: self._draw_waveform())
+        self.waveform_canvas.bind("<MouseWheel>", lambda event: self._zoom_waveform(event.x, WAVEFORM_ZOOM_STEP if event.delta > 0 else 1.0 / WAVEFORM_ZOOM_STEP))
+        self.waveform_canvas.bind("<Button-4>", lambda event: self._zoom_waveform(event.x, WAVEFORM_ZOOM_STEP))
+        self.waveform_canvas.bind("<Button-5>", lambda event: self._zoom_waveform(event.x, 1.0 / WAVEFORM_ZOOM_STEP))
+        self.waveform_canvas.bind("<ButtonPress-1>", self._start_waveform_drag)
+        self.waveform_canvas.bind("<B1-Motion>", self._drag_waveform)
+        self.waveform_canvas.bind("<Double-Button-1>", lambda _event: self._reset_waveform_view())
+
+        meters_card = ttk.LabelFrame(container, text="Meters")
+        meters_card.grid(row=3, column=0, columnspan=2, sticky="nsew", pady=(0, 8))
+        self.levels_canvas = tk.Canvas(meters_card, height=36, background="#1e1e1e", highlightthickness=0)
+        self.levels_canvas.pack(fill="x", padx=8, pady=(6, 2))
+        self.spectrum_canvas = tk.Canvas(meters_card, height=60, background="#1e1e1e", highlightthickness=0)
+        self.spectrum_canvas.pack(fill="x", padx=8, pady=2)
+        ttk.Label(meters_card, textvariable=self.clip_var, font=("TkFixedFont", 9)).pack(anchor="w", padx=8, pady=(0, 4))
+
         log_frame = ttk.LabelFrame(container, text="Log")
-        log_frame.grid(row=2, column=0, columnspan=2, sticky="nsew")
-        container.rowconfigure(2, weight=1)
-        self.log_text = tk.Text(log_frame, height=18, state="disabled", wrap="word")
+        log_frame.grid(row=4, column=0, columnspan=2, sticky="nsew")
+        container.rowconfigure(4, weight=1)
+        self.log_text = tk.Text(log_frame, height=12, state="disabled", wrap="word")
         scroll = ttk.Scrollbar(log_frame, command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=scroll.set)
         self.log_text.pack(side="left", fill="both", expand=True)
@@ -117,6 +168,7 @@ class AudioEngineGUI:
 
         self._add_labeled_spinbox(general_frame, "Channels", self.channels_var, from_=1, to=8, step=1, row=0)
         self._add_labeled_spinbox(general_frame, "Blocksize", self.blocksize_var, from_=64, to=4096, step=64, row=1)
+        ttk.Checkbutton(general_frame, text="Auto blocksize (measure DSP load)", variable=self.autotune_var).grid(row=2, column=0, sticky="w", padx=4, pady=2)
 
         # Input
         input_frame = ttk.LabelFrame(self.config_tab, text="Input")
@@ -145,9 +197,13 @@ class AudioEngineGUI:
         file_row = ttk.Frame(parent)
         file_row.pack(fill="x", pady=2, padx=4)
         setattr(self, f"{'input' if is_input else 'output'}_file_row", file_row)
-        ttk.Label(file_row, text="Path", width=10).pack(side="left")
-        ttk.Entry(file_row, textvariable=path_var).pack(side="left", fill="x", expand=True, padx=4)
-        ttk.Button(file_row, text="...", width=4, command=lambda: self._browse_file(path_var, is_input=is_input)).pack(side="left")
+        path_row = ttk.Frame(file_row)
+        path_row.pack(fill="x")
+        ttk.Label(path_row, text="Path", width=10).pack(side="left")
+        ttk.Entry(path_row, textvariable=path_var).pack(side="left", fill="x", expand=True, padx=4)
+        ttk.Button(path_row, text="...", width=4, command=lambda: self._browse_file(path_var, is_input=is_input)).pack(side="left")
+        if is_input:
+            ttk.Label(file_row, textvariable=self.waveform_status_var, font=("TkFixedFont", 9)).pack(anchor="w", pady=(2, 0))
 
         # Live rows
         live_frame = ttk.Frame(parent)
@@ -253,6 +309,8 @@ class AudioEngineGUI:
             path = filedialog.asksaveasfilename(defaultextension=".wav", filetypes=[("Wave", "*.wav"), ("All", "*.*")])
         if path:
             var.set(path)
+            if is_input:
+                self._load_waveform(path)
 
     def _apply_default_configuration(self):
         try:
@@ -272,11 +330,17 @@ class AudioEngineGUI:
         try:
             self.engine.channels = int(self.channels_var.get())
             self.engine.blocksize = int(self.blocksize_var.get())
+            if self.autotune_var.get():
+                self.engine.enable_autotune()
+            else:
+                self.engine.disable_autotune()
 
             # Input config
             if self.input_mode_var.get() == "file":
                 path = self.input_path_var.get().strip()
                 self.engine.configure_input("file", path=path)
+                if path != self._waveform_path:
+                    self._load_waveform(path)
             else:
                 device = self._parse_device(self.input_device_var.get())
                 sr = int(self.input_samplerate_var.get())
@@ -379,14 +443,16 @@ class AudioEngineGUI:
             ttk.Label(frame, text=name, width=12).grid(row=0, column=0, sticky="w")
             ttk.Entry(frame, textvariable=var).grid(row=0, column=1, sticky="ew")
 
-        ttk.Button(self.params_container, text="Apply parameters", command=lambda: self._apply_effect_params(effect)).grid(row=len(params), column=0, sticky="w", padx=4, pady=6)
+        ttk.Button(self.params_container, text="Apply parameters", command=lambda: self._apply_effect_params(idx)).grid(row=len(params), column=0, sticky="w", padx=4, pady=6)
 
-    def _apply_effect_params(self, effect):
+    def _apply_effect_params(self, idx: int):
+        effect = self.engine.get_effects()[idx]
+        params = {}
         for name, var in self.effect_param_vars.items():
-            new_val = var.get()
             current = getattr(effect, name, None)
-            converted = self._transform_value(new_val, current)
-            setattr(effect, name, converted)
+            params[name] = self._transform_value(var.get(), current)
+        # forwarded to the DSP process when running out of process
+        self.engine.set_effect_params(idx, **params)
         self._log(f"Params updated for {effect.__class__.__name__}")
 
     def _transform_value(self, value: str, current):
@@ -420,7 +486,7 @@ class AudioEngineGUI:
         general_lines = [
             f"Samplerate: {sr_display}",
             f"Channels:   {self.engine.channels}",
-            f"Blocksize:  {self.engine.blocksize}",
+            f"Blocksize:  {self.engine.blocksize}" + (" (auto)" if self.engine.get_autotune_report() is not None else ""),
         ]
         io_lines = []
         if input_cfg:
@@ -458,6 +524,171 @@ class AudioEngineGUI:
         self.io_summary_var.set("\n".join(io_lines))
         self.effects_summary_var.set("\n".join(effects_lines))
 
+    def _db_fraction(self, value: float) -> float:
+        # pozitie 0..1 pe scala meter-ului pentru o amplitudine liniara
+        if value <= 0.0:
+            return 0.0
+        db = 20.0 * math.log10(value)
+        return min(1.0, max(0.0, (db - METER_FLOOR_DB) / -METER_FLOOR_DB))
+
+    @staticmethod
+    def _lufs_text(value: float) -> str:
+        return f"{value:6.1f}" if value > -100.0 else "   -  "
+
+    def _update_meters(self):
+        peaks = self.peak_meter.value()
+        rms = self.rms_meter.value()
+
+        canvas = self.levels_canvas
+        canvas.delete("all")
+        width = max(1, canvas.winfo_width())
+        height = max(1, canvas.winfo_height())
+        channels = max(len(peaks), len(rms), 1)
+        bar_h = height / channels
+        for ch in range(channels):
+            y0 = ch * bar_h + 1
+            y1 = (ch + 1) * bar_h - 1
+            if ch < len(rms):
+                canvas.create_rectangle(0, y0, width * self._db_fraction(float(rms[ch])), y1, fill="#3c9d5d", width=0)
+            if ch < len(peaks):
+                peak = float(peaks[ch])
+                x = width * self._db_fraction(peak)
+                canvas.create_line(x, y0, x, y1, fill="#e04040" if peak >= 1.0 else "#f0c040", width=2)
+
+        spectrum = self.spectrum_meter.value()
+        canvas = self.spectrum_canvas
+        canvas.delete("all")
+        width = max(1, canvas.winfo_width())
+        height = max(1, canvas.winfo_height())
+        if len(spectrum):
+            band_w = width / len(spectrum)
+            for idx, db in enumerate(spectrum):
+                frac = min(1.0, max(0.0, (float(db) - 2 * METER_FLOOR_DB) / (-2 * METER_FLOOR_DB)))
+                canvas.create_rectangle(idx * band_w + 1, height * (1.0 - frac), (idx + 1) * band_w - 1, height, fill="#4a8fd8", width=0)
+
+        stats = self.engine.get_analysis_bus().stats()
+        text = f"Clips: {self.clip_counter.value()}   Dropped blocks: {stats['dropped']}"
+        process = self.engine.get_process_stats() if isinstance(self.engine, ProcessEngine) else None
+        if process is not None:
+            text += f"   Xruns: {process['xruns']}"
+        loudness = self.loudness_meter
+        text += (f"\nLUFS  M: {self._lufs_text(loudness.momentary())}  S: {self._lufs_text(loudness.short_term())}"
+                 f"  I: {self._lufs_text(loudness.integrated())}")
+        self.clip_var.set(text)
+        self.root.after(METER_REFRESH_MS, self._update_meters)
+
+    # Waveform
+    def _load_waveform(self, path: str):
+        # a newer request makes the running build give up (should_stop)
+        self._waveform_token += 1
+        token = self._waveform_token
+        self._waveform = None
+        self._waveform_path = path
+        self._waveform_progress = 0.0
+        self._waveform_result = None
+        self._draw_waveform()
+        if not path or not Path(path).is_file():
+            self.waveform_status_var.set("No input file.")
+            return
+
+        def worker():
+            try:
+                result = waveform_peaks(
+                    path,
+                    progress=lambda fraction: setattr(self, "_waveform_progress", fraction),
+                    should_stop=lambda: token != self._waveform_token,
+                )
+            except Exception as exc:
+                result = exc
+            if token == self._waveform_token:
+                self._waveform_result = result
+
+        self.waveform_status_var.set(f"Reading {Path(path).name}...")
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(WAVEFORM_POLL_MS, lambda: self._poll_waveform(token))
+
+    def _poll_waveform(self, token: int):
+        if token != self._waveform_token:
+            return
+        result = self._waveform_result
+        if result is None:
+            self.waveform_status_var.set(f"Reading {Path(self._waveform_path).name}... {self._waveform_progress:.0%}")
+            self.root.after(WAVEFORM_POLL_MS, lambda: self._poll_waveform(token))
+            return
+        if isinstance(result, Exception):
+            self.waveform_status_var.set(f"Cannot read input file: {result}")
+            self._log(f"Waveform failed: {result}")
+            return
+        self._waveform = result
+        self._reset_waveform_view()
+
+    @staticmethod
+    def _format_time(seconds: float) -> str:
+        minutes, seconds = divmod(max(0.0, seconds), 60.0)
+        hours, minutes = divmod(int(minutes), 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:04.1f}"
+        return f"{minutes}:{seconds:04.1f}"
+
+    def _reset_waveform_view(self):
+        if self._waveform is not None:
+            self._set_waveform_view(0, self._waveform.frames)
+
+    def _set_waveform_view(self, start: int, end: int):
+        peaks = self._waveform
+        span = min(peaks.frames, max(1, end - start))
+        start = min(max(0, start), peaks.frames - span)
+        self._waveform_view = (start, start + span)
+        self.waveform_status_var.set(
+            f"{Path(self._waveform_path).name}  {self._format_time(peaks.duration)}  {peaks.samplerate} Hz  {peaks.channels} ch"
+            f"  [{self._format_time(start / peaks.samplerate)} - {self._format_time((start + span) / peaks.samplerate)}]"
+        )
+        self._draw_waveform()
+
+    def _zoom_waveform(self, x: int, factor: float):
+        if self._waveform is None:
+            return
+        start, end = self._waveform_view
+        width = max(1, self.waveform_canvas.winfo_width())
+        # the frame under the pointer stays in place; at most one frame per pixel
+        anchor = start + (end - start) * x / width
+        span = max(width, int((end - start) * factor))
+        new_start = int(anchor - (anchor - start) * span / (end - start))
+        self._set_waveform_view(new_start, new_start + span)
+
+    def _start_waveform_drag(self, event):
+        self._waveform_drag = (event.x, self._waveform_view)
+
+    def _drag_waveform(self, event):
+        if self._waveform is None or self._waveform_drag is None:
+            return
+        x0, (start, end) = self._waveform_drag
+        shift = int((x0 - event.x) * (end - start) / max(1, self.waveform_canvas.winfo_width()))
+        self._set_waveform_view(start + shift, end + shift)
+
+    def _draw_waveform(self):
+        canvas = self.waveform_canvas
+        canvas.delete("all")
+        peaks = self._waveform
+        width = canvas.winfo_width()
+        height = max(1, canvas.winfo_height())
+        # not mapped yet: <Configure> redraws it
+        if peaks is None or width < 2:
+            return
+        start, end = self._waveform_view
+        mins, maxs = peaks.view(start, end, width)
+        # all channels on one lane: envelope of min/max across channels
+        low = mins.min(axis=1)
+        high = maxs.max(axis=1)
+        mid = height / 2.0
+        points = []
+        for x, value in enumerate(high):
+            points.extend((x, mid - min(1.0, float(value)) * mid))
+        for x in range(width - 1, -1, -1):
+            points.extend((x, mid - max(-1.0, float(low[x])) * mid))
+        canvas.create_line(0, mid, width, mid, fill="#333333")
+        canvas.create_polygon(points, fill="#4a8fd8", outline="#4a8fd8")
+
     def _start_engine(self):
         if self._running_thread and self._running_thread.is_alive():
             return
@@ -465,15 +696,41 @@ class AudioEngineGUI:
         def runner():
             try:
                 self.engine.start()
-                self._log("Engine stopped.")
+                if self.engine.is_paused():
+                    self._log("Engine paused (streams kept open).")
+                else:
+                    self._log("Engine stopped.")
                 self.status_var.set("Stopped")
             except Exception as exc:
                 self._log(f"Engine error: {exc}")
                 self.status_var.set("Error")
 
+        # after Stop the engine is only paused: same streams and effect state, no rebuild
+        if self.engine.is_paused():
+            self._running_thread = threading.Thread(target=runner, daemon=True)
+            self._running_thread.start()
+            self._log("Engine resumed.")
+            self.status_var.set("Running")
+            return
+
         try:
             self.engine.build()
             self._log("Engine built.")
+            report = self.engine.get_autotune_report()
+            if report is not None:
+                chosen = report["measurements"].get(report["blocksize"], {})
+                self._log(f"Auto blocksize: {report['blocksize']} (DSP load {chosen.get('load', 0.0):.0%}, buffer {report['buffer_frames']} frames)")
+            loudness = self.engine.get_loudness_report()
+            if loudness is not None:
+                self._log(f"Normalization: {loudness['gain_db']:+.1f} dB to {loudness['target_lufs']:.1f} LUFS"
+                          f"{' (cached measurement)' if loudness['cached'] else ''}")
+            samplerate = self.engine.get_samplerate()
+            self.rms_meter.samplerate = samplerate
+            self.spectrum_meter.samplerate = samplerate
+            self.clip_counter.reset()
+            # K-weighting filter depends on the samplerate: new meter per build
+            self.engine.unsubscribe(self.loudness_meter)
+            self.loudness_meter = self.engine.subscribe(LoudnessMeter(samplerate=samplerate))
             self._running_thread = threading.Thread(target=runner, daemon=True)
             self._running_thread.start()
             self._log("Engine started.")
@@ -484,8 +741,9 @@ class AudioEngineGUI:
             self.status_var.set("Error")
 
     def _stop_engine(self):
+        # applying a new configuration drops the paused streams and rebuilds on Start
         if self.engine.is_running():
-            self.engine.stop()
+            self.engine.pause()
             self._log("Stop requested.")
             self.status_var.set("Stopping")
         else:
@@ -500,8 +758,12 @@ class AudioEngineGUI:
 
     def run(self):
         self.root.mainloop()
+        # a paused engine still holds its streams (and the DSP process)
+        self.engine.stop()
+        self.engine.close_streams()
 
 
 if __name__ == "__main__":
-    gui = AudioEngineGUI()
+    # --in-process: run the DSP loop on a thread of the GUI process (old behaviour)
+    gui = AudioEngineGUI(AudioEngine() if "--in-process" in sys.argv else None)
     gui.run()
@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from audio_engine import AudioEngine
+
+
+class SlowSource:
+    """Sursa care tine thread-ul din executor ocupat si semnaleaza citirea dupa close()"""
+
+    samplerate = 44100
+    channels = 1
+
+    def __init__(self):
+        self.closed = False
+        self.read_after_close = False
+        self.reading = threading.Event()
+
+    def read(self, frames):
+        self.reading.set()
+        time.sleep(0.2)
+        if self.closed:
+            self.read_after_close = True
+        return np.zeros((frames, 1), dtype=np.float32)
+
+    def close(self):
+        self.closed = True
+
+
+def test_cancelled_stream_waits_for_inflight_block():
+    engine = AudioEngine(blocksize=64, flush_tails=False)
+    engine.configure_input("array", data=np.zeros(64, dtype=np.float32), samplerate=44100)
+    engine.build(consumer=False)
+    source = SlowSource()
+    engine._source = source
+
+    async def consume():
+        async for _ in engine.stream():
+            pass
+
+    async def main():
+        task = asyncio.ensure_future(consume())
+        await asyncio.get_running_loop().run_in_executor(None, source.reading.wait)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(main())
+    assert source.closed
+    assert not source.read_after_close
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from audio_engine import AudioEngine
+from audio_engine.utils.automation import AutomationCurve
+
+
+SAMPLERATE = 8000
+FRAMES = 4000
+
+
+def make_input(seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(-0.1, 0.1, (FRAMES, 1))).astype(np.float32)
+
+
+def test_linear_curve_interpolates_per_frame():
+    curve = AutomationCurve([(1.0, 10.0), (0.0, 0.0)])
+    # punctele sunt sortate; intre ele valoare per frame, in afara lor constanta
+    assert curve.points == [(0.0, 0.0), (1.0, 10.0)]
+    np.testing.assert_allclose(curve.block(4000, 4, SAMPLERATE), [5.0, 5.00125, 5.0025, 5.00375], rtol=1e-6)
+    assert curve.block(8000, 256, SAMPLERATE) == 10.0
+    assert curve.value_at(-5, SAMPLERATE) == 0.0
+
+
+def test_step_curve_holds_values():
+    curve = AutomationCurve([(0.0, 1.0), (0.1, 2.0), (0.2, 3.0)], curve="step")
+    assert curve.value_at(799, SAMPLERATE) == 1.0
+    assert curve.value_at(800, SAMPLERATE) == 2.0
+    assert curve.block(0, 512, SAMPLERATE) == 1.0
+    assert curve.steps(512, 2000, SAMPLERATE) == [288, 1088]
+    np.testing.assert_array_equal(curve.block(798, 4, SAMPLERATE), [1.0, 1.0, 2.0, 2.0])
+
+
+def test_invalid_curves_are_rejected():
+    with pytest.raises(ValueError):
+        AutomationCurve([(0.0, 1.0)], curve="cubic")
+    with pytest.raises(ValueError):
+        AutomationCurve([])
+    with pytest.raises(KeyError):
+        AudioEngine().add_effect("gain").automate(0, "volume", [(0.0, 1.0)])
+
+
+# fade liniar pe gain: exact factorul de la fiecare frame, la orice blocksize
+@pytest.mark.parametrize("blocksize", [256, 1000])
+def test_gain_automation_is_sample_accurate(blocksize):
+    engine = AudioEngine(blocksize=blocksize).add_effect("gain")
+    engine.automate(0, "gain_db", [(0.0, -20.0), (0.4, 0.0)])
+    data = make_input()
+    out = engine.process_array(data, SAMPLERATE, tail=False)
+
+    gain_db = np.interp(np.arange(FRAMES), [0, 0.4 * SAMPLERATE], [-20.0, 0.0])
+    np.testing.assert_allclose(out[:, 0], data[:, 0] * 10 ** (gain_db / 20), atol=1e-6)
+    # intre blocuri parametrul ramane scalar
+    assert engine.get_effects()[0].params()["gain_db"] == 0.0
+
+
+# intensity e un parametru per bloc: blocul e taiat exact la punctul "step"
+def test_step_automation_splits_block():
+    engine = AudioEngine(blocksize=512).add_effect("distortion")
+    engine.automate(0, "intensity", [(0.0, 0.0), (0.1, 5.0)], curve="step")
+    data = make_input()
+    out = engine.process_array(data, SAMPLERATE, tail=False)
+
+    step = int(0.1 * SAMPLERATE)
+    np.testing.assert_allclose(out[:step], np.tanh(data[:step]), atol=1e-6)
+    np.testing.assert_allclose(out[step:], 0.25 * np.tanh(36.0 * data[step:]), atol=1e-6)
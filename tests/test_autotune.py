@@ -0,0 +1,102 @@
+import time
+
+import numpy as np
+
+from audio_engine.effects.echo import EchoEffect
+from audio_engine.utils import autotune
+from audio_engine.utils.autotune import BlockSizeTuner
+
+
+SAMPLERATE = 48000
+CANDIDATES = (64, 128, 256)
+
+
+def make_tuner(**kwargs):
+    kwargs.setdefault("recover_blocks", 50)
+    tuner = BlockSizeTuner(target_load=0.5, candidates=CANDIDATES, smoothing=1.0, warmup_blocks=5, **kwargs)
+    # lant gol: incape la cea mai mica marime
+    assert tuner.tune([], SAMPLERATE, 1) == 64
+    return tuner
+
+
+def feed(tuner, load, blocks):
+    changed = 0
+    for _ in range(blocks):
+        frames = tuner.blocksize
+        changed += tuner.observe(frames, load * frames / SAMPLERATE, SAMPLERATE)
+    return changed
+
+
+def test_overload_grows_block():
+    tuner = make_tuner()
+    buffer_frames = tuner.buffer_frames
+
+    assert feed(tuner, 0.9, 5) == 1
+    assert tuner.blocksize == 128
+    assert tuner.buffer_frames == 2 * buffer_frames
+
+
+def test_block_shrinks_back_after_calm_period():
+    tuner = make_tuner()
+    buffer_frames = tuner.buffer_frames
+    feed(tuner, 0.9, 10)
+    assert tuner.blocksize == 256
+
+    # sub shrink_load * target_load, dar nu destul de mult timp
+    feed(tuner, 0.1, 5 + 40)
+    assert tuner.blocksize == 256
+
+    feed(tuner, 0.1, 10 + 2 * 55)
+    assert tuner.blocksize == 64
+    assert tuner.buffer_frames == buffer_frames
+    # nu coboara sub marimea masurata
+    feed(tuner, 0.1, 200)
+    assert tuner.blocksize == 64
+
+
+def test_load_near_target_keeps_block():
+    tuner = make_tuner()
+    feed(tuner, 0.9, 5)
+    assert tuner.blocksize == 128
+
+    # intre prag si tinta: ramane (histerezis)
+    feed(tuner, 0.4, 500)
+    assert tuner.blocksize == 128
+
+
+def test_calm_period_restarts_after_spike():
+    tuner = make_tuner()
+    feed(tuner, 0.9, 5)
+    feed(tuner, 0.1, 5 + 40)
+    feed(tuner, 0.4, 1)
+    feed(tuner, 0.1, 40)
+    assert tuner.blocksize == 128
+
+
+def test_tune_async_measures_a_snapshot(monkeypatch):
+    seen = []
+    measure = autotune.measure_block_cost
+
+    def spy(effects, *args):
+        seen.extend(effects)
+        return measure(effects, *args)
+
+    monkeypatch.setattr(autotune, "measure_block_cost", spy)
+    echo = EchoEffect()
+    echo.apply(np.zeros((64, 1), dtype=np.float32), SAMPLERATE)
+    state = echo.get_state()
+
+    tuner = BlockSizeTuner(candidates=CANDIDATES, repeats=1)
+    tuner.invalidate()
+    tuner.tune_async([echo], SAMPLERATE, 1)
+    # copia e facuta la apel: lantul e marcat ca masurat inainte sa termine thread-ul
+    assert not tuner.dirty
+
+    deadline = time.monotonic() + 5.0
+    while tuner.report()["retunes"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert tuner.report()["retunes"] == 1
+    assert not tuner._tuning
+    assert seen and all(eff is not echo for eff in seen)
+    for key, value in echo.get_state().items():
+        np.testing.assert_array_equal(value, state[key])
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from audio_engine.utils.drift import CubicResampler, DriftCompensator
+from audio_engine.utils.ring_buffer import RingBuffer
+
+
+SAMPLERATE = 48000
+BLOCK = 1024
+FREQ = 1000.0
+
+
+def sine(start, frames, rate=SAMPLERATE):
+    t = (start + np.arange(frames)) / rate
+    return (0.5 * np.sin(2 * np.pi * FREQ * t)).astype(np.float32)[:, None]
+
+
+def test_unit_ratio_is_identity():
+    resampler = CubicResampler(1)
+    consumed, out = 0, []
+    for _ in range(4):
+        needed = resampler.needed(BLOCK, 1.0)
+        out.append(resampler.process(sine(consumed, needed), BLOCK, 1.0))
+        consumed += needed
+    np.testing.assert_allclose(np.concatenate(out), sine(0, 4 * BLOCK), atol=1e-6)
+
+
+# raport variabil intre blocuri: iesirea ramane sinusul citit la pozitiile fractionare
+def test_variable_ratio_follows_fractional_positions():
+    resampler = CubicResampler(1)
+    ratios = [1.0, 1.002, 0.997, 1.0005, 0.999]
+    consumed, position, out, expected = 0, 0.0, [], []
+    for ratio in ratios:
+        needed = resampler.needed(BLOCK, ratio)
+        block = resampler.process(sine(consumed, needed), BLOCK, ratio)
+        consumed += needed
+        assert block.shape == (BLOCK, 1)
+        out.append(block)
+        expected.append(sine(position + np.arange(BLOCK) * ratio, 1))
+        position += BLOCK * ratio
+
+    out, expected = np.concatenate(out), np.concatenate(expected)
+    np.testing.assert_allclose(out, expected, atol=2e-4)
+
+
+def test_short_input_returns_fewer_frames():
+    resampler = CubicResampler(1)
+    needed = resampler.needed(BLOCK, 1.0)
+    assert resampler.process(sine(0, needed - 10), BLOCK, 1.0).shape[0] == BLOCK - 10
+
+
+def simulate(ppm, seconds=120.0):
+    capacity = SAMPLERATE // 5
+    ring = RingBuffer(capacity, 1)
+    clock = [0.0]
+    drift = DriftCompensator(SAMPLERATE, 1, target_frames=capacity // 2, response_seconds=2.0,
+                             smoothing_seconds=0.2, clock=lambda: clock[0])
+
+    in_rate = SAMPLERATE * (1.0 + ppm * 1e-6)
+    in_time, in_frames = 0.0, 0
+    out_time = capacity / 2 / in_rate
+    fills, overflows = [], 0
+    while out_time < seconds:
+        while in_time <= out_time:
+            overflows += ring.available() + BLOCK > capacity
+            clock[0] = in_time
+            ring.write(sine(in_frames, BLOCK, in_rate))
+            drift.on_input(BLOCK)
+            in_frames += BLOCK
+            in_time += BLOCK / in_rate
+        clock[0] = out_time
+        assert drift.read(ring, BLOCK, timeout=0.0).shape == (BLOCK, 1)
+        fills.append(ring.available())
+        out_time += BLOCK / SAMPLERATE
+    return drift, np.asarray(fills), overflows
+
+
+@pytest.mark.parametrize("ppm", [150.0, -300.0])
+def test_compensator_tracks_clock_drift(ppm):
+    drift, fills, overflows = simulate(ppm)
+
+    # integrala converge la deriva reala, nivelul buffer-ului ramane in jurul tintei
+    assert drift.stats()["drift_ppm"] == pytest.approx(ppm, abs=5.0)
+    assert drift.stats()["underruns"] == 0
+    assert overflows == 0
+    settled = fills[len(fills) // 2:]
+    assert abs(settled.mean() - drift.target_frames) < BLOCK
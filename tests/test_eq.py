@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from audio_engine.effects.eq import EqEffect, SosFilter, biquad_coefficients
+
+
+SAMPLERATE = 48000
+FRAMES = SAMPLERATE // 2
+
+
+def sine(freq, frames=FRAMES):
+    t = np.arange(frames) / SAMPLERATE
+    return (0.25 * np.sin(2 * np.pi * freq * t)).astype(np.float32)[:, None]
+
+
+def gain_db(effect, freq):
+    data = sine(freq)
+    out = effect.apply(data, SAMPLERATE)
+    # dupa tranzitoriu
+    steady = slice(FRAMES // 2, None)
+    return 20 * np.log10(np.sqrt(np.mean(out[steady] ** 2)) / np.sqrt(np.mean(data[steady] ** 2)))
+
+
+# transposed direct form II, sample cu sample
+def reference(sos, x):
+    y = x.astype(np.float64)
+    for b0, b1, b2, _, a1, a2 in sos:
+        s1 = s2 = 0.0
+        out = np.empty_like(y)
+        for n, v in enumerate(y):
+            out[n] = b0 * v + s1
+            s1 = b1 * v - a1 * out[n] + s2
+            s2 = b2 * v - a2 * out[n]
+        y = out
+    return y
+
+
+@pytest.mark.parametrize("blocks", [[5000], [64] * 78 + [8], [1, 63, 65, 1000, 3871]])
+def test_sos_filter_matches_direct_recursion(blocks):
+    sos = np.array([
+        biquad_coefficients("lowshelf", 80.0, 6.0, 0.707, SAMPLERATE),
+        biquad_coefficients("peak", 2500.0, -9.0, 2.0, SAMPLERATE),
+        biquad_coefficients("highpass", 30.0, 0.0, 0.707, SAMPLERATE),
+    ])
+    x = np.random.default_rng(0).standard_normal(sum(blocks))
+    sos_filter = SosFilter(sos)
+
+    out, pos = [], 0
+    for size in blocks:
+        out.append(sos_filter.process(x[None, pos:pos + size])[0])
+        pos += size
+    np.testing.assert_allclose(np.concatenate(out), reference(sos, x), atol=1e-9)
+
+
+def test_peak_band_response():
+    band = [{"type": "peak", "freq": 1000.0, "gain_db": 6.0, "q": 1.0}]
+    assert gain_db(EqEffect(band), 1000.0) == pytest.approx(6.0, abs=0.05)
+    assert gain_db(EqEffect(band), 50.0) == pytest.approx(0.0, abs=0.1)
+
+
+@pytest.mark.parametrize("kind, passband, stopband", [("lowpass", 100.0, 10000.0), ("highpass", 10000.0, 100.0)])
+def test_pass_filters(kind, passband, stopband):
+    band = [{"type": kind, "freq": 1000.0, "q": 0.707}]
+    assert gain_db(EqEffect(band), passband) == pytest.approx(0.0, abs=0.1)
+    # 12 dB / octava: ~-40 dB la o decada de frecventa de taiere
+    assert gain_db(EqEffect(band), stopband) < -35.0
+    assert gain_db(EqEffect(band), 1000.0) == pytest.approx(-3.0, abs=0.1)
+
+
+def test_shelf_gain_far_from_corner():
+    band = [{"type": "lowshelf", "freq": 200.0, "gain_db": -12.0, "q": 0.707}]
+    assert gain_db(EqEffect(band), 20.0) == pytest.approx(-12.0, abs=0.2)
+    assert gain_db(EqEffect(band), 10000.0) == pytest.approx(0.0, abs=0.05)
+
+
+def test_flat_bands_pass_through():
+    data = sine(440.0)
+    np.testing.assert_array_equal(EqEffect().apply(data, SAMPLERATE), data)
+
+
+def test_unknown_band_type_is_rejected():
+    with pytest.raises(ValueError):
+        EqEffect([{"type": "bandstop", "freq": 1000.0}]).apply(sine(440.0), SAMPLERATE)
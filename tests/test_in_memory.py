@@ -0,0 +1,54 @@
+import numpy as np
+
+from audio_engine import AudioEngine
+
+
+def make_engine():
+    engine = AudioEngine(blocksize=256)
+    engine.add_effect("echo").add_effect("reverb")
+    return engine
+
+
+def test_process_array_calls_are_independent():
+    rng = np.random.default_rng(0)
+    first = (rng.standard_normal((4000, 1)) * 0.3).astype(np.float32)
+    second = (rng.standard_normal((4000, 1)) * 0.3).astype(np.float32)
+
+    engine = make_engine()
+    engine.process_array(first, 44100, tail=False)
+    after_first = engine.process_array(second, 44100, tail=False)
+    fresh = make_engine().process_array(second, 44100, tail=False)
+
+    np.testing.assert_array_equal(after_first, fresh)
+
+
+def test_process_iter_resets_chain():
+    block = np.full((256, 1), 0.5, dtype=np.float32)
+    engine = make_engine()
+    first = np.concatenate(list(engine.process_iter([block] * 4, 44100, tail=False)))
+    second = np.concatenate(list(engine.process_iter([block] * 4, 44100, tail=False)))
+
+    np.testing.assert_array_equal(first, second)
+
+
+def test_process_array_leaves_input_unchanged():
+    # distortion curata NaN-urile in loc, pe blocul primit
+    data = np.full((2000, 2), 0.5, dtype=np.float32)
+    data[100:200] = np.nan
+    original = data.copy()
+
+    engine = AudioEngine(blocksize=256)
+    engine.add_effect("distortion").add_effect("gain", gain_db=-6.0)
+    out = engine.process_array(data, 44100)
+
+    np.testing.assert_array_equal(data, original)
+    assert np.isfinite(out).all()
+
+
+def test_process_iter_leaves_blocks_unchanged():
+    blocks = [np.full((256, 1), np.nan, dtype=np.float32) for _ in range(4)]
+    engine = AudioEngine(blocksize=256)
+    engine.add_effect("distortion")
+    list(engine.process_iter(blocks, 44100, tail=False))
+
+    assert all(np.isnan(block).all() for block in blocks)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio_engine import AudioEngine
+
+
+SAMPLERATE = 44100
+FRAMES = 4000
+
+# etapele cu latenta: limiter-ul implicit, spectral_gate, efecte supraesantionate
+CHAINS = {
+    "limiter": [],
+    "spectral_gate": [("spectral_gate", None)],
+    "oversampled": [("distortion", 4)],
+    "all": [("eq", None), ("spectral_gate", None), ("distortion", 2)],
+}
+
+
+def make_engine(chain, flush_tails=True):
+    engine = AudioEngine(blocksize=256, flush_tails=flush_tails)
+    for name, factor in chain:
+        engine.add_effect(name, oversample=factor)
+    return engine
+
+
+def make_input(channels=1):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((FRAMES, channels)) * 0.3).astype(np.float32)
+
+
+@pytest.mark.parametrize("name", CHAINS)
+def test_process_array_keeps_length_without_tail(name):
+    engine = make_engine(CHAINS[name])
+    assert engine._output_latency(SAMPLERATE) > 0
+
+    out = engine.process_array(make_input(), SAMPLERATE, tail=False)
+    assert out.shape[0] == FRAMES
+
+
+@pytest.mark.parametrize("name", CHAINS)
+def test_process_array_tail_is_not_shorter(name):
+    out = make_engine(CHAINS[name]).process_array(make_input(), SAMPLERATE, tail=True)
+    assert out.shape[0] >= FRAMES
+
+
+@pytest.mark.parametrize("name", CHAINS)
+def test_file_render_keeps_length_without_tail(name, tmp_path):
+    path, out_path = str(tmp_path / "in.wav"), str(tmp_path / "out.wav")
+    sf.write(path, make_input(), SAMPLERATE, subtype="FLOAT")
+
+    engine = make_engine(CHAINS[name], flush_tails=False)
+    engine.configure_input("file", path=path).configure_output("file", path=out_path)
+    engine.start()
+    assert sf.info(out_path).frames == FRAMES
+
+
+def test_dc_input_reaches_the_last_frame():
+    # dupa latenta limiter-ului, ultimul frame de input apare la sfarsitul iesirii
+    data = np.full((FRAMES, 1), 0.5, dtype=np.float32)
+    out = make_engine([]).process_array(data, SAMPLERATE, tail=False)
+    np.testing.assert_allclose(out[-1], 0.5, atol=1e-6)
+
+
+def test_parallel_render_keeps_length_without_tail(tmp_path):
+    path, out_path = str(tmp_path / "in.wav"), str(tmp_path / "out.wav")
+    sf.write(path, make_input(), SAMPLERATE, subtype="FLOAT")
+
+    # spectral_gate nu are memorie finita (render serial): lant fara el
+    engine = make_engine([("eq", None), ("distortion", 2)], flush_tails=False)
+    engine.configure_input("file", path=path).configure_output("file", path=out_path)
+    report = engine.render_parallel(workers=2, segment_seconds=1500 / SAMPLERATE)
+    assert report["parallel"]
+    assert sf.info(out_path).frames == FRAMES
@@ -0,0 +1,268 @@
+import importlib
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+
+
+SAMPLERATE = 48000
+BLOCK = 512
+CAPACITY = 4 * BLOCK
+# crossfade-ul concealer-ului (fade_ms implicit 5 ms)
+FADE = SAMPLERATE * 5 // 1000
+# saltul maxim intre frame-uri al sinusului de test e ~0.029; un click e >> 0.05
+MAX_STEP = 0.05
+
+
+def sine(start, frames):
+    t = (start + np.arange(frames)) / SAMPLERATE
+    return (0.5 * np.sin(2 * np.pi * 440.0 * t)).astype(np.float32)[:, None]
+
+
+class StubInputStream:
+    """
+    Stream de input simulat: push() apeleaza callback-ul ca device-ul real,
+    cu un sinus continuu (pozitia pe timeline e in `position`)
+    """
+
+    def __init__(self, callback=None, blocksize=1024, **kwargs):
+        self.callback = callback
+        self.blocksize = blocksize
+        self.position = 0
+        self.active = False
+
+    def push(self, blocks=1):
+        for _ in range(blocks):
+            self.callback(sine(self.position, self.blocksize), self.blocksize, None, None)
+            self.position += self.blocksize
+
+    def skip(self, blocks=1):
+        # device-ul nu livreaza nimic (input oprit), timeline-ul merge mai departe
+        self.position += blocks * self.blocksize
+
+    def start(self):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+
+@pytest.fixture
+def stub_sounddevice(monkeypatch):
+    stub = types.ModuleType("sounddevice")
+    stub.InputStream = StubInputStream
+    monkeypatch.setitem(sys.modules, "sounddevice", stub)
+    monkeypatch.delitem(sys.modules, "audio_engine.sources.live_source", raising=False)
+    return stub
+
+
+@pytest.fixture
+def live_source(stub_sounddevice):
+    module = importlib.import_module("audio_engine.sources.live_source")
+
+    def make(**kwargs):
+        kwargs.setdefault("capacity_frames", CAPACITY)
+        return module.LiveSource(samplerate=SAMPLERATE, channels=1, blocksize=BLOCK, **kwargs)
+    return make
+
+
+def read_blocks(source, count):
+    blocks = [source.read(BLOCK) for _ in range(count)]
+    assert all(block.shape == (BLOCK, 1) for block in blocks)
+    return np.concatenate(blocks)
+
+
+def max_step(signal):
+    return float(np.abs(np.diff(signal[:, 0])).max())
+
+
+# consumatorul se opreste 9 blocuri, input-ul continua: 4608 frame-uri intr-un buffer de 2048
+# (salturile peste frame-urile pierdute sunt mari, deci fara crossfade ar fi click-uri)
+def stalled_consumer(source):
+    stream = source._stream
+    stream.push(2)
+    before = read_blocks(source, 2)
+    stream.push(9)
+    during = read_blocks(source, source.ring_buffer.available() // BLOCK)
+    after = []
+    for _ in range(4):
+        stream.push()
+        after.append(read_blocks(source, 1))
+    return before, during, np.concatenate(after)
+
+
+def test_overflow_drop_oldest(live_source):
+    source = live_source(overflow="drop_oldest")
+    before, during, after = stalled_consumer(source)
+
+    assert during.shape[0] == CAPACITY
+    assert source.stats()["dropped"] == 9 * BLOCK - CAPACITY
+    assert source.stats()["concealed_frames"] == 0
+    # se pastreaza cele mai noi frame-uri; crossfade doar la saltul peste cele pierdute
+    np.testing.assert_allclose(during[FADE:], sine(11 * BLOCK - CAPACITY + FADE, CAPACITY - FADE), atol=1e-6)
+    np.testing.assert_allclose(after, sine(11 * BLOCK, 4 * BLOCK), atol=1e-6)
+    assert max_step(np.concatenate((before, during, after))) < MAX_STEP
+
+
+def test_overflow_drop_newest(live_source):
+    source = live_source(overflow="drop_newest")
+    before, during, after = stalled_consumer(source)
+
+    assert during.shape[0] == CAPACITY
+    assert source.stats()["dropped"] == 9 * BLOCK - CAPACITY
+    assert source.stats()["concealed_frames"] == 0
+    # datele vechi raman continue; crossfade la primul bloc scris dupa stall
+    np.testing.assert_allclose(np.concatenate((before, during)), sine(0, 2 * BLOCK + CAPACITY), atol=1e-6)
+    np.testing.assert_allclose(after[FADE:], sine(11 * BLOCK + FADE, 4 * BLOCK - FADE), atol=1e-6)
+    assert max_step(np.concatenate((before, during, after))) < MAX_STEP
+
+
+def test_overflow_grow(live_source):
+    source = live_source(overflow="grow", max_buffer_seconds=1.0)
+    before, during, after = stalled_consumer(source)
+
+    assert during.shape[0] == 9 * BLOCK
+    assert source.stats()["dropped"] == 0
+    assert source.stats()["capacity"] >= 9 * BLOCK
+    # nimic pierdut: exact input-ul, fara crossfade
+    np.testing.assert_allclose(np.concatenate((before, during, after)), sine(0, 15 * BLOCK), atol=1e-6)
+
+
+def test_overflow_grow_stops_at_limit(live_source):
+    source = live_source(overflow="grow", max_buffer_seconds=2 * CAPACITY / SAMPLERATE)
+    before, during, after = stalled_consumer(source)
+
+    assert source.stats()["capacity"] == 2 * CAPACITY
+    assert during.shape[0] == 2 * CAPACITY
+    assert source.stats()["dropped"] == 9 * BLOCK - 2 * CAPACITY
+    assert max_step(np.concatenate((before, during, after))) < MAX_STEP
+
+
+# input-ul se opreste 3 blocuri, consumatorul cere blocuri in continuare
+def stalled_input(source):
+    stream = source._stream
+    stream.push(2)
+    before = read_blocks(source, 2)
+    stream.skip(3)
+    during = read_blocks(source, 3)
+    stream.push(4)
+    after = read_blocks(source, 4)
+    return before, during, after
+
+
+def test_underrun_silence(live_source):
+    source = live_source(underrun="silence", underrun_timeout=0.0)
+    before, during, after = stalled_input(source)
+
+    stats = source.stats()
+    assert stats["underruns"] == 3
+    assert stats["concealed_frames"] == 3 * BLOCK
+    # rampa de la ultimul frame la 0, apoi liniste
+    assert np.all(during[FADE:] == 0.0)
+    np.testing.assert_allclose(before, sine(0, 2 * BLOCK), atol=1e-6)
+    np.testing.assert_allclose(after[FADE:], sine(5 * BLOCK + FADE, 4 * BLOCK - FADE), atol=1e-6)
+    assert max_step(np.concatenate((before, during, after))) < MAX_STEP
+
+
+def test_underrun_repeat(live_source):
+    source = live_source(underrun="repeat", underrun_timeout=0.0)
+    before, during, after = stalled_input(source)
+
+    stats = source.stats()
+    assert stats["underruns"] == 3
+    assert stats["concealed_frames"] == 3 * BLOCK
+    # istoricul e repetat (cu fade-out de 100 ms), nu inlocuit cu liniste
+    assert np.abs(during[-BLOCK:]).max() > 0.1
+    np.testing.assert_allclose(after[FADE:], sine(5 * BLOCK + FADE, 4 * BLOCK - FADE), atol=1e-6)
+    assert max_step(np.concatenate((before, during, after))) < MAX_STEP
+
+
+def test_underrun_partial_block_is_completed(live_source):
+    source = live_source(underrun="silence", underrun_timeout=0.0)
+    stream = source._stream
+    stream.push(2)
+    read_blocks(source, 1)
+    block = source.read(3 * BLOCK // 2)
+
+    assert block.shape == (3 * BLOCK // 2, 1)
+    assert source.stats()["concealed_frames"] == BLOCK // 2
+    assert source.stats()["underruns"] == 1
+
+
+def test_underrun_block_waits_for_input(live_source):
+    source = live_source(underrun="block")
+    stream = source._stream
+    stream.push(2)
+    before = read_blocks(source, 2)
+
+    # input-ul revine dupa 50 ms: read() asteapta in loc sa completeze sau sa termine
+    timer = threading.Timer(0.05, stream.push, args=(2,))
+    start = time.perf_counter()
+    timer.start()
+    during = read_blocks(source, 2)
+    timer.join()
+
+    assert time.perf_counter() - start >= 0.05
+    assert source.stats()["concealed_frames"] == 0
+    np.testing.assert_allclose(np.concatenate((before, during)), sine(0, 4 * BLOCK), atol=1e-6)
+
+
+def test_underrun_block_ends_when_stream_stops(live_source):
+    source = live_source(underrun="block")
+    stream = source._stream
+    stream.push()
+    stream.stop()
+
+    # blocul inceput e returnat incomplet, apoi bloc gol (sfarsitul sesiunii)
+    assert source.read(2 * BLOCK).shape == (BLOCK, 1)
+    assert source.read(BLOCK).shape == (0, 1)
+    assert source.stats()["underruns"] == 2
+
+
+def test_underrun_block_returns_when_engine_stops(live_source):
+    stopped = threading.Event()
+    source = live_source(underrun="block", should_stop=stopped.is_set)
+    # device activ care nu livreaza nimic
+    source._stream.start()
+
+    result = []
+    reader = threading.Thread(target=lambda: result.append(source.read(BLOCK)))
+    reader.start()
+    time.sleep(0.2)
+    assert reader.is_alive()
+
+    stopped.set()
+    reader.join(timeout=1.0)
+    assert not reader.is_alive()
+    assert result[0].shape == (0, 1)
+
+
+@pytest.mark.parametrize("pause", [False, True])
+def test_engine_stop_ends_stalled_live_input(stub_sounddevice, pause):
+    from audio_engine import AudioEngine
+
+    engine = AudioEngine(blocksize=BLOCK)
+    engine.configure_input("live", samplerate=SAMPLERATE, channels=1, blocksize=BLOCK)
+    engine.configure_output("array", out=np.zeros((SAMPLERATE, 1), dtype=np.float32))
+    engine.build()
+
+    runner = threading.Thread(target=engine.start, daemon=True)
+    runner.start()
+    time.sleep(0.2)
+    assert runner.is_alive()
+
+    if pause:
+        engine.pause()
+    else:
+        engine.stop()
+    runner.join(timeout=1.0)
+    assert not runner.is_alive()
+    # stop()-ul din timpul asteptarii nu e tratat ca sfarsit al input-ului
+    assert engine.is_paused() == pause
+    engine.close_streams()
@@ -0,0 +1,90 @@
+import json
+
+import numpy as np
+import pytest
+
+from audio_engine import AudioEngine
+from audio_engine.analysis.loudness import LoudnessMeter, k_weighting
+
+
+SAMPLERATE = 48000
+
+
+def sine(seconds, dbfs, channels=2, samplerate=SAMPLERATE, freq=997.0):
+    t = np.arange(int(seconds * samplerate)) / samplerate
+    wave = 10 ** (dbfs / 20) * np.sin(2 * np.pi * freq * t)
+    return np.repeat(wave[:, None], channels, axis=1).astype(np.float32)
+
+
+def measure(data, samplerate=SAMPLERATE, blocksize=1024):
+    meter = LoudnessMeter(samplerate)
+    for start in range(0, data.shape[0], blocksize):
+        meter(data[start:start + blocksize])
+    return meter
+
+
+def test_k_weighting_matches_standard_at_48k():
+    # coeficientii din ITU-R BS.1770-4, tabelele 1 si 2
+    shelf, highpass = k_weighting(48000)
+    np.testing.assert_allclose(shelf, [1.53512485958697, -2.69169618940638, 1.19839281085285,
+                                       1.0, -1.69065929318241, 0.73248077421585], atol=1e-10)
+    np.testing.assert_allclose(highpass[3:], [1.0, -1.99004745483398, 0.99007225036621], atol=1e-10)
+
+
+# sinus de 997 Hz la 0 dBFS pe ambele canale: 0 LUFS (-3 LUFS pe un singur canal)
+@pytest.mark.parametrize("samplerate", [44100, 48000, 96000])
+def test_reference_sine_reads_zero_lufs(samplerate):
+    meter = measure(sine(3.0, 0.0, samplerate=samplerate), samplerate)
+    assert meter.integrated() == pytest.approx(0.0, abs=0.05)
+    assert meter.momentary() == pytest.approx(0.0, abs=0.05)
+    assert meter.short_term() == pytest.approx(0.0, abs=0.05)
+    assert measure(sine(3.0, 0.0, channels=1, samplerate=samplerate), samplerate).integrated() \
+        == pytest.approx(-3.01, abs=0.05)
+
+
+def test_relative_gate_ignores_quiet_passages():
+    # EBU Tech 3341, cazul 3 (scurtat): -36 / -23 / -36 dBFS -> -23 LUFS
+    data = np.concatenate((sine(2.0, -36.0), sine(30.0, -23.0), sine(2.0, -36.0)))
+    assert measure(data).integrated() == pytest.approx(-23.0, abs=0.1)
+
+
+def test_absolute_gate_and_short_input():
+    assert measure(np.zeros((SAMPLERATE, 2), dtype=np.float32)).integrated() == float("-inf")
+    # mai putin de o fereastra de 400 ms
+    assert measure(sine(0.3, 0.0)).integrated() == float("-inf")
+
+
+def test_blocksize_does_not_change_measurement():
+    data = np.concatenate((sine(1.0, -30.0), sine(2.0, -12.0)))
+    expected = measure(data).integrated()
+    assert measure(data, blocksize=333).integrated() == pytest.approx(expected, abs=1e-9)
+    assert measure(data, blocksize=48000).integrated() == pytest.approx(expected, abs=1e-9)
+
+
+def render_normalized(data, target, cache_path=None):
+    engine = AudioEngine(blocksize=1024, flush_tails=False)
+    engine.add_effect("eq", bands=[{"type": "highshelf", "freq": 4000.0, "gain_db": 6.0, "q": 0.707}])
+    out = np.zeros_like(data)
+    engine.configure_input("array", data=data, samplerate=SAMPLERATE).configure_output("array", out=out)
+    engine.enable_normalization(target_lufs=target, cache_path=cache_path)
+    engine.build()
+    engine.start()
+    return engine.get_loudness_report(), out
+
+
+def test_normalization_hits_target(tmp_path):
+    rng = np.random.default_rng(0)
+    data = (rng.standard_normal((3 * SAMPLERATE, 2)) * 0.02).astype(np.float32)
+    cache_path = str(tmp_path / "loudness.json")
+
+    report, out = render_normalized(data, -18.0, cache_path)
+    assert not report["cached"]
+    assert report["gain_db"] == pytest.approx(-18.0 - report["measured_lufs"])
+    assert measure(out).integrated() == pytest.approx(-18.0, abs=0.1)
+
+    # a doua oara masuratoarea vine din cache (si din fisier, intre sesiuni)
+    with open(cache_path) as f:
+        assert len(json.load(f)) == 1
+    report, out = render_normalized(data, -24.0, cache_path)
+    assert report["cached"]
+    assert measure(out).integrated() == pytest.approx(-24.0, abs=0.1)
@@ -0,0 +1,97 @@
+import socket
+
+import numpy as np
+
+from audio_engine import AudioEngine
+from audio_engine.consumers.network_consumer import NetworkConsumer
+from audio_engine.sources.network_source import NetworkSource
+from audio_engine.utils.net_frame import FLAG_EOS, encode_frames, pack_header
+
+
+SAMPLERATE = 48000
+BLOCK = 256
+
+
+def blocks(count, channels=2):
+    rng = np.random.default_rng(0)
+    return [(rng.standard_normal((BLOCK, channels)) * 0.3).astype(np.float32) for _ in range(count)]
+
+
+def read_all(source, frames):
+    out = []
+    while True:
+        data = source.read(frames)
+        if data.size == 0:
+            return np.concatenate(out) if out else np.empty((0, source.channels), dtype=np.float32)
+        out.append(data)
+
+
+def test_tcp_round_trip():
+    source = NetworkSource(protocol="tcp", samplerate=SAMPLERATE, channels=2, latency_ms=1)
+    consumer = NetworkConsumer(port=source.port, protocol="tcp", samplerate=SAMPLERATE, channels=2, batch_blocks=3)
+    sent = blocks(10)
+    for block in sent:
+        consumer.write(block)
+    consumer.close()
+
+    received = read_all(source, BLOCK)
+    source.close()
+    np.testing.assert_array_equal(received, np.concatenate(sent))
+    assert source.stats()["invalid"] == 0
+
+
+def test_udp_rejects_truncated_and_lying_packets():
+    source = NetworkSource(protocol="udp", samplerate=SAMPLERATE, channels=2, latency_ms=1)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    address = ("127.0.0.1", source.port)
+    good = blocks(3)
+
+    def packet(data, seq, frames=None):
+        return pack_header(2, 1, SAMPLERATE, data.shape[0] if frames is None else frames, seq) + encode_frames([data])
+
+    sock.sendto(packet(good[0], 0), address)
+    # trunchiat: header-ul anunta BLOCK frame-uri, payload-ul are jumatate
+    sock.sendto(packet(good[1], 1)[:-BLOCK * 4], address)
+    # header fals: mai multe frame-uri decat payload-ul (buffer-ul are inca pachetul 0)
+    sock.sendto(packet(good[1][:BLOCK // 2], 1, frames=BLOCK), address)
+    # prea lung pentru header
+    sock.sendto(packet(good[1], 1) + b"\0" * 8, address)
+    sock.sendto(b"garbage", address)
+    sock.sendto(packet(good[1], 1), address)
+    sock.sendto(packet(good[2], 2), address)
+    sock.sendto(pack_header(2, 0, SAMPLERATE, 0, 3, flags=FLAG_EOS), address)
+    sock.close()
+
+    received = read_all(source, BLOCK)
+    source.close()
+    stats = source.stats()
+    assert stats["invalid"] == 4
+    assert stats["received"] == 3
+    assert stats["lost"] == 0
+    np.testing.assert_array_equal(received, np.concatenate(good))
+
+
+def test_udp_lost_packets_become_silence():
+    source = NetworkSource(protocol="udp", samplerate=SAMPLERATE, channels=2, latency_ms=1)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    address = ("127.0.0.1", source.port)
+    good = blocks(3)
+    for seq in (0, 2):
+        sock.sendto(pack_header(2, 1, SAMPLERATE, BLOCK, seq) + encode_frames([good[seq]]), address)
+    sock.sendto(pack_header(2, 0, SAMPLERATE, 0, 3, flags=FLAG_EOS), address)
+    sock.close()
+
+    received = read_all(source, BLOCK)
+    source.close()
+    assert source.stats()["lost"] == 1
+    np.testing.assert_array_equal(received, np.concatenate((good[0], np.zeros_like(good[1]), good[2])))
+
+
+def test_network_input_listens_on_loopback_by_default():
+    engine = AudioEngine()
+    engine.configure_input("network", samplerate=SAMPLERATE, channels=1)
+    source = engine._create_source()
+    try:
+        assert source._sock.getsockname()[0] == "127.0.0.1"
+    finally:
+        source.close()
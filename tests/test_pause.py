@@ -0,0 +1,165 @@
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio_engine import AudioEngine
+from audio_engine.utils.stream_pool import StreamPool
+
+
+SAMPLERATE = 44100
+BLOCK = 512
+
+
+class StubStream:
+    """
+    Stream sounddevice simulat: numara pornirile / opririle, nu produce audio
+    """
+
+    def __init__(self, callback=None, **params):
+        self.callback = callback
+        self.params = params
+        self.active = False
+        self.closed = False
+        self.starts = 0
+
+    def start(self):
+        assert not self.closed
+        self.active = True
+        self.starts += 1
+
+    def stop(self):
+        self.active = False
+
+    def abort(self):
+        self.active = False
+
+    def close(self):
+        self.closed = True
+
+    def write(self, data):
+        return False
+
+
+@pytest.fixture
+def stub_sounddevice(monkeypatch):
+    stub = types.ModuleType("sounddevice")
+    stub.InputStream = StubStream
+    stub.OutputStream = StubStream
+    monkeypatch.setitem(sys.modules, "sounddevice", stub)
+    monkeypatch.delitem(sys.modules, "audio_engine.sources.live_source", raising=False)
+    monkeypatch.delitem(sys.modules, "audio_engine.consumers.live_consumer", raising=False)
+    return stub
+
+
+def test_pool_reuses_stream_with_same_params(stub_sounddevice):
+    pool = StreamPool()
+    calls = []
+    first = pool.input_stream(lambda *args: calls.append("first"), samplerate=SAMPLERATE, channels=1)
+    pool.release(first)
+    assert not first.active and not first.closed
+
+    second = pool.input_stream(lambda *args: calls.append("second"), samplerate=SAMPLERATE, channels=1)
+    assert second is first and second.active
+    # callback-ul device-ului ajunge la noua sursa
+    second.callback(None, BLOCK, None, None)
+    assert calls == ["second"]
+    assert pool.stats() == {"opened": 1, "reused": 1, "idle": 0}
+
+
+def test_pool_closes_idle_stream_with_other_params(stub_sounddevice):
+    pool = StreamPool()
+    first = pool.output_stream(samplerate=SAMPLERATE, channels=2)
+    pool.release(first)
+    second = pool.output_stream(samplerate=48000, channels=2)
+
+    assert second is not first
+    assert first.closed
+    pool.release(second)
+    pool.close()
+    assert second.closed
+    assert pool.stats() == {"opened": 2, "reused": 0, "idle": 0}
+
+
+def run_briefly(engine, action):
+    runner = threading.Thread(target=engine.start, daemon=True)
+    runner.start()
+    time.sleep(0.1)
+    action()
+    runner.join(timeout=2.0)
+    assert not runner.is_alive()
+
+
+def live_engine():
+    engine = AudioEngine(blocksize=BLOCK)
+    engine.configure_input("live", samplerate=SAMPLERATE, channels=1, blocksize=BLOCK,
+                           underrun="silence", underrun_timeout=0.01)
+    engine.configure_output("live", samplerate=SAMPLERATE, channels=1, blocksize=BLOCK)
+    return engine
+
+
+def test_pause_keeps_live_streams_open(stub_sounddevice):
+    engine = live_engine()
+    engine.build()
+    source_stream = engine._source._stream
+
+    run_briefly(engine, engine.pause)
+    assert engine.is_paused()
+    assert not source_stream.active and not source_stream.closed
+
+    run_briefly(engine, engine.stop)
+    assert not engine.is_paused()
+    assert source_stream.starts == 2
+
+    # dupa stop stream-urile raman in pool: build-ul urmator nu redeschide device-urile
+    engine.build()
+    assert engine._source._stream is source_stream
+    assert engine._stream_pool.stats()["reused"] == 2
+    run_briefly(engine, engine.stop)
+    engine.close_streams()
+    assert source_stream.closed
+
+
+def render(path, out_path, pause_after=None):
+    engine = AudioEngine(blocksize=BLOCK)
+    engine.add_effect("echo").add_effect("reverb")
+    engine.configure_input("file", path=path).configure_output("file", path=out_path)
+    blocks = []
+
+    def on_chunk(buf):
+        blocks.append(buf.shape[0])
+        if len(blocks) == pause_after:
+            engine.pause()
+
+    engine.start(on_chunk=on_chunk)
+    if pause_after is not None:
+        assert engine.is_paused()
+        engine.resume(on_chunk=on_chunk)
+        assert not engine.is_paused()
+    return sf.read(out_path, dtype="float32")[0]
+
+
+def test_resume_continues_offline_render(tmp_path):
+    path = str(tmp_path / "in.wav")
+    rng = np.random.default_rng(0)
+    sf.write(path, (rng.standard_normal((SAMPLERATE // 2, 2)) * 0.3).astype(np.float32), SAMPLERATE, subtype="FLOAT")
+
+    reference = render(path, str(tmp_path / "reference.wav"))
+    resumed = render(path, str(tmp_path / "out.wav"), pause_after=10)
+    np.testing.assert_array_equal(resumed, reference)
+
+
+def test_reconfigure_discards_paused_session(tmp_path):
+    path = str(tmp_path / "in.wav")
+    sf.write(path, np.zeros((SAMPLERATE, 1), dtype=np.float32), SAMPLERATE)
+    engine = AudioEngine(blocksize=BLOCK)
+    engine.configure_input("file", path=path).configure_output("file", path=str(tmp_path / "out.wav"))
+    engine.start(on_chunk=lambda buf: engine.pause())
+    assert engine.is_paused()
+
+    engine.configure_output("file", path=str(tmp_path / "other.wav"))
+    assert not engine.is_paused()
@@ -0,0 +1,124 @@
+import multiprocessing
+import os
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio_engine import AudioEngine, ProcessEngine
+from audio_engine.utils.shared_ring_buffer import SharedRingBuffer
+
+
+SAMPLERATE = 44100
+BLOCK = 512
+
+
+def noise(frames, channels=2, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal((frames, channels)) * 0.3).astype(np.float32)
+
+
+@pytest.fixture
+def ring():
+    condition = multiprocessing.get_context("spawn").Condition()
+    owner = SharedRingBuffer(4 * BLOCK, 2, condition=condition)
+    yield owner, condition
+    owner.close(unlink=True)
+
+
+def test_attached_ring_shares_data_and_positions(ring):
+    owner, condition = ring
+    attached = SharedRingBuffer(**owner.spec(), condition=condition)
+    data = noise(6 * BLOCK)
+
+    attached.write(data[:3 * BLOCK])
+    np.testing.assert_array_equal(owner.read(BLOCK, block=False), data[:BLOCK])
+    # drop_oldest peste capacitate: pozitiile si contorul sunt in header-ul comun
+    attached.write(data[3 * BLOCK:])
+    assert owner.available() == 4 * BLOCK
+    assert owner.dropped == attached.dropped == BLOCK
+    np.testing.assert_array_equal(owner.read(4 * BLOCK, block=False), data[2 * BLOCK:])
+    attached.close()
+
+
+def test_try_write_skips_when_reader_holds_lock(ring):
+    owner, condition = ring
+    held, release = threading.Event(), threading.Event()
+
+    def reader():
+        with condition:
+            held.set()
+            release.wait()
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    held.wait()
+    assert not owner.try_write(noise(BLOCK))
+    release.set()
+    thread.join()
+
+    assert owner.skipped == 1
+    assert owner.try_write(noise(BLOCK))
+    assert owner.available() == BLOCK
+
+
+def test_fixed_capacity():
+    with pytest.raises(ValueError):
+        SharedRingBuffer(BLOCK, 1, overflow="grow")
+
+
+def writer_process(spec, condition, data):
+    ring = SharedRingBuffer(**spec, condition=condition)
+    for start in range(0, data.shape[0], BLOCK):
+        ring.write(data[start:start + BLOCK])
+    ring.close()
+
+
+def test_ring_across_processes(ring):
+    owner, condition = ring
+    data = noise(3 * BLOCK)
+    ctx = multiprocessing.get_context("spawn")
+    process = ctx.Process(target=writer_process, args=(owner.spec(), condition, data))
+    process.start()
+
+    received = [owner.read(BLOCK, timeout=10.0) for _ in range(3)]
+    process.join(10.0)
+    assert process.exitcode == 0
+    np.testing.assert_array_equal(np.concatenate(received), data)
+
+
+def make_engine(engine_class, path, out_path):
+    engine = engine_class(blocksize=BLOCK)
+    engine.add_effect("eq", bands=[{"type": "peak", "freq": 800.0, "gain_db": 4.0, "q": 1.0}])
+    engine.add_effect("echo")
+    engine.configure_input("file", path=path).configure_output("file", path=out_path)
+    return engine
+
+
+def test_process_engine_matches_in_process_render(tmp_path):
+    path = str(tmp_path / "in.wav")
+    sf.write(path, noise(SAMPLERATE // 2), SAMPLERATE, subtype="FLOAT")
+
+    reference = str(tmp_path / "reference.wav")
+    make_engine(AudioEngine, path, reference).start()
+
+    out_path = str(tmp_path / "out.wav")
+    engine = make_engine(ProcessEngine, path, out_path)
+    blocks = []
+    engine.start(on_chunk=lambda buf: blocks.append(buf.copy()))
+
+    # blocurile procesate ajung inapoi in procesul curent prin ring
+    assert engine.get_process_stats()["pid"] != os.getpid()
+    expected = sf.read(reference, dtype="float32")[0]
+    np.testing.assert_array_equal(sf.read(out_path, dtype="float32")[0], expected)
+    # fisierul e PCM_16, blocurile sunt float32
+    np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1.0 / 32768)
+
+
+def test_array_output_is_rejected():
+    engine = ProcessEngine()
+    engine.configure_input("array", data=noise(BLOCK), samplerate=SAMPLERATE)
+    engine.configure_output("array", out=np.zeros((BLOCK, 2), dtype=np.float32))
+    with pytest.raises(ValueError):
+        engine.build()
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from audio_engine.utils.ring_buffer import INT16_SCALE, RingBuffer
+
+
+CHANNELS = 2
+CAPACITY = 1000
+BLOCK = 384
+
+# eroarea maxima a stocarii compacte pe [-1, 1]
+TOLERANCE = {"float32": 0.0, "float16": 2.0 ** -11, "int16": 0.5 / INT16_SCALE}
+
+
+def noise(frames, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-1.0, 1.0, (frames, CHANNELS)).astype(np.float32)
+
+
+@pytest.mark.parametrize("dtype", TOLERANCE)
+def test_round_trip_with_wrap_around(dtype):
+    ring = RingBuffer(CAPACITY, CHANNELS, dtype=dtype)
+    blocks = [noise(BLOCK, seed) for seed in range(6)]
+    out = []
+    # pozitiile de scriere / citire trec de mai multe ori peste capatul buffer-ului
+    for block in blocks:
+        ring.write(block)
+        out.append(ring.read(BLOCK, block=False))
+
+    result = np.concatenate(out)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, np.concatenate(blocks), rtol=0, atol=TOLERANCE[dtype])
+
+
+@pytest.mark.parametrize("dtype", ["float16", "int16"])
+def test_compact_storage_halves_memory(dtype):
+    ring = RingBuffer(CAPACITY, CHANNELS, dtype=dtype)
+    assert ring.dtype == np.dtype(dtype)
+    assert ring.nbytes == RingBuffer(CAPACITY, CHANNELS).nbytes // 2
+
+
+def test_int16_clips_out_of_range():
+    ring = RingBuffer(CAPACITY, 1, dtype="int16")
+    ring.write(np.array([[2.0], [-3.0], [0.5]], dtype=np.float32))
+    np.testing.assert_allclose(ring.read(3, block=False)[:, 0], [1.0, -1.0, 0.5], atol=TOLERANCE["int16"])
+
+
+@pytest.mark.parametrize("dtype", ["float16", "int16"])
+def test_read_into_caller_buffer(dtype):
+    ring = RingBuffer(CAPACITY, CHANNELS, dtype=dtype)
+    data = noise(BLOCK)
+    ring.write(data)
+
+    out = np.full((2 * BLOCK, CHANNELS), 7.0, dtype=np.float32)
+    result = ring.read(2 * BLOCK, block=False, out=out)
+    assert result.base is out
+    np.testing.assert_allclose(out[:BLOCK], data, atol=TOLERANCE[dtype])
+    assert np.all(out[BLOCK:] == 7.0)
+
+
+def test_grow_keeps_compact_data():
+    ring = RingBuffer(256, CHANNELS, dtype="int16", overflow="grow", max_capacity_frames=4096)
+    data = noise(3 * BLOCK)
+    for start in range(0, data.shape[0], 128):
+        ring.write(data[start:start + 128])
+
+    assert ring.capacity >= data.shape[0]
+    assert ring.dtype == np.int16
+    assert ring.dropped == 0
+    np.testing.assert_allclose(ring.read(data.shape[0], block=False), data, atol=TOLERANCE["int16"])
+
+
+def test_unsupported_dtype_is_rejected():
+    with pytest.raises(ValueError):
+        RingBuffer(CAPACITY, CHANNELS, dtype="int8")
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio_engine import AudioEngine
+
+
+SAMPLERATE = 44100
+# ceiling-ul implicit al limiter-ului de iesire
+CEILING = 10.0 ** (-0.1 / 20.0)
+
+
+def make_input(channels, frames=8000):
+    # canale corelate la 0.9: orice downmix le aduna peste 1.0
+    t = np.arange(frames) / SAMPLERATE
+    data = 0.9 * np.sin(2 * np.pi * 220.0 * t).astype(np.float32)[:, None]
+    return np.repeat(data, channels, axis=1)
+
+
+@pytest.mark.parametrize("channels, outputs, routing", [
+    (6, 2, {"preset": "5.1_to_stereo"}),
+    (2, 1, {"matrix": [[1.0, 1.0]]}),
+    (6, 1, {"preset": "5.1_to_mono"}),
+])
+def test_downmix_stays_under_ceiling(channels, outputs, routing):
+    engine = AudioEngine(blocksize=256).set_routing(**routing)
+    out = engine.process_array(make_input(channels), SAMPLERATE)
+
+    assert out.shape == (8000, outputs)
+    assert np.abs(out).max() <= CEILING + 1e-6
+
+
+def test_downmix_with_normalization_stays_under_ceiling(tmp_path):
+    path = str(tmp_path / "in.wav")
+    # masuratoarea de loudness are nevoie de cel putin un bloc de 400 ms
+    sf.write(path, make_input(6, SAMPLERATE) * 0.1, SAMPLERATE, subtype="FLOAT")
+
+    engine = AudioEngine(blocksize=256).set_routing(preset="5.1_to_stereo")
+    out = np.zeros((SAMPLERATE, 2), dtype=np.float32)
+    engine.configure_input("file", path=path).configure_output("array", out=out)
+    engine.enable_normalization(target_lufs=0.0)
+    engine.build()
+    engine.start()
+
+    # dupa corectie varful mixului ar fi ~1.1
+    assert engine.get_loudness_report()["gain_db"] > 12.0
+    assert np.abs(out).max() <= CEILING + 1e-6
+
+
+def test_parallel_downmix_matches_serial(tmp_path):
+    path = str(tmp_path / "in.wav")
+    sf.write(path, make_input(6, 20000), SAMPLERATE, subtype="FLOAT")
+
+    outputs = []
+    for parallel in (False, True):
+        out_path = str(tmp_path / f"out_{parallel}.wav")
+        engine = AudioEngine(blocksize=256).set_routing(preset="5.1_to_stereo")
+        engine.add_effect("eq")
+        engine.configure_input("file", path=path).configure_output("file", path=out_path)
+        if parallel:
+            assert engine.render_parallel(workers=2, segment_seconds=0.1)["parallel"]
+        else:
+            engine.start()
+        outputs.append(sf.read(out_path, dtype="float32")[0])
+
+    # fisierul de output e PCM_16
+    assert np.abs(outputs[1]).max() <= CEILING + 1.0 / 32768
+    np.testing.assert_array_equal(outputs[0], outputs[1])
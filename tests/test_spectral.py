@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from audio_engine.effects.spectral import OVERLAPS, SpectralEffect, stft_windows
+from audio_engine.effects.spectral_gate import SpectralGateEffect
+
+
+SAMPLERATE = 48000
+FRAMES = 12000
+
+
+def noise(frames=FRAMES, channels=2, scale=0.3):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((frames, channels)) * scale).astype(np.float32)
+
+
+def sine(freq, amplitude, frames=FRAMES):
+    t = np.arange(frames) / SAMPLERATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)[:, None]
+
+
+def run(effect, data, blocksize):
+    return np.concatenate([effect.apply(data[i:i + blocksize], SAMPLERATE)
+                           for i in range(0, data.shape[0], blocksize)])
+
+
+@pytest.mark.parametrize("overlap", OVERLAPS)
+def test_windows_sum_to_one(overlap):
+    analysis, synthesis = stft_windows(512, overlap)
+    hop = 512 // overlap
+    total = (analysis * synthesis).reshape(overlap, hop).sum(axis=0)
+    np.testing.assert_allclose(total, 1.0, atol=1e-6)
+
+
+# spectrul nemodificat: iesirea e input-ul intarziat cu latency_frames, la orice blocksize
+@pytest.mark.parametrize("overlap", OVERLAPS)
+@pytest.mark.parametrize("blocksize", [64, 333, 1024, 4096])
+def test_identity_reconstructs_delayed_input(overlap, blocksize):
+    effect = SpectralEffect(fft_size=512, overlap=overlap)
+    data = noise()
+    out = run(effect, data, blocksize)
+
+    latency = effect.latency_frames(SAMPLERATE)
+    assert latency == 511
+    assert out.shape == data.shape
+    np.testing.assert_allclose(out[latency:], data[:-latency], atol=1e-5)
+    np.testing.assert_allclose(out[:latency - effect.hop], 0.0, atol=1e-6)
+
+
+def test_planar_matches_interleaved():
+    data = noise()
+    interleaved = run(SpectralGateEffect(), data, 512)
+
+    effect = SpectralGateEffect()
+    planar = np.concatenate([effect.apply_planar(np.ascontiguousarray(data[i:i + 512].T), SAMPLERATE).T
+                             for i in range(0, FRAMES, 512)])
+    np.testing.assert_allclose(planar, interleaved, atol=1e-6)
+
+
+def rms(signal):
+    return float(np.sqrt(np.mean(signal.astype(np.float64) ** 2)))
+
+
+def test_gate_keeps_signal_above_threshold():
+    # 1 kHz pe centrul unui bin (fft 1024 la 48 kHz: 46.875 Hz/bin)
+    data = sine(46.875 * 21, 0.5)
+    effect = SpectralGateEffect(threshold_db=-80.0, reduction_db=-30.0)
+    out = run(effect, data, 512)
+
+    # doar scurgerea ferestrei (sub -80 dB) e atenuata
+    latency = effect.latency_frames(SAMPLERATE)
+    np.testing.assert_allclose(out[2 * latency:], data[latency:-latency], atol=1e-4)
+
+
+def test_gate_attenuates_noise_below_threshold():
+    # zgomot alb la -80 dBFS pe bin, sub pragul de -60 dB: coborat cu reduction_db
+    data = noise(channels=1, scale=1e-3)
+    effect = SpectralGateEffect(threshold_db=-60.0, reduction_db=-30.0, release_ms=10.0)
+    out = run(effect, data, 512)
+
+    steady = slice(FRAMES // 2, None)
+    assert rms(out[steady]) / rms(data[steady]) == pytest.approx(10 ** (-30 / 20), rel=0.1)
@@ -0,0 +1,133 @@
+import os
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio_engine.analysis.waveform import BASE_FRAMES, MIN_LEVEL_SIZE, WaveformPeaks, sidecar_path, waveform_peaks
+
+
+SAMPLERATE = 44100
+# ultimul grup de BASE_FRAMES e incomplet
+FRAMES = 300 * BASE_FRAMES + 77
+# float16: ~3 cifre semnificative; PCM_16: pasul de cuantizare
+TOLERANCE = 1e-3
+
+
+def write_input(path, subtype="FLOAT", seed=0):
+    rng = np.random.default_rng(seed)
+    data = (rng.standard_normal((FRAMES, 2)) * 0.2).astype(np.float32)
+    # un varf izolat, de gasit la orice zoom
+    data[12345, 1] = 0.95
+    sf.write(path, data, SAMPLERATE, subtype=subtype)
+    return sf.read(path, dtype="float32")[0]
+
+
+def group_extremes(data, size):
+    count = -(-data.shape[0] // size)
+    mins = np.array([data[i * size:(i + 1) * size].min(axis=0) for i in range(count)])
+    maxs = np.array([data[i * size:(i + 1) * size].max(axis=0) for i in range(count)])
+    return mins, maxs
+
+
+@pytest.mark.parametrize("subtype", ["FLOAT", "PCM_16"])
+def test_pyramid_levels_match_direct_min_max(tmp_path, subtype):
+    path = str(tmp_path / "in.wav")
+    data = write_input(path, subtype)
+    # blocuri de citire mici: grupurile trec peste granitele dintre citiri
+    peaks = WaveformPeaks.from_file(path, read_frames=10 * BASE_FRAMES)
+
+    assert peaks.frames == FRAMES and peaks.channels == 2
+    assert peaks.mins[-1].shape[0] <= MIN_LEVEL_SIZE < peaks.mins[-2].shape[0]
+    for level, (mins, maxs) in enumerate(zip(peaks.mins, peaks.maxs)):
+        expected_min, expected_max = group_extremes(data, BASE_FRAMES * peaks.factor ** level)
+        np.testing.assert_allclose(mins, expected_min, atol=TOLERANCE)
+        np.testing.assert_allclose(maxs, expected_max, atol=TOLERANCE)
+
+
+def test_view_keeps_extremes_at_every_zoom(tmp_path):
+    path = str(tmp_path / "in.wav")
+    data = write_input(path)
+    peaks = WaveformPeaks.from_file(path)
+
+    mins, maxs = peaks.view(0, FRAMES, 200)
+    assert mins.shape == maxs.shape == (200, 2)
+    np.testing.assert_allclose(maxs.max(axis=0), data.max(axis=0), atol=TOLERANCE)
+    np.testing.assert_allclose(mins.min(axis=0), data.min(axis=0), atol=TOLERANCE)
+
+    # zoom pe varf (frame-ul 12345 ~ coloana 3.45); coloanele sunt aliniate la grupurile nivelului
+    mins, maxs = peaks.view(12000, 13000, 10)
+    assert maxs[:, 1].max() == pytest.approx(0.95, abs=TOLERANCE)
+    assert int(np.argmax(maxs[:, 1])) in (3, 4)
+
+    # zoom peste rezolutia nivelului 0: tot valori finite, cate una per coloana
+    mins, maxs = peaks.view(0, 100, 50)
+    assert mins.shape == (50, 2) and np.all(mins <= maxs)
+
+
+def test_progress_and_cancel(tmp_path):
+    path = str(tmp_path / "in.wav")
+    write_input(path)
+    fractions = []
+    WaveformPeaks.from_file(path, read_frames=50 * BASE_FRAMES, progress=fractions.append)
+    assert fractions == sorted(fractions) and fractions[-1] == 1.0
+
+    assert WaveformPeaks.from_file(path, should_stop=lambda: True) is None
+
+
+def count_computations(monkeypatch):
+    calls = []
+    from_file = WaveformPeaks.from_file.__func__
+
+    def spy(cls, *args, **kwargs):
+        calls.append(args[0])
+        return from_file(cls, *args, **kwargs)
+
+    monkeypatch.setattr(WaveformPeaks, "from_file", classmethod(spy))
+    return calls
+
+
+def test_sidecar_is_reused_until_file_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "in.wav")
+    write_input(path)
+    calls = count_computations(monkeypatch)
+
+    first = waveform_peaks(path)
+    assert os.path.exists(sidecar_path(path))
+    second = waveform_peaks(path)
+    assert len(calls) == 1
+    for a, b in zip(first.maxs, second.maxs):
+        np.testing.assert_array_equal(a, b)
+
+    # acelasi fisier rescris cu alt continut (aceeasi dimensiune): mtime-ul difera
+    data = write_input(path, seed=1)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    third = waveform_peaks(path)
+    assert len(calls) == 2
+    np.testing.assert_allclose(third.maxs[0], group_extremes(data, BASE_FRAMES)[1], atol=TOLERANCE)
+
+
+def test_sidecar_in_cache_dir(tmp_path, monkeypatch):
+    path = str(tmp_path / "in.wav")
+    write_input(path)
+    cache_dir = str(tmp_path / "cache")
+    calls = count_computations(monkeypatch)
+
+    waveform_peaks(path, cache_dir=cache_dir)
+    waveform_peaks(path, cache_dir=cache_dir)
+    assert len(calls) == 1
+    assert os.listdir(cache_dir) == [os.path.basename(sidecar_path(path, cache_dir))]
+    assert not os.path.exists(sidecar_path(path))
+
+
+def test_corrupt_sidecar_is_recomputed(tmp_path, monkeypatch):
+    path = str(tmp_path / "in.wav")
+    write_input(path)
+    with open(sidecar_path(path), "wb") as f:
+        f.write(b"not a npz file")
+    calls = count_computations(monkeypatch)
+
+    assert waveform_peaks(path).frames == FRAMES
+    assert len(calls) == 1
+    assert WaveformPeaks.load(sidecar_path(path), path) is not None